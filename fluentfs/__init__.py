@@ -1,15 +1,20 @@
 from fluentfs.common import FunctionalIterator, Table, chomp, compile_regex, is_empty
 from fluentfs.exceptions import FluentFsException
 from fluentfs.filelike import (
+    ContentCache,
     Dir,
+    DirWalk,
     File,
     FileIterator,
     FileLike,
+    FileLikeContext,
     SymLink,
     TextFile,
     TextFileIterator,
+    TextStats,
 )
 from fluentfs.filesize import FileSize, FileSizeUnit
+from fluentfs.index import DirIndex, LiveIndex
 from fluentfs.paths import (
     FileLikeKind,
     base_name,
@@ -27,6 +32,9 @@ from fluentfs.paths import (
     path_is_relative,
     relative_path,
 )
+from fluentfs.search import GrepMatch, MultiMatcher, PatternMatch
+from fluentfs.walk import ParallelWalker, Walker
+from fluentfs.watch import ChangeEvent, ChangeKind, Watcher
 
 __all__ = [
     # common
@@ -38,16 +46,23 @@ __all__ = [
     # exceptions
     "FluentFsException",
     # filelike
+    "ContentCache",
     "Dir",
+    "DirWalk",
     "File",
     "FileIterator",
     "FileLike",
+    "FileLikeContext",
     "TextFile",
     "TextFileIterator",
+    "TextStats",
     "SymLink",
     # filesize
     "FileSize",
     "FileSizeUnit",
+    # index
+    "DirIndex",
+    "LiveIndex",
     # paths
     "dir_exists",
     "expand_path",
@@ -64,4 +79,15 @@ __all__ = [
     "matches_regex",
     "relative_path",
     "current_path",
+    # search
+    "GrepMatch",
+    "MultiMatcher",
+    "PatternMatch",
+    # walk
+    "ParallelWalker",
+    "Walker",
+    # watch
+    "ChangeEvent",
+    "ChangeKind",
+    "Watcher",
 ]
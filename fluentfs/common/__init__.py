@@ -1,11 +1,47 @@
+from fluentfs.common.aio import deferred, iterate_async, map_async
+from fluentfs.common.byte_ranges import (
+    ByteRange,
+    open_range,
+    open_text_range,
+    split_lines,
+)
 from fluentfs.common.functional import FunctionalIterator
+from fluentfs.common.newlines import (
+    LineCounter,
+    LineDecodeError,
+    count_lines,
+    count_newlines,
+    decode_lines,
+    is_ascii_compatible,
+)
+from fluentfs.common.parallel import EXECUTOR_KINDS, parallel_map
 from fluentfs.common.regex import compile_regex
 from fluentfs.common.s import chomp, is_empty
 from fluentfs.common.table import Table
+from fluentfs.common.text_counts import count_chars, count_words
 
 __all__ = [
+    # aio
+    "deferred",
+    "iterate_async",
+    "map_async",
+    # byte_ranges
+    "ByteRange",
+    "open_range",
+    "open_text_range",
+    "split_lines",
     # functional
     "FunctionalIterator",
+    # newlines
+    "LineCounter",
+    "LineDecodeError",
+    "count_lines",
+    "count_newlines",
+    "decode_lines",
+    "is_ascii_compatible",
+    # parallel
+    "EXECUTOR_KINDS",
+    "parallel_map",
     # regex
     "compile_regex",
     # s
@@ -13,4 +49,7 @@ __all__ = [
     "is_empty",
     # table
     "Table",
+    # text_counts
+    "count_chars",
+    "count_words",
 ]
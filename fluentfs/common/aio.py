@@ -0,0 +1,153 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+class _Failure:
+    """
+    Wraps an exception raised while producing a batch, so that it can be passed
+    through the queue and re-raised in the consuming coroutine.
+    """
+
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+def deferred(fun: Callable[[], Iterable[T]]) -> Iterator[T]:
+    """
+    An iterator over the iterable returned by fun, which is only called once the first
+    item is requested.
+
+    This is useful to make sure that the blocking work done by fun happens on the
+    executor of iterate_async and not in the event loop.
+
+    :param fun: The function returning the iterable.
+    :return: The iterator.
+    """
+    yield from fun()
+
+
+def _next_batch(it: Iterator[T], batch_size: int) -> Tuple[List[T], Optional[_Failure]]:
+    # Items produced before an exception must still reach the consumer
+    batch: List[T] = []
+    try:
+        batch.extend(islice(it, batch_size))
+    except Exception as e:
+        return batch, _Failure(e)
+    return batch, None
+
+
+async def _produce(
+    it: Iterator[T],
+    queue: "asyncio.Queue[Union[List[T], _Failure]]",
+    batch_size: int,
+    executor: Optional[Executor],
+) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch, failure = await loop.run_in_executor(
+            executor, _next_batch, it, batch_size
+        )
+
+        # Once the queue is full, we stop pulling from the iterator until the
+        # consumer catches up (i.e. there is backpressure). An empty batch marks the
+        # end of the iterator.
+        if len(batch) != 0 or failure is None:
+            await queue.put(batch)
+        if failure is not None:
+            await queue.put(failure)
+        if len(batch) == 0 or failure is not None:
+            return
+
+
+async def iterate_async(
+    iterable: Iterable[T],
+    batch_size: int = 64,
+    max_batches: int = 4,
+    executor: Optional[Executor] = None,
+) -> AsyncGenerator[T, None]:
+    """
+    Iterate over a blocking iterable without blocking the event loop.
+
+    The items are pulled from the iterable in batches on an executor. At most
+    max_batches batches are buffered, after which no more items are pulled until the
+    consumer catches up. Exceptions raised by the iterable are re-raised in the
+    consuming coroutine.
+
+    :param iterable: The blocking iterable.
+    :param batch_size: The number of items pulled per executor call.
+    :param max_batches: The maximum number of batches that are buffered.
+    :param executor: The executor to run the iterable on. By default, this is the
+        default executor of the event loop.
+    :return: An asynchronous iterator over the items of the iterable.
+    """
+    it = iter(iterable)
+    queue: "asyncio.Queue[Union[List[T], _Failure]]" = asyncio.Queue(max_batches)
+    producer = asyncio.ensure_future(_produce(it, queue, batch_size, executor))
+    try:
+        while True:
+            batch = await queue.get()
+            if isinstance(batch, _Failure):
+                raise batch.exception
+            if len(batch) == 0:
+                return
+            for item in batch:
+                yield item
+    finally:
+        producer.cancel()
+
+
+async def map_async(
+    iterable: Iterable[T],
+    fun: Callable[[T], S],
+    concurrency: int = 8,
+    executor: Optional[Executor] = None,
+    batch_size: int = 64,
+) -> AsyncGenerator[S, None]:
+    """
+    Map a blocking function over a blocking iterable without blocking the event loop.
+
+    The function is applied on an executor to at most concurrency items at the same
+    time. The results are yielded in the order of the items.
+
+    :param iterable: The blocking iterable.
+    :param fun: The blocking function.
+    :param concurrency: The maximum number of function calls in flight.
+    :param executor: The executor to run the iterable and the function on. By
+        default, this is the default executor of the event loop.
+    :param batch_size: The number of items pulled from the iterable per executor call.
+    :return: An asynchronous iterator over the results.
+    """
+    loop = asyncio.get_running_loop()
+    items = iterate_async(iterable, batch_size, executor=executor)
+    pending: "Deque[asyncio.Future[Any]]" = deque()
+    try:
+        async for item in items:
+            pending.append(loop.run_in_executor(executor, fun, item))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while len(pending) != 0:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+        await items.aclose()
@@ -0,0 +1,107 @@
+import io
+from typing import IO, Any, BinaryIO, List, NamedTuple, Optional
+
+# The number of bytes read at once when looking for the beginning of a line
+_BLOCK_SIZE = 1 << 16
+
+
+class ByteRange(NamedTuple):
+    """
+    The bytes of a file from offset start (inclusive) to offset end (exclusive).
+    """
+
+    start: int
+    end: int
+
+
+def _line_start(file: BinaryIO, offset: int) -> Optional[int]:
+    # Find the first "\n" at or after the offset
+    file.seek(offset)
+    while True:
+        block = file.read(_BLOCK_SIZE)
+        if len(block) == 0:
+            return None
+        index = block.find(b"\n")
+        if index >= 0:
+            return offset + index + 1
+        offset += len(block)
+
+
+def split_lines(path: str, size: int, range_size: int) -> List[ByteRange]:
+    """
+    Split a file into byte ranges of complete lines.
+
+    Every range except the first starts right after a "\\n" byte, so every range
+    consists of complete lines. In an ASCII-compatible encoding (like UTF-8), a
+    "\\n" byte is always a complete character, so every range can be decoded on its
+    own, and the results of the ranges can simply be added up.
+
+    :param path: The path of the file.
+    :param size: The size of the file.
+    :param range_size: The approximate size of a range. A range is bigger if a line
+        crosses its nominal end.
+    :return: The ranges (at least one, even for an empty file).
+    """
+    if size <= range_size:
+        return [ByteRange(0, size)]
+
+    starts = [0]
+    with open(path, "rb") as file:
+        while starts[-1] + range_size < size:
+            # A "\n" right before the nominal start ends the previous range as well
+            start = _line_start(file, starts[-1] + range_size - 1)
+            if start is None or start >= size:
+                break
+            starts.append(start)
+    ends = starts[1:] + [size]
+    return [ByteRange(start, end) for start, end in zip(starts, ends)]
+
+
+class _RangeReader(io.RawIOBase):
+    def __init__(self, path: str, byte_range: ByteRange) -> None:
+        super().__init__()
+        self.file = open(path, "rb", buffering=0)
+        self.file.seek(byte_range.start)
+        self.remaining = byte_range.end - byte_range.start
+
+    @property
+    def name(self) -> str:
+        return str(self.file.name)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = min(len(buffer), self.remaining)
+        if size == 0:
+            return 0
+        read_count = self.file.readinto(memoryview(buffer)[:size])
+        self.remaining -= read_count
+        return read_count
+
+    def close(self) -> None:
+        self.file.close()
+        super().close()
+
+
+def open_range(path: str, byte_range: ByteRange) -> BinaryIO:
+    """
+    Open a byte range of a file in binary mode.
+
+    :param path: The path of the file.
+    :param byte_range: The range.
+    :return: The binary stream of the range.
+    """
+    return io.BufferedReader(_RangeReader(path, byte_range))
+
+
+def open_text_range(path: str, encoding: str, byte_range: ByteRange) -> IO[str]:
+    """
+    Open a byte range of a file in text mode.
+
+    :param path: The path of the file.
+    :param encoding: The encoding of the file.
+    :param byte_range: The range, which must start at the beginning of a character.
+    :return: The text stream of the range.
+    """
+    return io.TextIOWrapper(open_range(path, byte_range), encoding=encoding)
@@ -1,8 +1,21 @@
 import heapq
 from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
 from functools import reduce
-from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from fluentfs.common.aio import iterate_async, map_async
+from fluentfs.common.parallel import parallel_map
 from fluentfs.common.table import Table
 
 T = TypeVar("T")
@@ -40,6 +53,36 @@ class FunctionalIterator(Generic[T]):
     ) -> TFunctionalIterator:
         return type(self)(map(fun, self))
 
+    def par_map(
+        self,
+        fun: Callable[[T], S],
+        workers: int = 4,
+        executor: Union[str, Executor] = "thread",
+        ordered: bool = True,
+        chunksize: int = 1,
+    ) -> "FunctionalIterator[S]":
+        """
+        Map a function over this iterator on a pool of workers.
+
+        Use a process pool for CPU-bound functions (like decoding files), since
+        threads only help if the function waits for I/O. File-like objects are cheap
+        to send to worker processes (only their path, stat result and settings are
+        pickled).
+
+        :param fun: The function. For a process pool, the function must be picklable,
+            i.e. it must be defined at the top level of a module (lambdas do not
+            work, but e.g. operator.attrgetter("line_count") does).
+        :param workers: The number of workers.
+        :param executor: "thread" for a thread pool, "process" for a process pool or
+            an existing executor.
+        :param ordered: Whether to keep the order of the items.
+        :param chunksize: The number of items sent to a worker at once.
+        :return: A functional iterator containing the results.
+        """
+        return FunctionalIterator(
+            parallel_map(self, fun, workers, executor, ordered, chunksize)
+        )
+
     def reduce(self, fun: Callable[[S, T], S], start: S) -> S:
         return reduce(fun, self, start)
 
@@ -84,3 +127,45 @@ class FunctionalIterator(Generic[T]):
         rows = self.map_self(row_fun)
         table.add_rows(rows)  # type: ignore
         return table
+
+    def aiter(
+        self,
+        batch_size: int = 64,
+        max_batches: int = 4,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over this iterator from a coroutine without blocking the event loop.
+
+        The items are pulled in batches on an executor, so any blocking work done by
+        this iterator (e.g. walking a directory and filtering files) does not stall
+        other coroutines. At most max_batches batches are buffered.
+
+        :param batch_size: The number of items pulled per executor call.
+        :param max_batches: The maximum number of batches that are buffered.
+        :param executor: The executor to use. By default, this is the default
+            executor of the event loop.
+        :return: An asynchronous iterator.
+        """
+        return iterate_async(self, batch_size, max_batches, executor)
+
+    def amap(
+        self,
+        fun: Callable[[T], S],
+        concurrency: int = 8,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[S]:
+        """
+        Map a blocking function over this iterator from a coroutine without blocking
+        the event loop.
+
+        The function is called on an executor for at most concurrency items at the
+        same time. The results are yielded in order.
+
+        :param fun: The blocking function, e.g. lambda file: file.line_count.
+        :param concurrency: The maximum number of function calls in flight.
+        :param executor: The executor to use. By default, this is the default
+            executor of the event loop.
+        :return: An asynchronous iterator over the results.
+        """
+        return map_async(self, fun, concurrency, executor)
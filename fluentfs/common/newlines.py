@@ -0,0 +1,263 @@
+import codecs
+import io
+from typing import BinaryIO, Iterator, List, Optional
+
+from fluentfs.exceptions.exceptions import FluentFsException
+
+# The number of bytes read at once when counting lines
+CHUNK_SIZE = 1 << 20
+
+# The number of bytes decoded at once when reading lines
+LINE_CHUNK_SIZE = 1 << 16
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """
+    Check whether an encoding encodes ASCII characters (and only them) as single
+    ASCII bytes, i.e. whether the lines of a text in this encoding can be counted
+    from its bytes.
+
+    Encodings removing a byte order mark (like utf-8-sig) are not considered
+    compatible, since the mark would count as a line of its own.
+
+    :param encoding: The name of the encoding.
+    :return: True, if the encoding is ASCII-compatible, False otherwise.
+    """
+    name = codecs.lookup(encoding).name
+    return (
+        name in ("ascii", "utf-8")
+        or name.startswith("iso8859-")
+        or name.startswith("cp125")
+    )
+
+
+class LineCounter:
+    """
+    Counts the lines of a text in an ASCII-compatible encoding from its bytes.
+
+    Like Python's universal newlines mode, "\\n", "\\r\\n" and "\\r" all end a line,
+    and a final line without a trailing newline counts as well.
+    """
+
+    __slots__ = ("newline_count", "last_byte")
+
+    def __init__(self) -> None:
+        self.newline_count = 0
+        self.last_byte = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Count the newlines of the next chunk of the text.
+
+        :param chunk: The chunk.
+        """
+        if len(chunk) == 0:
+            return
+        newline_count = chunk.count(b"\n")
+        cr_count = chunk.count(b"\r")
+        if cr_count != 0:
+            # A "\r\n" has already been counted as a "\n"
+            newline_count += cr_count - chunk.count(b"\r\n")
+        if self.last_byte == b"\r" and chunk.startswith(b"\n"):
+            # A "\r\n" spanning two chunks has been counted twice
+            newline_count -= 1
+        self.newline_count += newline_count
+        self.last_byte = chunk[-1:]
+
+    @property
+    def line_count(self) -> int:
+        """
+        The number of lines of the text fed so far.
+        """
+        if self.last_byte in (b"", b"\n", b"\r"):
+            return self.newline_count
+        return self.newline_count + 1
+
+
+def _validating_decoder(encoding: str) -> Optional[codecs.IncrementalDecoder]:
+    # Every byte sequence is valid Latin-1, so nothing needs to be validated
+    if codecs.lookup(encoding).name == "iso8859-1":
+        return None
+    return codecs.getincrementaldecoder(encoding)()
+
+
+def _read_chunks(
+    file: BinaryIO, remaining: Optional[int], chunk_size: int
+) -> Iterator[bytes]:
+    # Read until the end of the file if the number of remaining bytes is unknown
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = file.read(size)
+        if len(chunk) == 0:
+            return
+        if remaining is not None:
+            remaining -= len(chunk)
+        yield chunk
+
+
+def count_newlines(
+    path: str,
+    encoding: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> LineCounter:
+    """
+    Count the newlines of a byte range of a text file in an ASCII-compatible
+    encoding.
+
+    The range is read in binary mode, and the newline bytes are counted without
+    decoding the text. Chunks consisting of ASCII bytes only are valid in every
+    ASCII-compatible encoding, so only the other chunks are decoded to make sure
+    that the range is valid.
+
+    :param path: The path of the file.
+    :param encoding: The (ASCII-compatible) encoding of the file.
+    :param start: The offset of the first byte of the range, which must be the
+        first byte of a character.
+    :param end: The offset after the last byte of the range. By default, the range
+        ends at the end of the file.
+    :param chunk_size: The number of bytes read at once.
+    :return: The counter containing the newlines of the range.
+    :raise UnicodeDecodeError: If the range is not valid in the encoding.
+    """
+    decoder = _validating_decoder(encoding)
+    counter = LineCounter()
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start if end is not None else None
+        for chunk in _read_chunks(file, remaining, chunk_size):
+            # A chunk may end in the middle of a multibyte sequence
+            if decoder is not None and (
+                not chunk.isascii() or decoder.getstate()[0] != b""
+            ):
+                decoder.decode(chunk)
+            counter.feed(chunk)
+    if decoder is not None:
+        decoder.decode(b"", final=True)
+    return counter
+
+
+def count_lines(path: str, encoding: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Count the lines of a text file in an ASCII-compatible encoding.
+
+    The newline bytes are counted without decoding the text (see count_newlines),
+    and the result is the same as the number of lines read in text mode.
+
+    :param path: The path of the file.
+    :param encoding: The (ASCII-compatible) encoding of the file.
+    :param chunk_size: The number of bytes read at once.
+    :return: The number of lines.
+    :raise UnicodeDecodeError: If the file is not valid in the encoding.
+    """
+    return count_newlines(path, encoding, chunk_size=chunk_size).line_count
+
+
+class LineDecodeError(Exception):
+    """
+    A decoding error at a known byte offset of a file.
+
+    This is raised by decode_lines after all lines before the line containing the
+    offending bytes have been yielded.
+    """
+
+    def __init__(self, error: UnicodeDecodeError, offset: int) -> None:
+        super().__init__(error, offset)
+        self.error = error
+        self.offset = offset
+
+    def __str__(self) -> str:
+        return f"{self.error.reason} at byte {self.offset}"
+
+
+class _LineSplitter:
+    """
+    Splits decoded text into lines, keeping the incomplete last line.
+    """
+
+    __slots__ = ("name", "line_len_limit", "pending", "pending_len")
+
+    def __init__(self, name: str, line_len_limit: Optional[int]) -> None:
+        self.name = name
+        self.line_len_limit = line_len_limit
+        # The parts of the incomplete last line (joined only once it is complete,
+        # so that a long line is not copied for every chunk)
+        self.pending: List[str] = []
+        self.pending_len = 0
+
+    def _too_long(self) -> FluentFsException:
+        return FluentFsException(
+            f"{self.name} contains a line longer than {self.line_len_limit} characters"
+        )
+
+    def feed(self, text: str) -> Iterator[str]:
+        parts = text.split("\n")
+        last = parts.pop()
+        if len(parts) > 0:
+            parts[0] = "".join(self.pending) + parts[0]
+            self.pending, self.pending_len = [], 0
+            limit = self.line_len_limit
+            for line in parts:
+                if limit is not None and len(line) > limit:
+                    raise self._too_long()
+                yield line + "\n"
+        self.pending.append(last)
+        self.pending_len += len(last)
+        if self.line_len_limit is not None and self.pending_len > self.line_len_limit:
+            raise self._too_long()
+
+    def rest(self) -> str:
+        return "".join(self.pending)
+
+
+def decode_lines(
+    file: BinaryIO,
+    encoding: str,
+    line_len_limit: Optional[int] = None,
+    offset: int = 0,
+    chunk_size: int = LINE_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Read the lines of a text file opened in binary mode.
+
+    Like Python's universal newlines mode, "\\n", "\\r\\n" and "\\r" all end a
+    line and are translated to "\\n". Unlike a file opened in text mode (which
+    decodes whole blocks and loses the lines of a block containing a decoding
+    error), all lines before the line containing the offending bytes are yielded
+    before the error is raised.
+
+    :param file: The file, positioned at the beginning of a line.
+    :param encoding: The encoding of the file.
+    :param line_len_limit: The maximum length of a line (without the newline). If a
+        line is longer, a FluentFsException is raised without reading the whole line
+        into memory. By default, lines can have any length.
+    :param offset: The offset of the current position of the file, which is used
+        to report the offset of a decoding error.
+    :param chunk_size: The number of bytes decoded at once.
+    :return: An iterator containing the lines (including their newlines, except for
+        a final line without a trailing newline).
+    :raise LineDecodeError: If the file is not valid in the encoding.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True
+    )
+    splitter = _LineSplitter(str(getattr(file, "name", file)), line_len_limit)
+    while True:
+        chunk = file.read(chunk_size)
+        buffered, flag = decoder.getstate()
+        try:
+            text = decoder.decode(chunk, final=len(chunk) == 0)
+        except UnicodeDecodeError as e:
+            # The bytes before the offending ones (including the bytes buffered
+            # from the previous chunk) are valid
+            decoder.setstate((b"", flag))
+            yield from splitter.feed(decoder.decode(e.object[: e.start], final=True))
+            raise LineDecodeError(e, offset - len(buffered) + e.start)
+        yield from splitter.feed(text)
+        if len(chunk) == 0:
+            break
+        offset += len(chunk)
+    rest = splitter.rest()
+    if rest != "":
+        yield rest
@@ -0,0 +1,125 @@
+import itertools
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, TypeVar, Union
+
+from fluentfs.exceptions.exceptions import FluentFsException
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+# The kinds of executors created by parallel_map
+EXECUTOR_KINDS = ("thread", "process")
+
+
+def _apply(fun: Callable[[T], S], chunk: List[T]) -> List[S]:
+    return [fun(item) for item in chunk]
+
+
+def _chunks(iterable: Iterable[T], chunksize: int) -> Iterator[List[T]]:
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, chunksize))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _completed(pending: "Deque[Future[List[S]]]", ordered: bool) -> Iterator[S]:
+    if ordered:
+        futures = [pending.popleft()]
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        futures = [future for future in pending if future in done]
+        for future in futures:
+            pending.remove(future)
+    for future in futures:
+        # This raises the exception of the worker, if any
+        yield from future.result()
+
+
+def parallel_map(
+    iterable: Iterable[T],
+    fun: Callable[[T], S],
+    workers: int = 4,
+    executor: Union[str, Executor] = "thread",
+    ordered: bool = True,
+    chunksize: int = 1,
+    max_pending: Optional[int] = None,
+) -> Iterator[S]:
+    """
+    Map a function over an iterable on a pool of workers.
+
+    The items are sent to the workers in chunks, and at most max_pending chunks are
+    in flight at the same time. The items are therefore pulled from the iterable
+    only as fast as the workers process them, and the memory usage is bounded. If
+    the function raises an exception, the exception is raised when its result is
+    due, and the chunks that have not been started yet are cancelled.
+
+    :param iterable: The iterable.
+    :param fun: The function. For a process pool, both the function and the items
+        must be picklable (i.e. the function cannot be a lambda).
+    :param workers: The number of workers.
+    :param executor: Either "thread" for a thread pool (which only helps if the
+        function blocks on I/O or releases the GIL), "process" for a process pool
+        (for CPU-bound functions) or an existing executor (which is not shut down
+        afterwards).
+    :param ordered: Whether to yield the results in the order of the items. If this
+        is False, the results of each chunk are yielded as soon as it is complete.
+    :param chunksize: The number of items sent to a worker at once. Larger chunks
+        reduce the overhead of a process pool.
+    :param max_pending: The maximum number of chunks in flight. By default, this is
+        four times the number of workers.
+    :return: An iterator containing the results.
+    """
+    if workers < 1:
+        raise FluentFsException(f"Invalid number of workers {workers}")
+    if chunksize < 1:
+        raise FluentFsException(f"Invalid chunk size {chunksize}")
+    if isinstance(executor, str) and executor not in EXECUTOR_KINDS:
+        raise FluentFsException(
+            f"Invalid executor {executor} (must be one of {list(EXECUTOR_KINDS)})"
+        )
+    max_pending = max_pending if max_pending is not None else 4 * workers
+    return _parallel_map(
+        _chunks(iterable, chunksize), fun, workers, executor, ordered, max_pending
+    )
+
+
+def _create_executor(kind: str, workers: int) -> Executor:
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _parallel_map(
+    chunks: Iterator[List[T]],
+    fun: Callable[[T], S],
+    workers: int,
+    executor: Union[str, Executor],
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[S]:
+    pool = (
+        _create_executor(executor, workers) if isinstance(executor, str) else executor
+    )
+    pending: "Deque[Future[List[S]]]" = deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(_apply, fun, chunk))
+            if len(pending) >= max_pending:
+                yield from _completed(pending, ordered)
+        while len(pending) > 0:
+            yield from _completed(pending, ordered)
+    finally:
+        for future in pending:
+            future.cancel()
+        if pool is not executor:
+            pool.shutdown(wait=True)
@@ -0,0 +1,71 @@
+import codecs
+
+from fluentfs.common.newlines import CHUNK_SIZE, is_ascii_compatible
+
+
+def count_chars(path: str, encoding: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Count the characters of a text file without reading it into memory.
+
+    The result is the length of the content read in text mode, i.e. "\\r\\n" counts
+    as a single character. If the encoding is ASCII-compatible, the file is read in
+    binary mode, chunks consisting of ASCII bytes only are counted without decoding
+    them, and only the other chunks are decoded. Otherwise, the file is decoded
+    chunk by chunk.
+
+    :param path: The path of the file.
+    :param encoding: The encoding of the file.
+    :param chunk_size: The number of bytes (or characters) read at once.
+    :return: The number of characters.
+    :raise UnicodeDecodeError: If the file is not valid in the encoding.
+    """
+    if not is_ascii_compatible(encoding):
+        char_count = 0
+        with open(path, "r", encoding=encoding) as file:
+            for text in iter(lambda: file.read(chunk_size), ""):
+                char_count += len(text)
+        return char_count
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    char_count = 0
+    crlf_count = 0
+    last_byte = b""
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            # A chunk may end in the middle of a multibyte sequence
+            if chunk.isascii() and decoder.getstate()[0] == b"":
+                char_count += len(chunk)
+            else:
+                char_count += len(decoder.decode(chunk))
+            crlf_count += chunk.count(b"\r\n")
+            if last_byte == b"\r" and chunk.startswith(b"\n"):
+                crlf_count += 1
+            last_byte = chunk[-1:]
+    char_count += len(decoder.decode(b"", final=True))
+    # Every "\r\n" is read as a single "\n" in text mode
+    return char_count - crlf_count
+
+
+def count_words(path: str, encoding: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Count the words of a text file without reading it into memory.
+
+    Words are separated by whitespace, i.e. the result is the same as the length of
+    the content split by str.split. The file is decoded chunk by chunk, and a word
+    spanning two chunks is counted once.
+
+    :param path: The path of the file.
+    :param encoding: The encoding of the file.
+    :param chunk_size: The number of characters read at once.
+    :return: The number of words.
+    :raise UnicodeDecodeError: If the file is not valid in the encoding.
+    """
+    word_count = 0
+    ends_in_word = False
+    with open(path, "r", encoding=encoding) as file:
+        for text in iter(lambda: file.read(chunk_size), ""):
+            word_count += len(text.split())
+            if ends_in_word and not text[0].isspace():
+                word_count -= 1
+            ends_in_word = not text[-1].isspace()
+    return word_count
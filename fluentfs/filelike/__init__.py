@@ -1,19 +1,25 @@
-from fluentfs.filelike.dir import Dir
+from fluentfs.filelike.content_cache import ContentCache
+from fluentfs.filelike.dir import Dir, DirWalk
 from fluentfs.filelike.file import File
 from fluentfs.filelike.file_iterator import FileIterator
-from fluentfs.filelike.file_like import FileLike
+from fluentfs.filelike.file_like import FileLike, FileLikeContext
 from fluentfs.filelike.sym_link import SymLink
 from fluentfs.filelike.text_file import TextFile
 from fluentfs.filelike.text_file_iterator import TextFileIterator
+from fluentfs.filelike.text_stats import TextStats
 
 # Need to import this to make circular attributes available
 import fluentfs.filelike.circular  # noqa:F401 isort:skip
 
 __all__ = [
+    # content_cache
+    "ContentCache",
     # file_like
     "FileLike",
+    "FileLikeContext",
     # dir
     "Dir",
+    "DirWalk",
     # file
     "File",
     # file_iterator
@@ -24,4 +30,6 @@ __all__ = [
     "TextFile",
     # text_file_iterator
     "TextFileIterator",
+    # text_stats
+    "TextStats",
 ]
@@ -1,8 +1,11 @@
 import os
+from typing import Optional
 
+from fluentfs.filelike.content_cache import ContentCache
 from fluentfs.filelike.dir import Dir
 from fluentfs.filelike.file import File
 from fluentfs.filelike.file_iterator import FileIterator
+from fluentfs.filelike.file_like import FileLikeContext
 from fluentfs.filelike.text_file import TextFile
 from fluentfs.filelike.text_file_iterator import TextFileIterator
 
@@ -20,7 +23,11 @@ setattr(File, "dir", property(dir))
 
 
 def text_file(
-    self: File, encoding: str = "utf-8", raise_on_decode_error: bool = True
+    self: File,
+    encoding: str = "utf-8",
+    raise_on_decode_error: bool = True,
+    line_len_limit: Optional[int] = None,
+    content_cache: Optional[ContentCache] = None,
 ) -> "TextFile":
     """
     Get a TextFile object for this file.
@@ -31,9 +38,23 @@ def text_file(
     However, when calling paths on the resulting TextFile object, errors will occur.
 
     :param encoding: The encoding to use.
+    :param raise_on_decode_error: Whether to raise an exception in case of a decoding
+        error (see TextFile).
+    :param line_len_limit: The maximum length of a line (see TextFile).
+    :param content_cache: The cache for the content (see TextFile).
     :return: The obtained TextFile object.
     """
-    return TextFile(self.path, encoding, raise_on_decode_error)
+    # This file is known to exist, so we can skip the checks of the TextFile
+    # constructor and share the stat cache seeded so far.
+    context = FileLikeContext.get(
+        self.expand_user,
+        self.expand_vars,
+        encoding,
+        raise_on_decode_error,
+        line_len_limit,
+        content_cache,
+    )
+    return TextFile._from_trusted_path(self.path, self._stat, context)
 
 
 setattr(File, "text_file", text_file)
@@ -41,10 +62,18 @@ setattr(File, "t", text_file)
 
 
 def text_file_iterator(
-    self: FileIterator, encoding: str = "utf-8", raise_on_decode_error: bool = True
+    self: FileIterator,
+    encoding: str = "utf-8",
+    raise_on_decode_error: bool = True,
+    line_len_limit: Optional[int] = None,
+    content_cache: Optional[ContentCache] = None,
 ) -> "TextFileIterator":
     return TextFileIterator(
-        self.map_self(lambda file: file.text_file(encoding, raise_on_decode_error))
+        self.map_self(
+            lambda file: file.text_file(
+                encoding, raise_on_decode_error, line_len_limit, content_cache
+            )
+        )
     )
 
 
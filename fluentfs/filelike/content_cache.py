@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# The path, modification time (in nanoseconds), size and encoding of a file
+ContentKey = Tuple[str, int, int, str]
+
+
+class ContentCache:
+    """
+    A cache of decoded file contents, bounded by the total size of the cached files.
+
+    A TextFile with a content cache reads and decodes its file once, and serves
+    content, lines, words etc. from the cache afterwards. The contents are keyed by
+    the path, modification time, size and encoding of the file, so a file that
+    changed is read again. When the cache is full, the least recently used contents
+    are evicted.
+
+    A cache can be shared by any number of TextFile objects and text file iterators
+    (also from several threads). The hits, misses and evictions are counted, so you
+    can check whether the cache is big enough.
+    """
+
+    __slots__ = (
+        "max_bytes",
+        "hits",
+        "misses",
+        "evictions",
+        "_size",
+        "_contents",
+        "_lock",
+    )
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initialize a new ContentCache.
+
+        :param max_bytes: The maximum total size of the cached files (in bytes).
+            Files bigger than this are never cached.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._contents: "OrderedDict[ContentKey, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the cached files (in bytes).
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def get(self, key: ContentKey) -> Optional[str]:
+        """
+        Get a cached content and mark it as recently used.
+
+        :param key: The key of the content.
+        :return: The content, or None if it is not cached.
+        """
+        with self._lock:
+            entry = self._contents.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._contents.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: ContentKey, content: str, byte_count: int) -> None:
+        """
+        Cache a content, evicting the least recently used contents if necessary.
+
+        :param key: The key of the content.
+        :param content: The content.
+        :param byte_count: The size of the file (in bytes).
+        """
+        if byte_count > self.max_bytes:
+            return
+
+        with self._lock:
+            old_entry = self._contents.pop(key, None)
+            if old_entry is not None:
+                self._size -= old_entry[1]
+            while self._size + byte_count > self.max_bytes:
+                _, (_, evicted_byte_count) = self._contents.popitem(last=False)
+                self._size -= evicted_byte_count
+                self.evictions += 1
+            self._contents[key] = (content, byte_count)
+            self._size += byte_count
+
+    def clear(self) -> None:
+        """
+        Remove all contents (the counters are kept).
+        """
+        with self._lock:
+            self._contents.clear()
+            self._size = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ContentCache(size={self._size}, max_bytes={self.max_bytes}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
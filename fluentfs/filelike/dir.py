@@ -1,71 +1,161 @@
 import os
-from collections.abc import Iterator
-from enum import Enum
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
 
 from fluentfs.common.functional import FunctionalIterator
+from fluentfs.common.regex import compile_regex
 from fluentfs.exceptions.exceptions import FluentFsException
 from fluentfs.filelike.file import File
 from fluentfs.filelike.file_iterator import FileIterator
 from fluentfs.filelike.file_like import FileLike
-from fluentfs.paths.paths import dir_exists, file_exists
+from fluentfs.paths.paths import FileLikeKind, dir_exists, expand_path, expand_paths
+from fluentfs.walk.parallel import ParallelWalker
+from fluentfs.walk.summary import WalkSummary, summarize
+from fluentfs.walk.usage import DiskUsage, dir_usage
+from fluentfs.walk.walker import STAT_FROM_LISTING, WalkEntry, Walker, WalkIterator
+from fluentfs.watch.inotify import InotifyWatcher, inotify_available
+from fluentfs.watch.watcher import PollingWatcher, Watcher
 
 
-class _FileTreeWalkIteratorKind(Enum):
-    FILE_LIKES = 0
-    FILES_ONLY = 1
-    DIRS_ONLY = 2
+def _file_like_from_entry(entry: WalkEntry) -> FileLike:
+    # The walker has already classified the entry using the directory listing,
+    # so there is no need to check again whether the file-like object exists.
+    # Where the listing provides stat information for free, it seeds the cache.
+    stat = entry.stat(follow_symlinks=False) if STAT_FROM_LISTING else None
+    if entry.is_dir(follow_symlinks=False):
+        return Dir._from_trusted_path(entry.path, stat)
+    return File._from_trusted_path(entry.path, stat)
 
 
-class _FileTreeWalkIterator(Iterator):
-    def __init__(self, path: str, kind: _FileTreeWalkIteratorKind) -> None:
-        self.walk_iterator = os.walk(path)
-        self.path = path
+def _pruning_options(
+    include_base_path: Union[str, List[str], None],
+    exclude_base_path: Union[str, List[str], None],
+    exclude_dir_glob: Union[str, List[str], None],
+    exclude_dir_regex: Union[str, List[str], None],
+    dir_filter: Optional[Callable[["Dir"], bool]],
+) -> Dict[str, Any]:
+    if isinstance(include_base_path, str):
+        include_base_path = [include_base_path]
+    if isinstance(exclude_base_path, str):
+        exclude_base_path = [exclude_base_path]
+    if isinstance(exclude_dir_glob, str):
+        exclude_dir_glob = [exclude_dir_glob]
 
-        self.process_dirs = (
-            kind == _FileTreeWalkIteratorKind.FILE_LIKES
-            or kind == _FileTreeWalkIteratorKind.DIRS_ONLY
-        )
-        self.process_files = (
-            kind == _FileTreeWalkIteratorKind.FILE_LIKES
-            or kind == _FileTreeWalkIteratorKind.FILES_ONLY
-        )
+    return {
+        "include_base_paths": (
+            expand_paths(include_base_path) if include_base_path is not None else None
+        ),
+        "exclude_base_paths": (
+            expand_paths(exclude_base_path) if exclude_base_path is not None else None
+        ),
+        "exclude_dir_globs": exclude_dir_glob,
+        "exclude_dir_regexes": (
+            compile_regex(exclude_dir_regex) if exclude_dir_regex is not None else None
+        ),
+        "dir_filter": (
+            (lambda entry: dir_filter(Dir._from_trusted_path(entry.path)))
+            if dir_filter is not None
+            else None
+        ),
+    }
+
+
+def _mount_points(allowed_mounts: Union[str, List[str], None]) -> List[str]:
+    if allowed_mounts is None:
+        return []
+    if isinstance(allowed_mounts, str):
+        allowed_mounts = [allowed_mounts]
+    return expand_paths(allowed_mounts)
+
+
+class DirWalk:
+    def __init__(self, walker: Walker) -> None:
+        """
+        Initialize a new DirWalk from a configured walker.
+
+        You will usually get a DirWalk by calling the walk method of a Dir object.
+
+        :param walker: The walker.
+        """
+        self.walker = walker
+
+    def _iterator(self, files: bool, dirs: bool) -> WalkIterator:
+        walker = self.walker.replace(files=files, dirs=dirs)
+        return WalkIterator(walker, _file_like_from_entry)
+
+    @property
+    def file_likes(self) -> FunctionalIterator[FileLike]:
+        """
+        An iterator of file-like objects visited by this walk.
+
+        :return: The iterator.
+        """
+        return FunctionalIterator(self._iterator(files=True, dirs=True))
+
+    @property
+    def files(self) -> "FileIterator":
+        """
+        An iterator of (regular) files visited by this walk.
 
-        self.sub_dir_path, _, file_names = next(self.walk_iterator)
-        self.dir_processed = False
-        self.current_file_names = sorted(file_names)
+        :return: The iterator.
+        """
+        return FileIterator(self._iterator(files=True, dirs=False))
 
-    def __next__(self) -> FileLike:
-        if not self.dir_processed and self.process_dirs:
-            self.dir_processed = True
+    @property
+    def dirs(self) -> FunctionalIterator["Dir"]:
+        """
+        An iterator of directories visited by this walk.
 
-            # We don't need to check if self.sub_dir_path is a symlink
-            # since os.walk does not descend into symlink directories.
+        :return: The iterator.
+        """
+        return FunctionalIterator(self._iterator(files=False, dirs=True))
 
-            # We don't expand user and vars since this will lead to incorrect paths
-            # if we e.g. have a directory called "~" or "dir $SOME_VAR".
-            return Dir(self.sub_dir_path, expand_user=False, expand_vars=False)
+    def count(self, kind: Optional[FileLikeKind] = None) -> int:
+        """
+        The number of file-like objects visited by this walk.
+
+        Unlike e.g. files.len(), this only counts the entries of the directory
+        listings, i.e. no file-like objects are created.
+
+        :param kind: FileLikeKind.FILE to count the (regular) files, FileLikeKind.DIR
+            to count the directories. By default, both are counted.
+        :return: The number of file-like objects.
+        """
+        if kind == FileLikeKind.SYMLINK:
+            raise FluentFsException("Walks never visit symbolic links")
+        walker = self.walker.replace(
+            files=kind != FileLikeKind.DIR, dirs=kind != FileLikeKind.FILE
+        )
+        return sum(1 for _ in walker)
 
-        if len(self.current_file_names) != 0 and self.process_files:
-            file_name, *self.current_file_names = self.current_file_names
-            file_path = os.path.join(self.sub_dir_path, file_name)
+    def summary(self) -> WalkSummary:
+        """
+        A summary of this walk, i.e. the numbers of visited directories and files
+        (per extension) and the total size of the files.
+
+        Like count, this does not create any file-like objects.
+
+        :return: The summary.
+        """
+        return summarize(self.walker.replace(files=True, dirs=True))
 
-            if not file_exists(file_path):
-                return next(self)
+    def du(self) -> Dict[str, DiskUsage]:
+        """
+        The disk usage of every directory visited by this walk, i.e. the apparent and
+        the allocated size of all files below it (see dir_usage).
 
-            # We don't expand user and vars since this will lead to incorrect paths
-            # if we e.g. have a file called "~" or "dir $SOME_VAR".
-            return File(file_path, expand_user=False, expand_vars=False)
+        Files with several hard links are only counted once. The stat results of the
+        directory entries are used, so no file-like objects are created.
 
-        try:
-            self.sub_dir_path, _, file_names = next(self.walk_iterator)
-            self.current_file_names = sorted(file_names)
-            self.dir_processed = False
-            return next(self)
-        except StopIteration:
-            raise StopIteration
+        :return: A dictionary mapping the paths of the directories to their disk
+            usages (sorted by path).
+        """
+        return dir_usage(self.walker.replace(files=True, dirs=True))
 
 
 class Dir(FileLike):
+    __slots__ = ()
+
     def __init__(
         self, path: str, expand_user: bool = True, expand_vars: bool = True
     ) -> None:
@@ -94,6 +184,118 @@ class Dir(FileLike):
         """
         return Dir(os.path.join(self.path, subdir_name))
 
+    def walk(
+        self,
+        include_base_path: Union[str, List[str], None] = None,
+        exclude_base_path: Union[str, List[str], None] = None,
+        exclude_dir_glob: Union[str, List[str], None] = None,
+        exclude_dir_regex: Union[str, List[str], None] = None,
+        dir_filter: Optional[Callable[["Dir"], bool]] = None,
+        max_depth: Optional[int] = None,
+        breadth_first: bool = False,
+        sort: bool = True,
+        respect_gitignore: bool = False,
+        workers: int = 1,
+        ordered: bool = True,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 60.0,
+        resume_from: Optional[str] = None,
+        follow_symlinks: bool = False,
+        one_file_system: bool = False,
+        allowed_mounts: Union[str, List[str], None] = None,
+    ) -> DirWalk:
+        """
+        A walk over this directory and all subdirectories.
+
+        Unlike filtering the resulting iterators, the options of this method are
+        applied during the traversal. Pruned directories are not even listed, so
+        excluding e.g. a "node_modules" directory means that nothing below it is
+        visited at all.
+
+        Note that you usually don't need to pass base paths here, since calls to
+        filter_base_path or filter_not_base_path directly on the files of a walk
+        are applied during the traversal automatically.
+
+        :param include_base_path: Either a single base path or a list of base paths.
+            Only file-like objects matching one of the base paths are visited
+            (see the documentation of matches_base_path for more information).
+        :param exclude_base_path: Either a single base path or a list of base paths.
+            File-like objects matching one of the base paths are not visited.
+        :param exclude_dir_glob: Either a single glob pattern or a list of glob
+            patterns. Directories whose paths match one of the patterns are pruned.
+        :param exclude_dir_regex: Either a single regular expression or a list of
+            regular expressions. Directories whose paths match one of the regular
+            expressions are pruned.
+        :param dir_filter: A predicate on directories. Directories for which it
+            returns False are pruned.
+        :param max_depth: If given, file-likes deeper than this are not visited. This
+            directory has depth 0 and the file-likes directly inside it have depth 1.
+        :param breadth_first: Whether to visit the directories level by level (all
+            directories of a depth before any directory of the next depth). The files
+            of a directory are still visited right after it. By default, each
+            subdirectory is walked completely before the next one.
+        :param sort: Whether to visit the file-likes of each directory sorted by
+            name. Turning this off avoids sorting huge directories.
+        :param respect_gitignore: Whether to skip the file-likes ignored by the
+            .gitignore and .ignore files inside this directory. Ignored directories
+            (and .git directories) are pruned.
+        :param workers: The number of threads listing directories concurrently. This
+            speeds up walks on filesystems with a high latency (e.g. network mounts).
+            By default, directories are listed one after another.
+        :param ordered: Whether a walk with multiple workers yields the file-likes in
+            the same order as a walk with a single worker. If this is False, the
+            file-likes of each directory are yielded as soon as it has been listed.
+        :param checkpoint: If given, the progress of the walk is saved to this file
+            every checkpoint_interval seconds and when the walk is complete. This is
+            not supported for unordered walks with multiple workers. Delivery is
+            at-least-once: the checkpoint is saved right before a file-like is
+            yielded, so a resumed walk yields the last file-like consumed before the
+            checkpoint was saved again.
+        :param checkpoint_interval: The minimum number of seconds between two saves of
+            the checkpoint.
+        :param resume_from: If given, the walk continues from the checkpoint saved to
+            this file (by a walk with the same options), i.e. file-likes consumed
+            before the checkpoint was saved are not visited again. If the file does not
+            exist, the walk starts from the beginning.
+        :param follow_symlinks: Whether to follow symbolic links. The final target of
+            every link is visited with its real path instead of the link, which may
+            be outside of this directory. Every physical directory and file is only
+            visited once (even if several links, hard links or bind mounts lead to
+            it), so e.g. summing up byte counts does not count anything twice.
+        :param one_file_system: Whether to stay on the filesystem of this directory,
+            i.e. to skip the directories on which other filesystems are mounted
+            (like /proc, network mounts or FUSE mounts).
+        :param allowed_mounts: Either a single mount point or a list of mount points
+            which are visited even if one_file_system is True.
+        :return: A DirWalk object providing iterators over the visited file-likes.
+        """
+        options = _pruning_options(
+            include_base_path,
+            exclude_base_path,
+            exclude_dir_glob,
+            exclude_dir_regex,
+            dir_filter,
+        )
+        options.update(
+            max_depth=max_depth,
+            breadth_first=breadth_first,
+            sort=sort,
+            respect_gitignore=respect_gitignore,
+            checkpoint=None if checkpoint is None else expand_path(checkpoint),
+            checkpoint_interval=checkpoint_interval,
+            resume_from=None if resume_from is None else expand_path(resume_from),
+            follow_symlinks=follow_symlinks,
+            one_file_system=one_file_system,
+            allowed_mounts=_mount_points(allowed_mounts),
+        )
+        if workers > 1:
+            walker: Walker = ParallelWalker(
+                self.path, workers=workers, ordered=ordered, **options
+            )
+        else:
+            walker = Walker(self.path, **options)
+        return DirWalk(walker)
+
     @property
     def file_likes(self) -> FunctionalIterator[FileLike]:
         """
@@ -101,9 +303,7 @@ class Dir(FileLike):
 
         :return: The iterator.
         """
-        return FunctionalIterator(
-            _FileTreeWalkIterator(self.path, _FileTreeWalkIteratorKind.FILE_LIKES)
-        )
+        return self.walk().file_likes
 
     @property
     def files(self) -> "FileIterator":
@@ -112,9 +312,7 @@ class Dir(FileLike):
 
         :return: The iterator.
         """
-        return FileIterator(
-            _FileTreeWalkIterator(self.path, _FileTreeWalkIteratorKind.FILES_ONLY)
-        )
+        return self.walk().files
 
     @property
     def dirs(self) -> FunctionalIterator["Dir"]:
@@ -123,9 +321,88 @@ class Dir(FileLike):
 
         :return: The iterator.
         """
-        return FunctionalIterator(
-            _FileTreeWalkIterator(self.path, _FileTreeWalkIteratorKind.DIRS_ONLY)
-        )
+        return self.walk().dirs
+
+    def count(self, kind: Optional[FileLikeKind] = None, workers: int = 1) -> int:
+        """
+        The number of file-like objects present in this directory and all
+        subdirectories (including this directory).
+
+        This is much faster than e.g. files.len(), since no file-like objects are
+        created (see DirWalk.count).
+
+        :param kind: FileLikeKind.FILE to count the (regular) files, FileLikeKind.DIR
+            to count the directories. By default, both are counted.
+        :param workers: The number of threads listing directories concurrently.
+        :return: The number of file-like objects.
+        """
+        return self.walk(workers=workers, ordered=False).count(kind)
+
+    def summary(self, workers: int = 1) -> WalkSummary:
+        """
+        A summary of this directory and all subdirectories, i.e. the numbers of
+        directories and files (per extension) and the total size of the files.
+
+        :param workers: The number of threads listing directories concurrently.
+        :return: The summary.
+        """
+        return self.walk(workers=workers, ordered=False).summary()
+
+    def du(self, workers: int = 1) -> Dict[str, DiskUsage]:
+        """
+        The disk usage of this directory and of every subdirectory, i.e. the
+        apparent and the allocated size of all files below it.
+
+        Files with several hard links are only counted once, and sparse files only
+        count the space actually allocated for them towards the allocated size. Use
+        walk(...).du() to prune the walk or to stay on one filesystem.
+
+        :param workers: The number of threads listing directories concurrently.
+        :return: A dictionary mapping the paths of the directories to their disk
+            usages (sorted by path, i.e. the first one is this directory).
+        """
+        return self.walk(workers=workers, ordered=False).du()
+
+    def afiles(
+        self,
+        batch_size: int = 64,
+        max_batches: int = 4,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[File]:
+        """
+        An asynchronous iterator of (regular) files present in this directory and all
+        subdirectories.
+
+        The directory is walked on an executor, so the event loop is not blocked.
+        To prune or filter the walk, use e.g. dir.walk(...).files.filter(...).aiter()
+        instead (see FunctionalIterator.aiter).
+
+        :param batch_size: The number of files pulled per executor call.
+        :param max_batches: The maximum number of batches that are buffered.
+        :param executor: The executor to use. By default, this is the default
+            executor of the event loop.
+        :return: The asynchronous iterator.
+        """
+        return self.files.aiter(batch_size, max_batches, executor)
+
+    def watch(self, polling: bool = False, interval: float = 1.0) -> Watcher:
+        """
+        Watch this directory and all subdirectories for changes.
+
+        Iterating over the returned watcher yields the created, modified, deleted and
+        moved files and directories as they change. On Linux, the watcher is notified
+        by the kernel (using inotify). Elsewhere, the watcher walks the tree every
+        interval seconds and compares the results.
+
+        :param polling: Whether to walk the tree regularly even if inotify is
+            available.
+        :param interval: The number of seconds between two walks of a polling
+            watcher.
+        :return: The watcher. Close it once you are done.
+        """
+        if not polling and inotify_available():
+            return InotifyWatcher(self.path)
+        return PollingWatcher(self.path, interval)
 
     def __repr__(self) -> str:
         return f'Dir("{self.path}")'
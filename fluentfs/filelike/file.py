@@ -9,6 +9,8 @@ from fluentfs.paths.paths import file_exists
 
 
 class File(FileLike):
+    __slots__ = ()
+
     def __init__(
         self, path: str, expand_user: bool = True, expand_vars: bool = True
     ) -> None:
@@ -34,11 +36,12 @@ class File(FileLike):
         """
         The number of bytes of this file.
 
-        This is similar to `wc -c $FILENAME`.
+        This is similar to `wc -c $FILENAME`. Note that the value is taken from the
+        cached stat result (see FileLike.stat).
 
         :return: The number of bytes.
         """
-        return os.path.getsize(self.path)
+        return self.stat().st_size
 
     dir: Any
 
@@ -72,8 +75,7 @@ class File(FileLike):
 
         :return: A datetime object representing the last access time.
         """
-        atime = os.path.getatime(self.path)
-        return datetime.datetime.fromtimestamp(atime)
+        return datetime.datetime.fromtimestamp(self.stat().st_atime)
 
     atime = access_time
 
@@ -84,8 +86,7 @@ class File(FileLike):
 
         :return: A datetime object representing the last modification time.
         """
-        mtime = os.path.getmtime(self.path)
-        return datetime.datetime.fromtimestamp(mtime)
+        return datetime.datetime.fromtimestamp(self.stat().st_mtime)
 
     mtime = mod_time
 
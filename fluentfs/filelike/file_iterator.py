@@ -1,19 +1,36 @@
-from typing import Any, List, TypeVar, Union
+from typing import Any, List, Optional, TypeVar, Union
 
 from fluentfs.common import compile_regex
 from fluentfs.common.functional import FunctionalIterator
 from fluentfs.filelike.file import File
 from fluentfs.paths.matches import (
-    matches_base_path,
     matches_compiled_regex,
+    matches_expanded_base_path,
     matches_glob,
 )
+from fluentfs.paths.paths import expand_paths
+from fluentfs.walk.usage import DiskUsage, disk_usage
+from fluentfs.walk.walker import WalkIterator
 
 T = TypeVar("T", bound=File)
 TFileIterator = TypeVar("TFileIterator", bound="FileIterator")
 
 
 class FileIterator(FunctionalIterator[T]):
+    def _unstarted_walk(self) -> Optional[WalkIterator]:
+        """
+        The underlying walk, if this iterator directly draws from a walk that has not
+        started yet.
+
+        Filters that the walker supports can then be applied during the traversal
+        instead of afterwards, which allows pruning whole subtrees.
+
+        :return: The walk iterator or None.
+        """
+        if isinstance(self.it, WalkIterator) and not self.it.started:
+            return self.it
+        return None
+
     def filter_extension(
         self: TFileIterator, extension: Union[str, List[str]]
     ) -> TFileIterator:
@@ -41,10 +58,27 @@ class FileIterator(FunctionalIterator[T]):
 
         See the documentation of matches_base_path for more information.
 
+        If this is called directly on the files of a walk (e.g. Dir.files), the base
+        paths are applied during the traversal, so that directories which cannot
+        contain matching files are not visited at all.
+
         :param base_paths: Either a single base path or a list of base paths.
         :return: A file iterator containing the files that match the given base path(s).
         """
-        return self.filter(lambda file: matches_base_path(file.path, base_paths))
+        if isinstance(base_paths, str):
+            base_paths = [base_paths]
+        expanded_base_paths = expand_paths(base_paths)
+
+        # Multiple include filters must all match, so we can only push the first one
+        # down into the walker
+        walk = self._unstarted_walk()
+        if walk is not None and walk.walker.include_base_paths is None:
+            walker = walk.walker.replace(include_base_paths=expanded_base_paths)
+            return type(self)(walk.with_walker(walker))
+
+        return self.filter(
+            lambda file: matches_expanded_base_path(file.path, expanded_base_paths)
+        )
 
     include_base_path = filter_base_path
     filter_base = filter_base_path
@@ -58,10 +92,29 @@ class FileIterator(FunctionalIterator[T]):
 
         See the documentation of matches_base_path for more information.
 
+        If this is called directly on the files of a walk (e.g. Dir.files), the
+        directories matching the base paths are pruned during the traversal, so that
+        nothing below them is visited at all.
+
         :param base_paths: Either a single base path or a list of base paths.
         :return: A file iterator containing the files that don't match the given base path(s).
         """
-        return self.filter(lambda file: not matches_base_path(file.path, base_paths))
+        if isinstance(base_paths, str):
+            base_paths = [base_paths]
+        expanded_base_paths = expand_paths(base_paths)
+
+        # If this iterator directly draws from a walk, excluded directories are
+        # pruned during the traversal instead of being visited and filtered
+        walk = self._unstarted_walk()
+        if walk is not None:
+            walker = walk.walker.replace(
+                exclude_base_paths=walk.walker.exclude_base_paths + expanded_base_paths
+            )
+            return type(self)(walk.with_walker(walker))
+
+        return self.filter(
+            lambda file: not matches_expanded_base_path(file.path, expanded_base_paths)
+        )
 
     exclude_base_path = filter_not_base_path
     filter_not_base = filter_not_base_path
@@ -234,6 +287,19 @@ class FileIterator(FunctionalIterator[T]):
         """
         return self.map(lambda file: file.byte_count)
 
+    def disk_usage(self) -> DiskUsage:
+        """
+        The disk usage of the files, i.e. the sum of their byte counts (the apparent
+        size) and the space allocated for them on the disk (which is much smaller
+        for sparse files).
+
+        Files with several hard links are only counted once. The cached stat results
+        of the files are used.
+
+        :return: The disk usage.
+        """
+        return disk_usage(file.stat() for file in self)
+
     # These attributes are created in the TextFileIterator class
     text_file_iterator: Any
     t: Any
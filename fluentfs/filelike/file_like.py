@@ -1,26 +1,190 @@
+import functools
+import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional, Tuple, Type, TypeVar
 
+from fluentfs.filelike.content_cache import ContentCache
 from fluentfs.paths.paths import base_name, expand_path, relative_path
 
+TFileLike = TypeVar("TFileLike", bound="FileLike")
+
+
+class FileLikeContext:
+    """
+    The settings of a file-like object that are not specific to its path.
+
+    These settings are usually the same for (almost) all file-like objects, e.g. for
+    all files produced by a directory walk. Contexts are therefore flyweights: get
+    returns one shared instance per combination of settings, and every file-like
+    object only stores a reference to it.
+    """
+
+    __slots__ = (
+        "expand_user",
+        "expand_vars",
+        "encoding",
+        "raise_on_decode_error",
+        "line_len_limit",
+        "content_cache",
+    )
+
+    def __init__(
+        self,
+        expand_user: bool = True,
+        expand_vars: bool = True,
+        encoding: str = "utf-8",
+        raise_on_decode_error: bool = True,
+        line_len_limit: Optional[int] = None,
+        content_cache: Optional[ContentCache] = None,
+    ) -> None:
+        self.expand_user = expand_user
+        self.expand_vars = expand_vars
+        self.encoding = encoding
+        self.raise_on_decode_error = raise_on_decode_error
+        self.line_len_limit = line_len_limit
+        self.content_cache = content_cache
+
+    @staticmethod
+    def get(
+        expand_user: bool = True,
+        expand_vars: bool = True,
+        encoding: str = "utf-8",
+        raise_on_decode_error: bool = True,
+        line_len_limit: Optional[int] = None,
+        content_cache: Optional[ContentCache] = None,
+    ) -> "FileLikeContext":
+        """
+        Get the shared context with the given settings.
+
+        Contexts with a content cache are not shared, since the shared contexts are
+        kept forever and would keep the cache (and its contents) alive as well.
+
+        :param expand_user: Whether ~ was expanded in the path.
+        :param expand_vars: Whether environment variables were expanded in the path.
+        :param encoding: The encoding used for text files.
+        :param raise_on_decode_error: Whether to raise an exception in case of a
+            decoding error of a text file.
+        :param line_len_limit: The maximum length of a line of a text file, if any.
+        :param content_cache: The cache for the contents of text files, if any.
+        :return: The context.
+        """
+        if content_cache is not None:
+            return FileLikeContext(
+                expand_user,
+                expand_vars,
+                encoding,
+                raise_on_decode_error,
+                line_len_limit,
+                content_cache,
+            )
+        return FileLikeContext._shared(
+            expand_user, expand_vars, encoding, raise_on_decode_error, line_len_limit
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _shared(
+        expand_user: bool,
+        expand_vars: bool,
+        encoding: str,
+        raise_on_decode_error: bool,
+        line_len_limit: Optional[int],
+    ) -> "FileLikeContext":
+        return FileLikeContext(
+            expand_user, expand_vars, encoding, raise_on_decode_error, line_len_limit
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # An unpickled context is the shared context of the receiving process. The
+        # content cache is not sent along, since it could only be filled in the
+        # receiving process anyway.
+        return (
+            FileLikeContext.get,
+            (
+                self.expand_user,
+                self.expand_vars,
+                self.encoding,
+                self.raise_on_decode_error,
+                self.line_len_limit,
+            ),
+        )
+
 
 class FileLike(ABC):
+    __slots__ = ("_path", "_stat", "_context")
+
     def __init__(
         self, path: str, expand_user: bool = True, expand_vars: bool = True
     ) -> None:
-        self._path = path
+        # Expand the path once, so that the path property (which is used by virtually
+        # every other property and filter) is a simple attribute lookup.
+        self._path = sys.intern(
+            expand_path(path, expand_user=expand_user, expand_vars=expand_vars)
+        )
+        self._stat: Optional[os.stat_result] = None
+        self._context = FileLikeContext.get(expand_user, expand_vars)
 
-        self.expand_user = expand_user
-        self.expand_vars = expand_vars
+    @classmethod
+    def _from_trusted_path(
+        cls: Type[TFileLike],
+        path: str,
+        stat: Optional[os.stat_result] = None,
+        context: Optional[FileLikeContext] = None,
+    ) -> TFileLike:
+        """
+        Create a file-like object without checking whether it exists.
+
+        This is used by the directory walker, which already knows the kind of every
+        entry from the directory listing and would otherwise stat each entry again.
+        The path is not expanded at all, since the walker builds paths by joining
+        names to the (already maximally expanded) path of the root directory.
+        Expanding ~ and environment variables would even lead to incorrect paths if
+        we e.g. have a file called "~".
+
+        :param path: The maximally expanded path of an existing file-like object of
+            the respective kind.
+        :param stat: The stat result of the file-like object, if the walker already
+            has it. This will be served by stat() until the object is refreshed.
+        :param context: The context of the file-like object. By default, this is the
+            shared context for unexpanded paths.
+        :return: The file-like object.
+        """
+        file_like = cls.__new__(cls)
+        file_like._path = path
+        file_like._stat = stat
+        file_like._context = (
+            context if context is not None else FileLikeContext.get(False, False)
+        )
+        return file_like
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickling (e.g. to send file-like objects to worker processes) neither
+        # expands the path again nor checks whether the object still exists
+        return (type(self)._from_trusted_path, (self._path, self._stat, self._context))
 
     @property
     def path(self) -> str:
         """
         The maximally expanded path of the file-like object.
+
+        The path is expanded once when the object is created.
         """
-        return expand_path(
-            self._path, expand_user=self.expand_user, expand_vars=self.expand_vars
-        )
+        return self._path
+
+    @property
+    def expand_user(self) -> bool:
+        """
+        Whether ~ was expanded in the path of the file-like object.
+        """
+        return self._context.expand_user
+
+    @property
+    def expand_vars(self) -> bool:
+        """
+        Whether environment variables were expanded in the path of the file-like object.
+        """
+        return self._context.expand_vars
 
     @property
     def relative_path(self) -> str:
@@ -28,6 +192,34 @@ class FileLike(ABC):
 
     relpath = relative_path
 
+    def stat(self, cached: bool = True) -> os.stat_result:
+        """
+        The stat result of this file-like object.
+
+        The stat result is captured on first access and reused afterwards, so all
+        metadata properties (size, access time, modification time etc.) together
+        cost at most one system call. Symbolic links are not followed.
+
+        :param cached: Whether to reuse a previously captured stat result. If this is
+            False, the file-like object is stat-ed again and the result is cached.
+        :return: The stat result.
+        """
+        if self._stat is None or not cached:
+            self._stat = os.stat(self.path, follow_symlinks=False)
+        return self._stat
+
+    def refresh(self: TFileLike) -> TFileLike:
+        """
+        Discard the cached stat result of this file-like object.
+
+        Metadata accessed after calling this method will reflect the current state
+        of the filesystem.
+
+        :return: This file-like object.
+        """
+        self._stat = None
+        return self
+
     @property
     def name(self) -> str:
         return base_name(self.path)
@@ -1,5 +1,5 @@
 import os
-from typing import Union, cast
+from typing import Tuple, Union, cast
 
 from fluentfs.exceptions.exceptions import FluentFsException
 from fluentfs.filelike.dir import Dir
@@ -31,7 +31,19 @@ def _file_like_from_path(path: str) -> FileLike:
     )  # pragma: no cover
 
 
+def _read_link(path: str) -> str:
+    # Relative targets are relative to the directory containing the link
+    return os.path.join(os.path.dirname(path), os.readlink(path))
+
+
+def _inode(path: str) -> Tuple[int, int]:
+    stat = os.lstat(path)
+    return stat.st_dev, stat.st_ino
+
+
 class SymLink(FileLike):
+    __slots__ = ()
+
     def __init__(
         self, path: str, expand_user: bool = True, expand_vars: bool = True
     ) -> None:
@@ -48,8 +60,7 @@ class SymLink(FileLike):
         For example if you have a symbolic link c.txt pointing to b.txt, which in turn
         points to a.txt, then this property will return b.txt and *NOT* a.txt.
         """
-        target_path = os.readlink(self.path)
-        return _file_like_from_path(target_path)
+        return _file_like_from_path(_read_link(self.path))
 
     @property
     def final_target(self) -> Union[File, Dir]:
@@ -58,10 +69,19 @@ class SymLink(FileLike):
 
         For example if you have a symbolic link c.txt pointing to b.txt, which in turn
         points to a.txt, then this property will return a.txt and *NOT* b.txt.
+
+        If the chain of symbolic links contains a cycle, a FluentFsException is raised.
         """
-        target_path = os.readlink(self.path)
+        # Links are identified by their inodes, since the paths of relative links
+        # (like "./a") keep growing when following a cycle
+        visited = {_inode(self.path)}
+        target_path = _read_link(self.path)
         while symlink_exists(target_path):
-            target_path = os.readlink(target_path)
+            inode = _inode(target_path)
+            if inode in visited:
+                raise FluentFsException(f"The symbolic link {self.path} is a cycle")
+            visited.add(inode)
+            target_path = _read_link(target_path)
         return cast(Union[File, Dir], _file_like_from_path(target_path))
 
     def __repr__(self) -> str:
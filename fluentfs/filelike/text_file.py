@@ -1,12 +1,83 @@
+import asyncio
+import io
+import os
+import re
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from fluentfs.common.aio import deferred, iterate_async
+from fluentfs.common.byte_ranges import ByteRange, open_range, split_lines
 from fluentfs.common.functional import FunctionalIterator
+from fluentfs.common.newlines import (
+    LineDecodeError,
+    count_lines,
+    count_newlines,
+    decode_lines,
+    is_ascii_compatible,
+)
+from fluentfs.common.parallel import parallel_map
 from fluentfs.common.s import chomp, is_empty
+from fluentfs.common.text_counts import count_chars, count_words
 from fluentfs.exceptions.exceptions import FluentFsException
+from fluentfs.filelike.content_cache import ContentCache
 from fluentfs.filelike.file_iterator import File
+from fluentfs.filelike.file_like import FileLikeContext
+from fluentfs.filelike.text_stats import TextStats, TextStatsCounter, stats_metrics
+from fluentfs.search.grep import compile_pattern
+
+R = TypeVar("R")
+
+# The minimum size of a byte range processed by a single worker
+MIN_RANGE_SIZE = 1 << 20
+
+
+class RangeTask(NamedTuple):
+    """
+    A byte range of a text file to be processed by a worker, together with the
+    argument of the processing function (like the requested metrics).
+    """
+
+    file: "TextFile"
+    byte_range: ByteRange
+    arg: Any
+
+
+# The result of processing a byte range, and whether the whole range could be decoded
+RangeResult = Tuple[R, bool]
+
+
+def _until_incomplete(results: Iterable[RangeResult[R]]) -> Iterator[R]:
+    # Like lines, the ranges end before the first line that cannot be decoded
+    for value, complete in results:
+        yield value
+        if not complete:
+            return
 
 
 class TextFile(File):
+    __slots__ = ()
+
     def __init__(
-        self, path: str, encoding: str = "utf-8", raise_on_decode_error: bool = True
+        self,
+        path: str,
+        encoding: str = "utf-8",
+        raise_on_decode_error: bool = True,
+        line_len_limit: Optional[int] = None,
+        content_cache: Optional[ContentCache] = None,
     ) -> None:
         """
         Initialize a new TextFile from a path.
@@ -18,11 +89,64 @@ class TextFile(File):
             if you are iterating over a directory where some files are in a different
             encoding, and you want to simply ignore these files.
         :param encoding: The encoding. This is assumed to be UTF-8 by default.
+        :param line_len_limit: The maximum length of a line (without the newline). If
+            a line of this file is longer, iterating over its lines raises a
+            FluentFsException instead of reading the whole line into memory. By
+            default, lines can have any length.
+        :param content_cache: The cache to keep the decoded content of this file in.
+            If this is given, the file is read once, and content, lines, words etc.
+            are served from the cache until the file changes (except the lines of a
+            file with a line_len_limit, which are always read from the file). By
+            default, the file is read again for every property.
         """
         super().__init__(path)
 
-        self.encoding = encoding
-        self.raise_on_decode_error = raise_on_decode_error
+        self._context = FileLikeContext.get(
+            True, True, encoding, raise_on_decode_error, line_len_limit, content_cache
+        )
+
+    @property
+    def encoding(self) -> str:
+        """
+        The encoding of this file.
+        """
+        return self._context.encoding
+
+    @property
+    def raise_on_decode_error(self) -> bool:
+        """
+        Whether to raise an exception in case of a decoding error.
+        """
+        return self._context.raise_on_decode_error
+
+    @property
+    def line_len_limit(self) -> Optional[int]:
+        """
+        The maximum length of a line of this file, if any.
+        """
+        return self._context.line_len_limit
+
+    @property
+    def content_cache(self) -> Optional[ContentCache]:
+        """
+        The cache for the content of this file, if any.
+        """
+        return self._context.content_cache
+
+    def _decode_error(self, e: UnicodeDecodeError) -> FluentFsException:
+        return FluentFsException(
+            f"Cannot decode file at {self.path} using {self.encoding} encoding. "
+            f"The following exception occurred: {str(e)}"
+        )
+
+    def _line_decode_error(
+        self, e: LineDecodeError, line_no: Optional[int] = None
+    ) -> FluentFsException:
+        position = f" in line {line_no}" if line_no is not None else ""
+        return FluentFsException(
+            f"Cannot decode file at {self.path} using {self.encoding} encoding"
+            f"{position} ({e})"
+        )
 
     @property
     def content(self) -> str:
@@ -31,17 +155,70 @@ class TextFile(File):
 
         :return: The content.
         """
-        with open(str(self.path), "r", encoding=self.encoding) as file:
-            try:
+        try:
+            return self._read_content()
+        except UnicodeDecodeError as e:
+            if self.raise_on_decode_error:
+                raise self._decode_error(e)
+            else:
+                return ""
+
+    def _read_content(self) -> str:
+        cache = self.content_cache
+        if cache is None:
+            with open(str(self.path), "r", encoding=self.encoding) as file:
                 return file.read()
-            except UnicodeDecodeError as e:
-                if self.raise_on_decode_error:
-                    raise FluentFsException(
-                        f"Cannot decode file at {self.path} using {self.encoding} encoding. "
-                        f"The following exception occurred: {str(e)}"
-                    )
-                else:
-                    return ""
+
+        # The stat result is not taken from the stat cache, so that changes of the
+        # file are noticed
+        stat_result = os.stat(self.path)
+        key = (self.path, stat_result.st_mtime_ns, stat_result.st_size, self.encoding)
+        content = cache.get(key)
+        if content is None:
+            with open(str(self.path), "r", encoding=self.encoding) as file:
+                content = file.read()
+            cache.put(key, content, stat_result.st_size)
+        return content
+
+    def _file_lines(self) -> Iterator[str]:
+        # The lines including their newlines (see decode_lines)
+        if self.content_cache is not None and self.line_len_limit is None:
+            try:
+                content = self._read_content()
+            except UnicodeDecodeError:
+                # Reading the file again reports the position of the error
+                pass
+            else:
+                yield from io.StringIO(content)
+                return
+        with open(self.path, "rb") as file:
+            yield from decode_lines(file, self.encoding, self.line_len_limit)
+
+    def _range_lines(self, byte_range: ByteRange) -> Iterator[str]:
+        with open_range(self.path, byte_range) as file:
+            yield from decode_lines(
+                file, self.encoding, self.line_len_limit, byte_range.start
+            )
+
+    async def aread(self, executor: Optional[Executor] = None) -> str:
+        """
+        Read the content of this file from a coroutine without blocking the event loop.
+
+        :param executor: The executor to read the file on. By default, this is the
+            default executor of the event loop.
+        :return: The content.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, lambda: self.content)
+
+    def _count(self, count: Callable[[str, str], int]) -> int:
+        # Files that cannot be decoded are treated as empty, like by content
+        try:
+            return count(str(self.path), self.encoding)
+        except UnicodeDecodeError as e:
+            if self.raise_on_decode_error:
+                raise self._decode_error(e)
+            return 0
 
     @property
     def char_count(self) -> int:
@@ -50,9 +227,16 @@ class TextFile(File):
 
         This is similar to `wc -m $FILENAME`.
 
+        The file is read in chunks, so the memory usage does not depend on the size
+        of the file (unless the content is taken from the content cache). If the
+        encoding is ASCII-compatible, only the chunks containing non-ASCII bytes are
+        decoded.
+
         :return: The number of characters.
         """
-        return len(self.content)
+        if self.content_cache is not None:
+            return len(self.content)
+        return self._count(count_chars)
 
     cc = char_count
 
@@ -74,41 +258,92 @@ class TextFile(File):
 
         This is similar to `wc -w $FILENAME`.
 
+        The file is read in chunks, so the memory usage does not depend on the size
+        of the file (unless the content is taken from the content cache).
+
         :return: The number of words.
         """
-        return self.words.len()
+        if self.content_cache is not None:
+            return self.words.len()
+        return self._count(count_words)
 
     wc = word_count
 
+    def _lines(self) -> Iterator[str]:
+        line_count = 0
+        try:
+            for line in self._file_lines():
+                line_count += 1
+                yield chomp(line)
+        except LineDecodeError as e:
+            if self.raise_on_decode_error:
+                raise self._line_decode_error(e, line_count + 1)
+
     @property
     def lines(self) -> FunctionalIterator[str]:
         """
         The lines of this file.
 
+        The lines are read lazily, i.e. the file is opened when the first line is
+        requested and closed after the last one, and only a small buffer is kept in
+        memory. Errors therefore occur while iterating: If the file cannot be decoded,
+        all lines before the line containing the offending bytes are returned before
+        a FluentFsException naming that line is raised (or, if raise_on_decode_error
+        is False, the lines simply end there).
+
         :return: A functional iterator containing the lines of this file.
         """
-        with open(str(self.path), "r", encoding=self.encoding) as file:
-            try:
-                return FunctionalIterator([chomp(line) for line in file.readlines()])
-            except UnicodeDecodeError as e:
-                if self.raise_on_decode_error:
-                    raise FluentFsException(
-                        f"Cannot decode file at {self.path} using {self.encoding} encoding. "
-                        f"The following exception occurred: {str(e)}"
-                    )
-                else:
-                    return FunctionalIterator([])
+        return FunctionalIterator(self._lines())
+
+    def alines(
+        self,
+        batch_size: int = 1024,
+        max_batches: int = 4,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[str]:
+        """
+        The lines of this file as an asynchronous iterator.
+
+        The file is read on an executor, so the event loop is not blocked.
+
+        :param batch_size: The number of lines passed to the event loop at once.
+        :param max_batches: The maximum number of batches that are buffered.
+        :param executor: The executor to read the file on. By default, this is the
+            default executor of the event loop.
+        :return: An asynchronous iterator containing the lines of this file.
+        """
+        return iterate_async(
+            deferred(lambda: self.lines), batch_size, max_batches, executor
+        )
 
     @property
     def line_count(self) -> int:
         """
         The number of lines of this file.
 
-        This is similar to `wc -l $FILENAME`.
+        This is similar to `wc -l $FILENAME`, except that a final line without a
+        trailing newline is counted as well (i.e. this is the number of items of
+        lines).
+
+        If the encoding is ASCII-compatible (like UTF-8 or Latin-1), the newline bytes
+        are counted in binary mode without decoding the text, which is much faster
+        than iterating over the lines. The file is still checked to be valid in its
+        encoding, and the line_len_limit does not apply, since no line is kept in
+        memory. If the file cannot be decoded, the lines are read to find the
+        offending line, so (just like for the other line-based properties) either a
+        FluentFsException naming that line is raised or, if raise_on_decode_error is
+        False, the lines before it are counted. If this file has a content cache,
+        the lines are counted in the cached content instead.
 
         :return: The number of lines.
         """
-        return self.lines.len()
+        cached = self.content_cache is not None and self.line_len_limit is None
+        if cached or not is_ascii_compatible(self.encoding):
+            return self.lines.len()
+        try:
+            return count_lines(self.path, self.encoding)
+        except UnicodeDecodeError:
+            return self.lines.len()
 
     lc = line_count
 
@@ -148,8 +383,195 @@ class TextFile(File):
     def non_empty_line_count(self) -> int:
         return self.non_empty_lines.len()
 
+    def byte_ranges(self, range_size: int) -> List[ByteRange]:
+        """
+        Split this file into byte ranges of complete lines, which can be processed
+        independently (see split_lines).
+
+        Only files with an ASCII-compatible encoding are split, since the lines of
+        other files cannot be found without decoding them.
+
+        :param range_size: The approximate size of a range.
+        :return: The ranges (at least one).
+        """
+        if range_size < 1:
+            raise FluentFsException(f"Invalid range size {range_size}")
+        if not is_ascii_compatible(self.encoding):
+            return [ByteRange(0, self.byte_count)]
+        return split_lines(self.path, self.byte_count, range_size)
+
+    def _map_ranges(
+        self,
+        fun: Callable[[RangeTask], R],
+        arg: Any,
+        workers: int,
+        executor: Union[str, Executor],
+    ) -> List[R]:
+        if workers < 1:
+            raise FluentFsException(f"Invalid number of workers {workers}")
+        # Every worker gets (at least) one range
+        range_size = max(-(-self.byte_count // workers), MIN_RANGE_SIZE)
+        tasks = [RangeTask(self, r, arg) for r in self.byte_ranges(range_size)]
+        if len(tasks) == 1:
+            return [fun(tasks[0])]
+        return list(parallel_map(tasks, fun, workers, executor))
+
+    def _scan_range(self, byte_range: ByteRange, add: Callable[[str], None]) -> bool:
+        # Passes the lines of a range to add and returns whether the whole range could
+        # be decoded (otherwise, the lines before the offending line were passed)
+        try:
+            for line in self._range_lines(byte_range):
+                add(line)
+        except LineDecodeError as e:
+            if self.raise_on_decode_error:
+                raise self._line_decode_error(e)
+            return False
+        return True
+
+    def _range_stats(
+        self, byte_range: ByteRange, metric_set: FrozenSet[str]
+    ) -> RangeResult[TextStatsCounter]:
+        counter = TextStatsCounter(count_words="word_count" in metric_set)
+        if metric_set.issubset({"byte_count"}):
+            return counter, True
+        if metric_set.issubset({"line_count", "byte_count"}) and is_ascii_compatible(
+            self.encoding
+        ):
+            try:
+                newlines = count_newlines(self.path, self.encoding, *byte_range)
+                counter.line_count = newlines.line_count
+                return counter, True
+            except UnicodeDecodeError:
+                # The lines before the offending line are counted by decoding them
+                pass
+        return counter, self._scan_range(byte_range, counter.add)
+
+    @staticmethod
+    def _merged_stats(
+        results: Sequence[RangeResult[TextStatsCounter]],
+    ) -> TextStatsCounter:
+        total = TextStatsCounter()
+        for counter in _until_incomplete(results):
+            total.merge(counter)
+        return total
+
+    def stats(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        workers: int = 1,
+        executor: Union[str, Executor] = "thread",
+    ) -> TextStats:
+        """
+        Compute several statistics of this file in a single pass.
+
+        This is similar to `wc -lwmcL $FILENAME` and much faster than accessing
+        line_count, word_count, char_count etc. one after another, since the file is
+        read and decoded only once (and not at all if only the byte_count is
+        requested). The results are the same as those of the corresponding
+        properties, except that the max_line_len of an empty file is 0. If the file
+        cannot be decoded and raise_on_decode_error is False, the statistics are
+        those of the lines before the line containing the offending bytes (see
+        lines), so unlike the char_count and word_count properties (which treat such
+        a file as empty), the char_count and word_count are not 0.
+
+        With several workers, a big file is split into byte ranges of complete lines
+        (see byte_ranges), which are processed in parallel. Use threads if reading
+        the file is the bottleneck and processes if decoding it is. A content cache
+        is not used then.
+
+        :param metrics: The names of the metrics to compute (i.e. field names of
+            TextStats, like "line_count" or "word_count"). By default, all metrics
+            are computed.
+        :param workers: The number of workers.
+        :param executor: "thread" for a thread pool, "process" for a process pool or
+            an existing executor.
+        :return: The statistics. Metrics that were not requested are None.
+        """
+        metric_set = stats_metrics(metrics)
+        if workers != 1:
+            counters = self._map_ranges(range_stats, metric_set, workers, executor)
+            return self._merged_stats(counters).stats(metric_set, self.byte_count)
+
+        counter = TextStatsCounter(count_words="word_count" in metric_set)
+        if not metric_set.issubset({"byte_count"}):
+            try:
+                for line in self._file_lines():
+                    counter.add(line)
+            except LineDecodeError as e:
+                if self.raise_on_decode_error:
+                    raise self._line_decode_error(e, counter.line_count + 1)
+        return counter.stats(metric_set, self.byte_count)
+
+    def _range_grep_count(
+        self, byte_range: ByteRange, regex: "re.Pattern[str]"
+    ) -> RangeResult[int]:
+        match_count = 0
+
+        def add(line: str) -> None:
+            nonlocal match_count
+            if regex.search(chomp(line)) is not None:
+                match_count += 1
+
+        complete = self._scan_range(byte_range, add)
+        return match_count, complete
+
+    @staticmethod
+    def _merged_count(results: Sequence[RangeResult[int]]) -> int:
+        return sum(_until_incomplete(results))
+
+    def grep_count(
+        self,
+        pattern: "Union[str, re.Pattern[str]]",
+        literal: bool = False,
+        workers: int = 1,
+        executor: Union[str, Executor] = "thread",
+    ) -> int:
+        """
+        Count the lines of this file matching a pattern.
+
+        This is similar to `grep -c $PATTERN $FILENAME`. With several workers, a big
+        file is split into byte ranges of complete lines (see byte_ranges), which
+        are searched in parallel. If the file cannot be decoded and
+        raise_on_decode_error is False, only the lines before the line containing
+        the offending bytes are searched (see lines).
+
+        :param pattern: The regular expression (or compiled regular expression).
+        :param literal: Whether the pattern is a literal string instead of a regular
+            expression.
+        :param workers: The number of workers.
+        :param executor: "thread" for a thread pool, "process" for a process pool or
+            an existing executor.
+        :return: The number of matching lines.
+        """
+        regex = compile_pattern(pattern, literal)
+        counts = self._map_ranges(range_grep_count, regex, workers, executor)
+        return self._merged_count(counts)
+
     def __repr__(self) -> str:
         return f"TextFile({self.path})"
 
 
+def range_stats(task: RangeTask) -> RangeResult[TextStatsCounter]:
+    """
+    Compute the statistics of a byte range of a text file.
+
+    :param task: The range, with the set of requested metrics as argument.
+    :return: The counter and whether the whole range could be decoded. If it could
+        not (and raise_on_decode_error is False), the counter contains the lines
+        before the line containing the offending bytes.
+    """
+    return task.file._range_stats(task.byte_range, task.arg)
+
+
+def range_grep_count(task: RangeTask) -> RangeResult[int]:
+    """
+    Count the lines of a byte range of a text file matching a pattern.
+
+    :param task: The range, with the compiled pattern as argument.
+    :return: The number of matching lines and whether the whole range could be
+        decoded (see range_stats).
+    """
+    return task.file._range_grep_count(task.byte_range, task.arg)
+
+
 # Add attributes to File & FileIterator
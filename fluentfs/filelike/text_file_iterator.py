@@ -1,50 +1,291 @@
+import re
+from collections import deque
+from concurrent.futures import Executor
+from operator import attrgetter, methodcaller
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
 from fluentfs.common.functional import FunctionalIterator
+from fluentfs.common.parallel import parallel_map
 from fluentfs.filelike.file_iterator import FileIterator
-from fluentfs.filelike.text_file import TextFile
+from fluentfs.filelike.text_file import (
+    RangeTask,
+    TextFile,
+    range_grep_count,
+    range_stats,
+)
+from fluentfs.filelike.text_stats import TextStats, stats_metrics
+from fluentfs.search.grep import GrepMatch, compile_pattern, grep
+from fluentfs.search.multi_matcher import MultiMatcher, PatternMatch, find_any
+
+R = TypeVar("R")
+S = TypeVar("S")
+
+# The number of files sent to a worker at once by the map_* methods
+_CHUNKSIZE = 16
+
+# Files bigger than this are split into byte ranges by the map_* methods
+SPLIT_SIZE = 64 << 20
+
+
+def _merge_ranges(
+    results: Iterable[R],
+    range_counts: Deque[Tuple[TextFile, int]],
+    merge: Callable[[TextFile, List[R]], S],
+) -> Iterator[S]:
+    # The results of the ranges of a file are consecutive, and the number of ranges
+    # of a file is known before the results of its ranges are due
+    group: List[R] = []
+    for result in results:
+        group.append(result)
+        file, range_count = range_counts[0]
+        if len(group) == range_count:
+            range_counts.popleft()
+            yield merge(file, group)
+            group = []
 
 
 class TextFileIterator(FileIterator[TextFile]):
-    def map_char_count(self) -> FunctionalIterator[int]:
+    def _map_files(
+        self,
+        fun: Callable[[TextFile], S],
+        workers: int,
+        executor: Union[str, Executor],
+    ) -> FunctionalIterator[S]:
+        if workers == 1:
+            return self.map(fun)
+        return self.par_map(fun, workers, executor, chunksize=_CHUNKSIZE)
+
+    def _map_split(
+        self,
+        fun: Callable[[RangeTask], R],
+        arg: Any,
+        merge: Callable[[TextFile, List[R]], S],
+        workers: int,
+        executor: Union[str, Executor],
+        split_size: int,
+    ) -> FunctionalIterator[S]:
+        range_counts: Deque[Tuple[TextFile, int]] = deque()
+
+        def tasks() -> Iterator[RangeTask]:
+            for file in self:
+                byte_ranges = file.byte_ranges(split_size)
+                range_counts.append((file, len(byte_ranges)))
+                for byte_range in byte_ranges:
+                    yield RangeTask(file, byte_range, arg)
+
+        # Small files and the ranges of big files are processed by the same pool
+        results = parallel_map(tasks(), fun, workers, executor)
+        return FunctionalIterator(_merge_ranges(results, range_counts, merge))
+
+    def map_char_count(
+        self, workers: int = 1, executor: Union[str, Executor] = "process"
+    ) -> FunctionalIterator[int]:
         """
         Map the files to their character counts.
 
         Note that it is implicitly assumed that all the files are valid text files.
         This function is equivalent to map(lambda file: file.text_file().char_count).
 
+        :param workers: The number of workers. If this is greater than 1, the files
+            are processed in parallel (see FunctionalIterator.par_map).
+        :param executor: The kind of pool ("process" or "thread") or an executor.
         :return: A functional iterator containing the character counts.
         """
-        return self.map(lambda file: file.char_count)
+        return self._map_files(attrgetter("char_count"), workers, executor)
 
     map_cc = map_char_count
 
-    def map_word_count(self) -> FunctionalIterator[int]:
+    def map_word_count(
+        self, workers: int = 1, executor: Union[str, Executor] = "process"
+    ) -> FunctionalIterator[int]:
         """
         Map the files to their word counts.
 
         Note that it is implicitly assumed that all the files are valid text files.
         This function is equivalent to map(lambda file: file.text_file().word_count).
 
+        :param workers: The number of workers. If this is greater than 1, the files
+            are processed in parallel (see FunctionalIterator.par_map).
+        :param executor: The kind of pool ("process" or "thread") or an executor.
         :return: A functional iterator containing the word counts.
         """
-        return self.map(lambda file: file.word_count)
+        return self._map_files(attrgetter("word_count"), workers, executor)
 
     map_wc = map_word_count
 
-    def map_line_count(self) -> FunctionalIterator[int]:
+    def map_line_count(
+        self,
+        workers: int = 1,
+        executor: Union[str, Executor] = "process",
+        split_size: int = SPLIT_SIZE,
+    ) -> FunctionalIterator[int]:
         """
         Map the files to their line counts.
 
         Note that it is implicitly assumed that all the files are valid text files.
         This function is equivalent to map(lambda file: file.text_file().line_count).
 
+        :param workers: The number of workers. If this is greater than 1, the files
+            are processed in parallel (see FunctionalIterator.par_map).
+        :param executor: The kind of pool ("process" or "thread") or an executor.
+        :param split_size: With several workers, files bigger than this (in bytes)
+            are split into byte ranges of about this size, which are processed in
+            parallel (see TextFile.byte_ranges).
         :return: A functional iterator containing the line counts.
         """
-        return self.map(lambda file: file.line_count)
+        if workers == 1:
+            return self.map(attrgetter("line_count"))
+        return self._map_split(
+            range_stats,
+            frozenset({"line_count"}),
+            lambda file, counters: file._merged_stats(counters).line_count,
+            workers,
+            executor,
+            split_size,
+        )
 
     map_lc = map_line_count
 
-    def map_empty_line_count(self) -> FunctionalIterator[int]:
-        return self.map(lambda file: file.empty_line_count)
+    def map_empty_line_count(
+        self, workers: int = 1, executor: Union[str, Executor] = "process"
+    ) -> FunctionalIterator[int]:
+        return self._map_files(attrgetter("empty_line_count"), workers, executor)
+
+    def map_non_empty_line_count(
+        self, workers: int = 1, executor: Union[str, Executor] = "process"
+    ) -> FunctionalIterator[int]:
+        return self._map_files(attrgetter("non_empty_line_count"), workers, executor)
+
+    def map_stats(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        workers: int = 1,
+        executor: Union[str, Executor] = "process",
+        split_size: int = SPLIT_SIZE,
+    ) -> FunctionalIterator[TextStats]:
+        """
+        Map the files to their statistics, reading every file once.
+
+        Note that it is implicitly assumed that all the files are valid text files.
+        This function is equivalent to map(lambda file: file.text_file().stats(metrics)).
 
-    def map_non_empty_line_count(self) -> FunctionalIterator[int]:
-        return self.map(lambda file: file.non_empty_line_count)
+        :param metrics: The names of the metrics to compute (see TextFile.stats).
+        :param workers: The number of workers. If this is greater than 1, the files
+            are processed in parallel (see FunctionalIterator.par_map).
+        :param executor: The kind of pool ("process" or "thread") or an executor.
+        :param split_size: With several workers, files bigger than this (in bytes)
+            are split into byte ranges of about this size, which are processed in
+            parallel (see TextFile.byte_ranges).
+        :return: A functional iterator containing the statistics.
+        """
+        # Unknown metrics are reported right away instead of for the first file
+        metric_set = stats_metrics(metrics)
+        if workers == 1:
+            return self.map(methodcaller("stats", metric_set))
+        return self._map_split(
+            range_stats,
+            metric_set,
+            lambda file, counters: file._merged_stats(counters).stats(
+                metric_set, file.byte_count
+            ),
+            workers,
+            executor,
+            split_size,
+        )
+
+    def map_grep_count(
+        self,
+        pattern: "Union[str, re.Pattern[str]]",
+        literal: bool = False,
+        workers: int = 1,
+        executor: Union[str, Executor] = "process",
+        split_size: int = SPLIT_SIZE,
+    ) -> FunctionalIterator[int]:
+        """
+        Map the files to the numbers of their lines matching a pattern.
+
+        This function is equivalent to map(lambda file: file.grep_count(pattern)).
+
+        :param pattern: The regular expression (or compiled regular expression).
+        :param literal: Whether the pattern is a literal string instead of a regular
+            expression.
+        :param workers: The number of workers. If this is greater than 1, the files
+            are processed in parallel (see FunctionalIterator.par_map).
+        :param executor: The kind of pool ("process" or "thread") or an executor.
+        :param split_size: With several workers, files bigger than this (in bytes)
+            are split into byte ranges of about this size, which are processed in
+            parallel (see TextFile.byte_ranges).
+        :return: A functional iterator containing the numbers of matching lines.
+        """
+        regex = compile_pattern(pattern, literal)
+        if workers == 1:
+            return self.map(methodcaller("grep_count", regex))
+        return self._map_split(
+            range_grep_count,
+            regex,
+            lambda file, counts: file._merged_count(counts),
+            workers,
+            executor,
+            split_size,
+        )
+
+    def grep(
+        self,
+        pattern: "Union[str, re.Pattern[str]]",
+        literal: bool = False,
+        max_count: Optional[int] = None,
+        skip_binary: bool = True,
+    ) -> FunctionalIterator[GrepMatch]:
+        """
+        Search the lines of the files for a pattern.
+
+        This is similar to `grep -n $PATTERN $FILENAMES`. The files are read line by
+        line, and files that cannot match (because their raw bytes do not contain a
+        literal required by the pattern) are skipped without decoding them.
+
+        :param pattern: The regular expression (or compiled regular expression).
+        :param literal: Whether the pattern is a literal string instead of a regular
+            expression.
+        :param max_count: The maximum number of matches per file (e.g. 1 to only get
+            the first match of every file). By default, all matches are returned.
+        :param skip_binary: Whether to skip binary files, i.e. files with an
+            ASCII-compatible encoding containing a null byte at their beginning.
+        :return: A functional iterator containing the matches (with the file, line
+            number and line).
+        """
+        return FunctionalIterator(grep(self, pattern, literal, max_count, skip_binary))
+
+    def find_any(
+        self,
+        patterns: Union[Iterable[str], MultiMatcher],
+        first_only: bool = False,
+        skip_binary: bool = True,
+    ) -> FunctionalIterator[PatternMatch]:
+        """
+        Find the occurrences of many literal patterns in the files.
+
+        This is much faster than searching the files for every pattern, since every
+        file is scanned once for all patterns (see MultiMatcher). Files are read line
+        by line, so patterns spanning several lines are not found.
+
+        :param patterns: The patterns, or a MultiMatcher built from them (to reuse it
+            for several iterators).
+        :param first_only: Whether to only report the first occurrence of every
+            pattern in every file.
+        :param skip_binary: Whether to skip binary files, i.e. files with an
+            ASCII-compatible encoding containing a null byte at their beginning.
+        :return: A functional iterator containing the occurrences (with the file,
+            pattern, line number and column).
+        """
+        return FunctionalIterator(find_any(self, patterns, first_only, skip_binary))
@@ -0,0 +1,119 @@
+from typing import FrozenSet, Iterable, NamedTuple, Optional
+
+from fluentfs.common.s import chomp, is_empty
+from fluentfs.exceptions.exceptions import FluentFsException
+
+
+class TextStats(NamedTuple):
+    """
+    Statistics of a text file, named like the corresponding properties of TextFile.
+
+    Metrics that were not requested are None.
+    """
+
+    line_count: Optional[int] = None
+    empty_line_count: Optional[int] = None
+    non_empty_line_count: Optional[int] = None
+    word_count: Optional[int] = None
+    char_count: Optional[int] = None
+    byte_count: Optional[int] = None
+    max_line_len: Optional[int] = None
+
+
+def stats_metrics(metrics: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Check the names of requested metrics.
+
+    :param metrics: The names of the metrics (i.e. field names of TextStats). If
+        this is None, all metrics are requested.
+    :return: The names of the metrics.
+    """
+    if metrics is None:
+        return frozenset(TextStats._fields)
+
+    metric_set = frozenset(metrics)
+    unknown = metric_set.difference(TextStats._fields)
+    if len(unknown) > 0:
+        raise FluentFsException(
+            f"Unknown metrics {sorted(unknown)} (available metrics are "
+            f"{list(TextStats._fields)})"
+        )
+    return metric_set
+
+
+class TextStatsCounter:
+    """
+    Computes the statistics of a text from its lines in a single pass.
+    """
+
+    __slots__ = (
+        "count_words",
+        "line_count",
+        "empty_line_count",
+        "word_count",
+        "char_count",
+        "max_line_len",
+    )
+
+    def __init__(self, count_words: bool = True) -> None:
+        """
+        Initialize a new TextStatsCounter.
+
+        :param count_words: Whether to count the words (which is the most expensive
+            metric).
+        """
+        self.count_words = count_words
+        self.line_count = 0
+        self.empty_line_count = 0
+        self.word_count = 0
+        self.char_count = 0
+        self.max_line_len = 0
+
+    def add(self, line: str) -> None:
+        """
+        Add the next line of the text.
+
+        :param line: The line (including its newline, if any).
+        """
+        self.line_count += 1
+        self.char_count += len(line)
+        if self.count_words:
+            self.word_count += len(line.split())
+        content = chomp(line)
+        if is_empty(content):
+            self.empty_line_count += 1
+        if len(content) > self.max_line_len:
+            self.max_line_len = len(content)
+
+    def merge(self, other: "TextStatsCounter") -> None:
+        """
+        Add the counts of the lines added to another counter.
+
+        :param other: The other counter.
+        """
+        self.line_count += other.line_count
+        self.empty_line_count += other.empty_line_count
+        self.word_count += other.word_count
+        self.char_count += other.char_count
+        self.max_line_len = max(self.max_line_len, other.max_line_len)
+
+    def stats(self, metrics: FrozenSet[str], byte_count: int) -> TextStats:
+        """
+        Get the statistics of the lines added so far.
+
+        :param metrics: The requested metrics.
+        :param byte_count: The number of bytes of the text.
+        :return: The statistics.
+        """
+        values = {
+            "line_count": self.line_count,
+            "empty_line_count": self.empty_line_count,
+            "non_empty_line_count": self.line_count - self.empty_line_count,
+            "word_count": self.word_count,
+            "char_count": self.char_count,
+            "byte_count": byte_count,
+            "max_line_len": self.max_line_len,
+        }
+        return TextStats(
+            **{name: value for name, value in values.items() if name in metrics}
+        )
@@ -0,0 +1,9 @@
+from fluentfs.index.dir_index import DirIndex
+from fluentfs.index.live_index import LiveIndex
+
+__all__ = [
+    # dir_index
+    "DirIndex",
+    # live_index
+    "LiveIndex",
+]
@@ -0,0 +1,376 @@
+import os
+import sqlite3
+import stat
+import threading
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, cast
+
+from fluentfs.common.functional import FunctionalIterator
+from fluentfs.exceptions.exceptions import FluentFsException
+from fluentfs.filelike.dir import Dir
+from fluentfs.filelike.file import File
+from fluentfs.filelike.file_iterator import FileIterator
+from fluentfs.filelike.file_like import FileLike
+from fluentfs.paths.paths import FileLikeKind, expand_path
+from fluentfs.walk.walker import is_sub_path, scan_dir
+from fluentfs.watch.event import ChangeEvent, ChangeKind
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    kind INTEGER NOT NULL,
+    mode INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    dev INTEGER NOT NULL,
+    nlink INTEGER NOT NULL,
+    uid INTEGER NOT NULL,
+    gid INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    atime_ns INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    blocks INTEGER
+);
+CREATE INDEX IF NOT EXISTS entries_parent ON entries (parent);
+"""
+
+_STAT_COLUMNS = (
+    "mode, ino, dev, nlink, uid, gid, size, atime_ns, mtime_ns, ctime_ns, blocks"
+)
+
+# The number of allocated blocks is not reported on every platform (e.g. Windows)
+StatRow = Tuple[int, int, int, int, int, int, int, int, int, int, Optional[int]]
+
+_INT64_LIMIT = 2**63
+
+# The number of rows fetched at once by a query
+_FETCH_SIZE = 1000
+
+
+def _to_int64(value: int) -> int:
+    # Inode and device numbers are unsigned 64-bit integers, but SQLite only stores
+    # signed ones
+    return value - 2 * _INT64_LIMIT if value >= _INT64_LIMIT else value
+
+
+def _from_int64(value: int) -> int:
+    return value + 2 * _INT64_LIMIT if value < 0 else value
+
+
+def _stat_to_row(stat_result: os.stat_result) -> StatRow:
+    return (
+        stat_result.st_mode,
+        _to_int64(stat_result.st_ino),
+        _to_int64(stat_result.st_dev),
+        stat_result.st_nlink,
+        stat_result.st_uid,
+        stat_result.st_gid,
+        stat_result.st_size,
+        stat_result.st_atime_ns,
+        stat_result.st_mtime_ns,
+        stat_result.st_ctime_ns,
+        getattr(stat_result, "st_blocks", None),
+    )
+
+
+def _stat_from_row(row: StatRow) -> os.stat_result:
+    mode, ino, dev, nlink, uid, gid, size, atime_ns, mtime_ns, ctime_ns, blocks = row
+    times_ns = (atime_ns, mtime_ns, ctime_ns)
+    return os.stat_result(
+        (mode, _from_int64(ino), _from_int64(dev), nlink, uid, gid, size)
+        + tuple(time_ns // 10**9 for time_ns in times_ns)
+        + tuple(time_ns / 10**9 for time_ns in times_ns)
+        + times_ns,
+        # Platform-specific fields are passed by name
+        {"st_blocks": blocks},
+    )
+
+
+def _sub_path_range(path: str) -> Tuple[str, str]:
+    # All paths below path lie in this (half-open) range of strings
+    prefix = path if path.endswith(os.sep) else path + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+def _file_likes(rows: Iterable[Tuple[Any, ...]]) -> Iterator[FileLike]:
+    for path, kind, *stat_row in rows:
+        cls = Dir if kind == FileLikeKind.DIR.value else File
+        yield cls._from_trusted_path(path, _stat_from_row(tuple(stat_row)))
+
+
+class DirIndex:
+    def __init__(
+        self,
+        dir_path: str,
+        index_path: str,
+        expand_user: bool = True,
+        expand_vars: bool = True,
+    ) -> None:
+        """
+        Initialize a new DirIndex of the directory tree rooted at dir_path.
+
+        The index stores the stat information of every (regular) file and directory
+        of the tree in an SQLite database at index_path, which persists across runs.
+        Queries against the index don't touch the filesystem at all, and their rows
+        are fetched in batches while they are consumed (by any thread, e.g. with
+        aiter). The file-like objects returned by the index serve the indexed stat
+        information until they are refreshed.
+
+        The index is empty until it is refreshed for the first time. Note that an
+        index only reflects the state of the tree at its last refresh.
+
+        If the database at index_path already contains an index of a different
+        directory, a FluentFsException is raised.
+
+        :param dir_path: The path of the root directory.
+        :param index_path: The path of the database (e.g. "index.db").
+        :param expand_user: Whether to expand ~ and ~user constructions in the paths.
+        :param expand_vars: Whether to expand shell variables in the paths.
+        """
+        self.dir = Dir(dir_path, expand_user, expand_vars)
+        self.index_path = expand_path(index_path, expand_user, expand_vars)
+        # Queries may be consumed by other threads (e.g. by aiter), so the connection
+        # is shared between threads, and every use of it holds the lock
+        self.connection = sqlite3.connect(self.index_path, check_same_thread=False)
+        self.lock = threading.Lock()
+
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            self._migrate()
+            self.connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('root', ?)",
+                (self.dir.path,),
+            )
+        (root,) = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'root'"
+        ).fetchone()
+        if root != self.dir.path:
+            self.connection.close()
+            raise FluentFsException(f"{self.index_path} is an index of {root}")
+
+    def _migrate(self) -> None:
+        columns = [
+            row[1] for row in self.connection.execute("PRAGMA table_info(entries)")
+        ]
+        if "blocks" not in columns:
+            # Indexes created before the number of allocated blocks was stored are
+            # emptied, so that the next refresh stats every entry again
+            self.connection.execute("ALTER TABLE entries ADD COLUMN blocks INTEGER")
+            self.connection.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """
+        Close the database of this index.
+        """
+        with self.lock:
+            self.connection.close()
+
+    def __enter__(self) -> "DirIndex":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _remove(self, path: str) -> None:
+        # Removes an entry and everything below it
+        low, high = _sub_path_range(path)
+        self.connection.execute(
+            "DELETE FROM entries WHERE path = ? OR (path >= ? AND path < ?)",
+            (path, low, high),
+        )
+
+    def _upsert(
+        self,
+        path: str,
+        parent: Optional[str],
+        kind: FileLikeKind,
+        stat_result: os.stat_result,
+    ) -> None:
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO entries (path, parent, kind, {_STAT_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, parent, kind.value) + _stat_to_row(stat_result),
+        )
+
+    def _indexed_children(self, path: str) -> List[Tuple[str, int]]:
+        return self.connection.execute(
+            "SELECT path, kind FROM entries WHERE parent = ?", (path,)
+        ).fetchall()
+
+    def _relist(self, path: str) -> List[str]:
+        """
+        Replace the indexed children of a directory by its current children.
+
+        :param path: The path of the directory.
+        :return: The paths of the subdirectories.
+        """
+        listing = scan_dir(path, sort=False)
+        if listing is None:
+            # The directory cannot be listed, so it is not part of the tree (just
+            # like in a walk)
+            self._remove(path)
+            return []
+
+        dir_entries, file_entries = listing
+        kinds = {entry.path: FileLikeKind.DIR.value for entry in dir_entries}
+        kinds.update((entry.path, FileLikeKind.FILE.value) for entry in file_entries)
+        for child_path, kind in self._indexed_children(path):
+            if kinds.get(child_path) != kind:
+                self._remove(child_path)
+
+        for entry in file_entries:
+            try:
+                stat_result = entry.stat(follow_symlinks=False)
+            except OSError:
+                # The file vanished after the listing
+                continue
+            self._upsert(entry.path, path, FileLikeKind.FILE, stat_result)
+        return [entry.path for entry in dir_entries]
+
+    def _refresh_dir(self, path: str, parent: Optional[str], full: bool) -> List[str]:
+        """
+        Refresh the index of a directory.
+
+        :return: The paths of the subdirectories that need to be refreshed as well.
+        """
+        try:
+            stat_result = os.stat(path, follow_symlinks=False)
+        except OSError:
+            self._remove(path)
+            return []
+
+        row = self.connection.execute(
+            "SELECT mtime_ns FROM entries WHERE path = ?", (path,)
+        ).fetchone()
+        # The directory is stat'ed before it is listed, so changes made during the
+        # listing lead to a different mtime on the next refresh
+        self._upsert(path, parent, FileLikeKind.DIR, stat_result)
+        if full or row is None or row[0] != stat_result.st_mtime_ns:
+            return self._relist(path)
+        return [
+            child_path
+            for child_path, kind in self._indexed_children(path)
+            if kind == FileLikeKind.DIR.value
+        ]
+
+    def refresh(self, full: bool = False) -> "DirIndex":
+        """
+        Bring this index up to date with the directory tree.
+
+        The refresh is incremental: only directories whose modification time changed
+        since the last refresh are listed again, all other directories are only
+        stat'ed. Note that modifying a file in place does not change the modification
+        time of its directory, so the index keeps the old stat information of such a
+        file. Pass full=True to list all directories and stat all files again.
+
+        :param full: Whether to list all directories regardless of their
+            modification times.
+        :return: This index.
+        """
+        with self.lock, self.connection:
+            self._refresh_tree(self.dir.path, None, full)
+        return self
+
+    def _refresh_tree(self, path: str, parent: Optional[str], full: bool) -> None:
+        pending: List[Tuple[str, Optional[str]]] = [(path, parent)]
+        while len(pending) != 0:
+            path, parent = pending.pop()
+            sub_dir_paths = self._refresh_dir(path, parent, full)
+            pending.extend((sub_dir_path, path) for sub_dir_path in sub_dir_paths)
+
+    def _reindex(self, path: str) -> None:
+        if not is_sub_path(path, self.dir.path):
+            return
+        parent = os.path.dirname(path) if path != self.dir.path else None
+        try:
+            stat_result = os.stat(path, follow_symlinks=False)
+        except OSError:
+            self._remove(path)
+            return
+
+        if stat.S_ISDIR(stat_result.st_mode):
+            self._refresh_tree(path, parent, False)
+            return
+        # Removes everything below path if it was a directory before
+        self._remove(path)
+        if stat.S_ISREG(stat_result.st_mode):
+            self._upsert(path, parent, FileLikeKind.FILE, stat_result)
+
+    def apply(self, events: Iterable[ChangeEvent]) -> "DirIndex":
+        """
+        Apply changes of the directory tree to this index.
+
+        Only the changed files and directories are read again. This keeps the index up
+        to date without refreshing it, e.g.
+
+            with fs.Dir(dir_path).watch() as watcher:
+                while True:
+                    index.apply(watcher.read())
+
+        :param events: The changes (see Dir.watch).
+        :return: This index.
+        """
+        with self.lock, self.connection:
+            for event in events:
+                if event.kind in (ChangeKind.DELETED, ChangeKind.MOVED):
+                    self._remove(event.path)
+                if event.kind == ChangeKind.MOVED:
+                    self._reindex(cast(str, event.dest_path))
+                elif event.kind != ChangeKind.DELETED:
+                    self._reindex(event.path)
+        return self
+
+    def _rows(self, kinds: Tuple[FileLikeKind, ...]) -> Iterator[Tuple[Any, ...]]:
+        # The rows are fetched in batches, so that huge indexes are streamed instead
+        # of being loaded into memory
+        placeholders = ", ".join("?" for _ in kinds)
+        with self.lock:
+            cursor = self.connection.execute(
+                f"SELECT path, kind, {_STAT_COLUMNS} FROM entries "
+                f"WHERE kind IN ({placeholders}) ORDER BY path",
+                tuple(kind.value for kind in kinds),
+            )
+        try:
+            while True:
+                with self.lock:
+                    rows = cursor.fetchmany(_FETCH_SIZE)
+                if len(rows) == 0:
+                    return
+                yield from rows
+        finally:
+            with self.lock:
+                cursor.close()
+
+    def _query(self, kinds: Tuple[FileLikeKind, ...]) -> Iterator[FileLike]:
+        return _file_likes(self._rows(kinds))
+
+    @property
+    def file_likes(self) -> FunctionalIterator[FileLike]:
+        """
+        An iterator of the indexed file-like objects (sorted by path).
+
+        :return: The iterator.
+        """
+        return FunctionalIterator(self._query((FileLikeKind.DIR, FileLikeKind.FILE)))
+
+    @property
+    def files(self) -> FileIterator:
+        """
+        An iterator of the indexed (regular) files (sorted by path).
+
+        :return: The iterator.
+        """
+        return FileIterator(self._query((FileLikeKind.FILE,)))
+
+    @property
+    def dirs(self) -> FunctionalIterator[Dir]:
+        """
+        An iterator of the indexed directories (sorted by path).
+
+        :return: The iterator.
+        """
+        return FunctionalIterator(cast(Iterator[Dir], self._query((FileLikeKind.DIR,))))
+
+    def __repr__(self) -> str:
+        return f'DirIndex("{self.dir.path}", "{self.index_path}")'
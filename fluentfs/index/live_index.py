@@ -0,0 +1,191 @@
+import os
+import stat
+from typing import Dict, Iterable, Iterator, Set, cast
+
+from fluentfs.common.functional import FunctionalIterator
+from fluentfs.filelike.dir import Dir
+from fluentfs.filelike.file import File
+from fluentfs.filelike.file_iterator import FileIterator
+from fluentfs.filelike.file_like import FileLike
+from fluentfs.walk.walker import is_sub_path, scan_dir
+from fluentfs.watch.event import ChangeEvent, ChangeKind
+from fluentfs.watch.watcher import Watcher
+
+
+def _file_like(path: str, stat_result: os.stat_result) -> FileLike:
+    if stat.S_ISDIR(stat_result.st_mode):
+        return Dir._from_trusted_path(path, stat_result)
+    return File._from_trusted_path(path, stat_result)
+
+
+class LiveIndex:
+    def __init__(self, watcher: Watcher) -> None:
+        """
+        Initialize a new LiveIndex of the directory tree watched by watcher.
+
+        The LiveIndex keeps the stat information of every (regular) file and
+        directory of the tree in memory and applies the changes reported by the
+        watcher before every query. Queries therefore only touch the disk for the
+        files and directories that changed since the last query.
+
+        How current the results are depends on the watcher. An InotifyWatcher
+        reports changes as soon as the kernel does. A PollingWatcher only walks the
+        tree every interval seconds (and not for every query), so the results may
+        lag behind the tree by up to one interval. Call update with a timeout to
+        wait for the next poll.
+
+        You will usually get a watcher by calling the watch method of a Dir object.
+
+        :param watcher: The watcher.
+        """
+        self.watcher = watcher
+        self.stats: Dict[str, os.stat_result] = {}
+        self.children: Dict[str, Set[str]] = {}
+        self._add(watcher.path)
+
+    def close(self) -> None:
+        """
+        Close the watcher of this index.
+        """
+        self.watcher.close()
+
+    def __enter__(self) -> "LiveIndex":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _link(self, path: str, stat_result: os.stat_result) -> None:
+        self.stats[path] = stat_result
+        if path != self.watcher.path:
+            self.children[os.path.dirname(path)].add(path)
+
+    def _add_tree(self, path: str, stat_result: os.stat_result) -> None:
+        pending = [(path, stat_result)]
+        while len(pending) != 0:
+            dir_path, dir_stat = pending.pop()
+            listing = scan_dir(dir_path, sort=False)
+            if listing is None:
+                continue
+            self._link(dir_path, dir_stat)
+            self.children.setdefault(dir_path, set())
+
+            dir_entries, file_entries = listing
+            for entry in file_entries + dir_entries:
+                try:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    # The entry vanished after the listing
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, entry_stat))
+                else:
+                    self._link(entry.path, entry_stat)
+
+    def _add(self, path: str) -> None:
+        # (Re-)reads a file or directory tree from the disk
+        if not is_sub_path(path, self.watcher.path):
+            return
+        parent_path = os.path.dirname(path)
+        if path != self.watcher.path and parent_path not in self.children:
+            # The parent is not known yet, so it is read together with path
+            self._add(parent_path)
+            return
+
+        self._discard(path)
+        try:
+            stat_result = os.stat(path, follow_symlinks=False)
+        except OSError:
+            return
+        if stat.S_ISDIR(stat_result.st_mode):
+            self._add_tree(path, stat_result)
+        elif stat.S_ISREG(stat_result.st_mode):
+            self._link(path, stat_result)
+
+    def _discard(self, path: str) -> None:
+        if path not in self.stats:
+            return
+        parent_children = self.children.get(os.path.dirname(path))
+        if parent_children is not None:
+            parent_children.discard(path)
+
+        pending = [path]
+        while len(pending) != 0:
+            discarded_path = pending.pop()
+            del self.stats[discarded_path]
+            pending.extend(self.children.pop(discarded_path, ()))
+
+    def apply(self, events: Iterable[ChangeEvent]) -> "LiveIndex":
+        """
+        Apply changes of the directory tree to this index.
+
+        This is done automatically before every query, you only need it to apply
+        changes reported by a different watcher.
+
+        :param events: The changes.
+        :return: This index.
+        """
+        for event in events:
+            if event.kind == ChangeKind.MOVED:
+                self._discard(event.path)
+                self._add(cast(str, event.dest_path))
+            elif event.kind == ChangeKind.DELETED:
+                self._discard(event.path)
+            else:
+                self._add(event.path)
+        return self
+
+    def update(self, timeout: float = 0) -> "LiveIndex":
+        """
+        Wait for changes of the directory tree and apply them to this index.
+
+        :param timeout: The maximum number of seconds to wait. By default, only the
+            changes that have already been reported are applied.
+        :return: This index.
+        """
+        return self.apply(self.watcher.read(timeout))
+
+    def _query(self, dirs: bool, files: bool) -> Iterator[FileLike]:
+        self.update()
+        # The index may change while the result is consumed
+        items = sorted(self.stats.items())
+        return (
+            _file_like(path, stat_result)
+            for path, stat_result in items
+            if (dirs if stat.S_ISDIR(stat_result.st_mode) else files)
+        )
+
+    @property
+    def file_likes(self) -> FunctionalIterator[FileLike]:
+        """
+        An iterator of the file-like objects currently present in the tree (sorted by
+        path).
+
+        :return: The iterator.
+        """
+        return FunctionalIterator(self._query(dirs=True, files=True))
+
+    @property
+    def files(self) -> FileIterator:
+        """
+        An iterator of the (regular) files currently present in the tree (sorted by
+        path).
+
+        :return: The iterator.
+        """
+        return FileIterator(self._query(dirs=False, files=True))
+
+    @property
+    def dirs(self) -> FunctionalIterator[Dir]:
+        """
+        An iterator of the directories currently present in the tree (sorted by
+        path).
+
+        :return: The iterator.
+        """
+        return FunctionalIterator(
+            cast(Iterator[Dir], self._query(dirs=True, files=False))
+        )
+
+    def __repr__(self) -> str:
+        return f'LiveIndex("{self.watcher.path}")'
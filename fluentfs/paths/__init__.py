@@ -1,6 +1,7 @@
 from fluentfs.paths.matches import (
     matches_base_path,
     matches_compiled_regex,
+    matches_expanded_base_path,
     matches_glob,
     matches_regex,
 )
@@ -24,6 +25,7 @@ __all__ = [
     # matches
     "matches_base_path",
     "matches_compiled_regex",
+    "matches_expanded_base_path",
     "matches_glob",
     "matches_regex",
     # paths
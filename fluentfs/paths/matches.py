@@ -49,9 +49,21 @@ def matches_base_path(path: str, base_paths: Union[str, List[str]]) -> bool:
     if isinstance(base_paths, str):
         base_paths = [base_paths]
 
-    path = expand_path(path)
-    base_paths = expand_paths(base_paths)
+    return matches_expanded_base_path(expand_path(path), expand_paths(base_paths))
 
+
+def matches_expanded_base_path(path: str, base_paths: List[str]) -> bool:
+    """
+    Check whether a path matches one of the given base paths.
+
+    This is the same as matches_base_path except that the path and the base paths
+    must already be maximally expanded. This is useful when checking many paths
+    against the same base paths (which can then be expanded only once).
+
+    :param path: The given maximally expanded path.
+    :param base_paths: A list of maximally expanded base paths.
+    :return: True, if the path matches one of the base paths, False otherwise.
+    """
     for base_path in base_paths:
         if os.path.commonpath([path, base_path]) == base_path:
             return True
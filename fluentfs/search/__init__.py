@@ -0,0 +1,21 @@
+from fluentfs.search.grep import (
+    GrepMatch,
+    compile_pattern,
+    grep,
+    is_binary_file,
+    required_literal,
+)
+from fluentfs.search.multi_matcher import MultiMatcher, PatternMatch, find_any
+
+__all__ = [
+    # grep
+    "GrepMatch",
+    "compile_pattern",
+    "grep",
+    "is_binary_file",
+    "required_literal",
+    # multi_matcher
+    "MultiMatcher",
+    "PatternMatch",
+    "find_any",
+]
@@ -0,0 +1,241 @@
+import re
+import warnings
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from fluentfs.common.newlines import CHUNK_SIZE, is_ascii_compatible
+from fluentfs.exceptions.exceptions import FluentFsException
+
+with warnings.catch_warnings():
+    # The parser of the re module is only deprecated as a public module
+    warnings.simplefilter("ignore", DeprecationWarning)
+    import sre_constants
+    import sre_parse
+
+if TYPE_CHECKING:
+    from fluentfs.filelike.text_file import TextFile
+
+
+class GrepMatch(NamedTuple):
+    """
+    A line of a text file matching a pattern.
+
+    The line number starts at 1, and the line does not contain its newline.
+    """
+
+    file: "TextFile"
+    line_no: int
+    line: str
+
+
+def _literal_runs(items: List[Any]) -> Iterator[str]:
+    run: List[str] = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+
+        # Everything else (character classes, alternatives etc.) ends the run
+        if len(run) > 0:
+            yield "".join(run)
+            run = []
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, _, sub_pattern = av
+            if not add_flags & sre_constants.SRE_FLAG_IGNORECASE:
+                yield from _literal_runs(sub_pattern.data)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] > 0:
+            yield from _literal_runs(av[2].data)
+    if len(run) > 0:
+        yield "".join(run)
+
+
+def required_literal(pattern: "re.Pattern[str]") -> Optional[str]:
+    """
+    Find a literal that every match of a regular expression contains.
+
+    Only the literals that are required in any case (i.e. that are not part of
+    alternatives, optional groups etc.) are taken into account, and the longest one
+    is returned.
+
+    :param pattern: The regular expression.
+    :return: The literal, or None if there is none (or the expression is case
+        insensitive).
+    """
+    # The flags of a compiled expression include its global inline flags
+    if pattern.flags & re.IGNORECASE:
+        return None
+    parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    return max(_literal_runs(parsed.data), key=len, default=None)
+
+
+def _is_binary(chunk: bytes) -> bool:
+    # Like grep, a file whose beginning contains a null byte is considered binary
+    return b"\0" in chunk
+
+
+def is_binary_file(file: "TextFile", chunk_size: int = CHUNK_SIZE) -> bool:
+    """
+    Check whether a text file is binary, like grep does.
+
+    A file is considered binary if its first chunk contains a null byte. Only files
+    with ASCII-compatible encodings can be checked (the bytes of other encodings,
+    like UTF-16, usually contain null bytes), so other files are never binary.
+
+    :param file: The file.
+    :param chunk_size: The number of bytes checked.
+    :return: True, if the file is binary, False otherwise.
+    """
+    if not is_ascii_compatible(file.encoding):
+        return False
+    with open(file.path, "rb") as f:
+        return _is_binary(f.read(chunk_size))
+
+
+def _may_match(
+    path: str, literal: Optional[bytes], skip_binary: bool, chunk_size: int
+) -> bool:
+    """
+    Check the raw bytes of a file before decoding it.
+
+    :return: False if the file is binary (and should be skipped) or does not
+        contain the literal, True otherwise.
+    """
+    if literal is None and not skip_binary:
+        return True
+
+    with open(path, "rb") as file:
+        chunk = file.read(chunk_size)
+        if skip_binary and _is_binary(chunk):
+            return False
+        if literal is None:
+            return True
+
+        # The end of the previous chunk is kept to find a literal spanning two chunks
+        overlap = len(literal) - 1
+        tail = b""
+        while len(chunk) > 0:
+            if literal in chunk or literal in tail + chunk[:overlap]:
+                return True
+            tail = (tail + chunk[-overlap:])[-overlap:] if overlap > 0 else b""
+            chunk = file.read(chunk_size)
+    return False
+
+
+class _Prefilter:
+    """
+    The required literal of a pattern, encoded like the files to search.
+    """
+
+    __slots__ = ("literal", "skip_binary", "chunk_size", "encoded")
+
+    def __init__(
+        self, literal: Optional[str], skip_binary: bool, chunk_size: int
+    ) -> None:
+        # A literal spanning several lines cannot match a single line anyway, and
+        # newlines are translated when the file is decoded
+        if literal is not None and ("\n" in literal or "\r" in literal):
+            literal = None
+        self.literal = literal
+        self.skip_binary = skip_binary
+        self.chunk_size = chunk_size
+        self.encoded: Dict[str, Optional[bytes]] = {}
+
+    def _encoded(self, encoding: str) -> Optional[bytes]:
+        if encoding not in self.encoded:
+            try:
+                literal = self.literal
+                self.encoded[encoding] = (
+                    literal.encode(encoding) if literal is not None else None
+                )
+            except UnicodeEncodeError:
+                # Files in this encoding are searched without prefiltering
+                self.encoded[encoding] = None
+        return self.encoded[encoding]
+
+    def may_match(self, file: "TextFile") -> bool:
+        # The bytes of other encodings (like UTF-16) cannot be searched for the
+        # literal, and they usually contain null bytes
+        if not is_ascii_compatible(file.encoding):
+            return True
+        return _may_match(
+            file.path, self._encoded(file.encoding), self.skip_binary, self.chunk_size
+        )
+
+
+def compile_pattern(
+    pattern: "Union[str, re.Pattern[str]]", literal: bool
+) -> "re.Pattern[str]":
+    """
+    Compile a search pattern.
+
+    :param pattern: The regular expression (or compiled regular expression).
+    :param literal: Whether the pattern is a literal string instead of a regular
+        expression.
+    :return: The compiled regular expression.
+    """
+    if isinstance(pattern, re.Pattern):
+        if literal:
+            raise FluentFsException("A compiled regular expression is not a literal")
+        return pattern
+    return re.compile(re.escape(pattern) if literal else pattern)
+
+
+def grep(
+    files: Iterable["TextFile"],
+    pattern: "Union[str, re.Pattern[str]]",
+    literal: bool = False,
+    max_count: Optional[int] = None,
+    skip_binary: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[GrepMatch]:
+    """
+    Search the lines of text files for a pattern.
+
+    Before a file is decoded, its raw bytes are searched for a literal that every
+    match has to contain (see required_literal), and files not containing it are
+    skipped. Binary files are skipped as well. Both checks only apply to files with
+    ASCII-compatible encodings.
+
+    :param files: The files to search.
+    :param pattern: The regular expression (or compiled regular expression).
+    :param literal: Whether the pattern is a literal string instead of a regular
+        expression.
+    :param max_count: The maximum number of matches per file (e.g. 1 to only get the
+        first match of every file). By default, all matches are returned.
+    :param skip_binary: Whether to skip binary files, i.e. files containing a null
+        byte in their first chunk.
+    :param chunk_size: The number of bytes read at once when checking the raw bytes.
+    :return: An iterator containing the matching lines.
+    """
+    # The pattern is compiled right away, so that errors are not deferred
+    regex = compile_pattern(pattern, literal)
+    prefilter = _Prefilter(required_literal(regex), skip_binary, chunk_size)
+    return _grep(files, regex, prefilter, max_count)
+
+
+def _grep(
+    files: Iterable["TextFile"],
+    regex: "re.Pattern[str]",
+    prefilter: _Prefilter,
+    max_count: Optional[int],
+) -> Iterator[GrepMatch]:
+    for file in files:
+        if max_count == 0 or not prefilter.may_match(file):
+            continue
+
+        match_count = 0
+        for line_no, line in enumerate(file.lines, 1):
+            if regex.search(line) is not None:
+                yield GrepMatch(file, line_no, line)
+                match_count += 1
+                if match_count == max_count:
+                    break
@@ -0,0 +1,168 @@
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Union,
+)
+
+from fluentfs.exceptions.exceptions import FluentFsException
+from fluentfs.search.grep import is_binary_file
+
+if TYPE_CHECKING:
+    from fluentfs.filelike.text_file import TextFile
+
+
+class MultiMatcher:
+    """
+    Finds all occurrences of many literal patterns in a single pass over a text.
+
+    The patterns are built into an Aho-Corasick automaton once, so the time needed to
+    scan a text does not depend on the number of patterns (only on the length of the
+    text and the number of occurrences). Build a matcher once and reuse it for all
+    texts.
+    """
+
+    __slots__ = ("_patterns", "_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """
+        Initialize a new MultiMatcher.
+
+        :param patterns: The patterns (duplicates are ignored).
+        """
+        self._patterns: List[str] = list(dict.fromkeys(patterns))
+        if any(len(pattern) == 0 for pattern in self._patterns):
+            raise FluentFsException("Patterns must not be empty")
+
+        # The trie of the patterns, where state 0 is the root
+        self._goto: List[Dict[str, int]] = [{}]
+        # The indices of the patterns ending in each state
+        self._out: List[Tuple[int, ...]] = [()]
+        for index, pattern in enumerate(self._patterns):
+            self._add(index, pattern)
+        self._fail = self._failure_links()
+
+    def _add(self, index: int, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._out.append(())
+            state = next_state
+        self._out[state] = self._out[state] + (index,)
+
+    def _failure_links(self) -> List[int]:
+        # The failure link of a state points to the state of its longest proper
+        # suffix in the trie. States are visited by depth, so the links of shorter
+        # suffixes are known when they are needed.
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while len(queue) > 0:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                suffix_state = fail[state]
+                while suffix_state != 0 and char not in self._goto[suffix_state]:
+                    suffix_state = fail[suffix_state]
+                fail[next_state] = self._goto[suffix_state].get(char, 0)
+                # Patterns ending in the suffix state end in this state as well
+                self._out[next_state] += self._out[fail[next_state]]
+        return fail
+
+    @property
+    def patterns(self) -> List[str]:
+        """
+        The patterns of this matcher.
+        """
+        return list(self._patterns)
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Find all occurrences of the patterns in a text.
+
+        Overlapping occurrences are found as well. The occurrences are ordered by their
+        end.
+
+        :param text: The text.
+        :return: An iterator containing the start indices of the occurrences together
+            with the patterns.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        patterns = self._patterns
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state != 0 and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in out[state]:
+                pattern = patterns[index]
+                yield end - len(pattern), pattern
+
+
+class PatternMatch(NamedTuple):
+    """
+    An occurrence of a pattern in a text file.
+
+    The line number starts at 1, and the column is the index of the first character
+    of the occurrence in the line.
+    """
+
+    file: "TextFile"
+    pattern: str
+    line_no: int
+    column: int
+
+
+def find_any(
+    files: Iterable["TextFile"],
+    patterns: Union[Iterable[str], MultiMatcher],
+    first_only: bool = False,
+    skip_binary: bool = True,
+) -> Iterator[PatternMatch]:
+    """
+    Find the occurrences of many literal patterns in text files.
+
+    Every file is read once, line by line, so patterns spanning several lines are
+    not found. Like grep, binary files are skipped (see is_binary_file).
+
+    :param files: The files to search.
+    :param patterns: The patterns, or a matcher built from them.
+    :param first_only: Whether to only report the first occurrence of every pattern
+        in every file.
+    :param skip_binary: Whether to skip binary files, i.e. files containing a null
+        byte in their first chunk.
+    :return: An iterator containing the occurrences.
+    """
+    matcher = patterns if isinstance(patterns, MultiMatcher) else MultiMatcher(patterns)
+    return _find_any(files, matcher, first_only, skip_binary)
+
+
+def _find_any(
+    files: Iterable["TextFile"],
+    matcher: MultiMatcher,
+    first_only: bool,
+    skip_binary: bool,
+) -> Iterator[PatternMatch]:
+    for file in files:
+        if skip_binary and is_binary_file(file):
+            continue
+
+        found: Set[str] = set()
+        for line_no, line in enumerate(file.lines, 1):
+            for column, pattern in matcher.find_all(line):
+                if first_only:
+                    if pattern in found:
+                        continue
+                    found.add(pattern)
+                yield PatternMatch(file, pattern, line_no, column)
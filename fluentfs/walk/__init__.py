@@ -0,0 +1,55 @@
+from fluentfs.walk.checkpoint import WalkCheckpoint
+from fluentfs.walk.ignore import (
+    IGNORE_FILE_NAMES,
+    IgnoreChain,
+    IgnoreRules,
+    load_ignore_chain,
+    translate_ignore_pattern,
+)
+from fluentfs.walk.parallel import ParallelWalker
+from fluentfs.walk.summary import WalkSummary, summarize
+from fluentfs.walk.usage import DiskUsage, allocated_size, dir_usage, disk_usage
+from fluentfs.walk.walker import (
+    STAT_FROM_LISTING,
+    ListedEntry,
+    Listing,
+    RootEntry,
+    TargetEntry,
+    WalkEntry,
+    Walker,
+    WalkIterator,
+    is_sub_path,
+    scan_dir,
+)
+
+__all__ = [
+    # checkpoint
+    "WalkCheckpoint",
+    # ignore
+    "IGNORE_FILE_NAMES",
+    "IgnoreChain",
+    "IgnoreRules",
+    "load_ignore_chain",
+    "translate_ignore_pattern",
+    # parallel
+    "ParallelWalker",
+    # summary
+    "WalkSummary",
+    "summarize",
+    # usage
+    "DiskUsage",
+    "allocated_size",
+    "dir_usage",
+    "disk_usage",
+    # walker
+    "STAT_FROM_LISTING",
+    "ListedEntry",
+    "Listing",
+    "RootEntry",
+    "TargetEntry",
+    "WalkEntry",
+    "Walker",
+    "WalkIterator",
+    "is_sub_path",
+    "scan_dir",
+]
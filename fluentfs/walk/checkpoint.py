@@ -0,0 +1,85 @@
+import json
+import os
+from typing import List, Optional, Tuple
+
+from fluentfs.exceptions.exceptions import FluentFsException
+
+CHECKPOINT_VERSION = 1
+
+
+class WalkCheckpoint:
+    """
+    The frontier of a walk, i.e. everything needed to continue the walk without
+    yielding any entry again.
+
+    pending contains the (path, depth) pairs of the directories that still need to be
+    visited, in the order of the pending queue of the walker. current is the
+    directory that was being visited as a (path, depth, position) triple, where the
+    position is None if nothing of the directory was yielded yet, "" if only the
+    directory itself was yielded and the name of the last yielded file otherwise.
+    """
+
+    __slots__ = ("root", "breadth_first", "sort", "pending", "current")
+
+    def __init__(
+        self,
+        root: str,
+        breadth_first: bool,
+        sort: bool,
+        pending: List[Tuple[str, int]],
+        current: Optional[Tuple[str, int, Optional[str]]],
+    ) -> None:
+        self.root = root
+        self.breadth_first = breadth_first
+        self.sort = sort
+        self.pending = pending
+        self.current = current
+
+    def save(self, path: str) -> None:
+        """
+        Save this checkpoint to a file.
+
+        The file is replaced atomically, so it always contains a complete checkpoint
+        (even if the process dies while saving).
+
+        :param path: The path of the checkpoint file.
+        """
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "root": self.root,
+            "breadth_first": self.breadth_first,
+            "sort": self.sort,
+            "pending": self.pending,
+            "current": self.current,
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", errors="surrogateescape") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str) -> Optional["WalkCheckpoint"]:
+        """
+        Load a checkpoint from a file.
+
+        :param path: The path of the checkpoint file.
+        :return: The checkpoint or None if the file does not exist.
+        """
+        try:
+            with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            raise FluentFsException(f"Invalid checkpoint file {path}: {e}")
+
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            raise FluentFsException(f"Unsupported checkpoint file {path}")
+        current = data["current"]
+        return WalkCheckpoint(
+            data["root"],
+            data["breadth_first"],
+            data["sort"],
+            [(path, depth) for path, depth in data["pending"]],
+            (current[0], current[1], current[2]) if current is not None else None,
+        )
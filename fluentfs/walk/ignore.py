@@ -0,0 +1,230 @@
+import os
+import re
+from typing import Iterable, List, Optional, Tuple
+
+IGNORE_FILE_NAMES = (".gitignore", ".ignore")
+
+
+def _translate_class(pattern: str, i: int) -> Tuple[str, int]:
+    # i is the index of the opening bracket
+    start = i + 1
+    j = pattern.find("]", start + 1)
+    if j == -1:
+        return re.escape("["), start
+
+    content = pattern[start:j].replace("\\", "\\\\")
+    if content[0] in "!^":
+        content = "^" + content[1:]
+    return f"[{content}]", j + 1
+
+
+def _translate_double_star(pattern: str, i: int) -> Optional[str]:
+    if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+        # Zero or more directories
+        return "(?:.*/)?"
+    if pattern.startswith("/**", i) and i + 3 == len(pattern):
+        # Everything inside a directory
+        return "/.*"
+    return None
+
+
+def translate_ignore_pattern(pattern: str) -> str:
+    """
+    Translate a gitignore glob pattern to a regular expression.
+
+    The pattern must already be stripped of negation, anchoring and a trailing
+    slash. The regular expression matches paths with "/" as separator.
+
+    :param pattern: The glob pattern.
+    :return: The regular expression (without capturing groups).
+    """
+    i, n, parts = 0, len(pattern), []
+    while i < n:
+        c = pattern[i]
+        double_star = _translate_double_star(pattern, i)
+        if double_star is not None:
+            parts.append(double_star)
+            i += 3
+        elif c == "*":
+            while i < n and pattern[i] == "*":
+                i += 1
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+            i += 1
+        elif c == "[":
+            part, i = _translate_class(pattern, i)
+            parts.append(part)
+        elif c == "\\" and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return "".join(parts)
+
+
+def _strip_trailing_spaces(line: str) -> str:
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    return line
+
+
+def _parse_rule(line: str) -> Optional[Tuple[str, bool, bool]]:
+    line = _strip_trailing_spaces(line.rstrip("\r\n"))
+    if line == "" or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    dir_only = line.endswith("/")
+    if dir_only:
+        line = line.rstrip("/")
+    if line == "":
+        return None
+
+    # Patterns with a slash at the start or in the middle are relative to the
+    # directory of the ignore file, other patterns match at any depth below it
+    if "/" in line:
+        regex = translate_ignore_pattern(line.lstrip("/"))
+    else:
+        regex = "(?:.*/)?" + translate_ignore_pattern(line)
+    return regex, negated, dir_only
+
+
+def _compile(rules: List[Tuple[str, bool]]) -> Tuple[Optional[re.Pattern], List[bool]]:
+    if len(rules) == 0:
+        return None, []
+
+    # The last matching rule decides, so the rules are tried in reverse order and
+    # every rule gets one capturing group identifying it
+    rules = rules[::-1]
+    regex = "|".join(f"({regex})" for regex, _ in rules)
+    return re.compile(regex, re.DOTALL), [negated for _, negated in rules]
+
+
+class IgnoreRules:
+    def __init__(self, lines: Iterable[str]) -> None:
+        """
+        Initialize new IgnoreRules from the lines of an ignore file.
+
+        The rules follow the format of .gitignore files. All rules of a file are
+        compiled into one regular expression for directories and one for files, so
+        checking a path costs one regular expression match.
+
+        :param lines: The lines of the ignore file.
+        """
+        dir_rules, file_rules = [], []
+        for line in lines:
+            rule = _parse_rule(line)
+            if rule is None:
+                continue
+            regex, negated, dir_only = rule
+            dir_rules.append((regex, negated))
+            if not dir_only:
+                file_rules.append((regex, negated))
+
+        self.dir_regex, self.dir_negated = _compile(dir_rules)
+        self.file_regex, self.file_negated = _compile(file_rules)
+
+    @staticmethod
+    def from_file(path: str) -> Optional["IgnoreRules"]:
+        """
+        Read IgnoreRules from an ignore file.
+
+        :param path: The path of the ignore file.
+        :return: The rules or None if the file could not be read.
+        """
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as file:
+                return IgnoreRules(file.readlines())
+        except OSError:
+            return None
+
+    def match(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Check a path against these rules.
+
+        :param relative_path: The path relative to the directory of the ignore file,
+            with "/" as separator.
+        :param is_dir: Whether the path is a directory.
+        :return: True if the path is ignored, False if it is explicitly not ignored
+            (by a negated rule) and None if no rule matches it.
+        """
+        regex, negated = (
+            (self.dir_regex, self.dir_negated)
+            if is_dir
+            else (self.file_regex, self.file_negated)
+        )
+        if regex is None:
+            return None
+
+        m = regex.fullmatch(relative_path)
+        if m is None:
+            return None
+        assert m.lastindex is not None
+        return not negated[m.lastindex - 1]
+
+
+class IgnoreChain:
+    """
+    The ignore rules applying to a directory.
+
+    This is a linked list from the rules of the directory itself up to the rules of
+    the root of the walk, so that it can be shared by all subdirectories.
+    """
+
+    __slots__ = ("base_path", "rules", "parent", "prefix")
+
+    def __init__(
+        self, base_path: str, rules: IgnoreRules, parent: Optional["IgnoreChain"]
+    ) -> None:
+        self.base_path = base_path
+        self.rules = rules
+        self.parent = parent
+        self.prefix = base_path if base_path.endswith(os.sep) else base_path + os.sep
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """
+        Check whether a path is ignored.
+
+        Rules in deeper directories take precedence over rules in their parents. The
+        rules of a directory only apply to paths located below it, so the real path of
+        a symbolic link target outside the directory is not matched against them.
+
+        :param path: The path.
+        :param is_dir: Whether the path is a directory.
+        :return: True if the path is ignored, False otherwise.
+        """
+        chain: Optional[IgnoreChain] = self
+        while chain is not None:
+            if path.startswith(chain.prefix):
+                start = len(chain.prefix)
+                relative_path = path[start:].replace(os.sep, "/")
+                decision = chain.rules.match(relative_path, is_dir)
+                if decision is not None:
+                    return decision
+            chain = chain.parent
+        return False
+
+
+def load_ignore_chain(
+    dir_path: str, file_names: Iterable[str], parent: Optional[IgnoreChain]
+) -> Optional[IgnoreChain]:
+    """
+    Get the ignore rules applying to a directory.
+
+    :param dir_path: The path of the directory.
+    :param file_names: The names of the files in the directory.
+    :param parent: The ignore rules applying to the parent directory.
+    :return: The ignore rules applying to the directory or None if there are none.
+    """
+    chain = parent
+    # .ignore files take precedence over .gitignore files
+    for name in IGNORE_FILE_NAMES:
+        if name in file_names:
+            rules = IgnoreRules.from_file(os.path.join(dir_path, name))
+            if rules is not None:
+                chain = IgnoreChain(dir_path, rules, chain)
+    return chain
@@ -0,0 +1,131 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Iterator, Optional, Set
+
+from fluentfs.exceptions.exceptions import FluentFsException
+from fluentfs.walk.walker import (
+    Listing,
+    WalkEntry,
+    Walker,
+    _CheckpointWriter,
+    _PendingDir,
+)
+
+
+class ParallelWalker(Walker):
+    def __init__(
+        self,
+        path: str,
+        workers: int = 4,
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Initialize a new ParallelWalker over the directory tree rooted at path.
+
+        The ParallelWalker lists directories concurrently on a thread pool. This pays
+        off on filesystems where every directory listing has a high latency (e.g. NFS
+        or SMB mounts), since the latencies of several listings then overlap.
+
+        :param path: The path of the root directory.
+        :param workers: The number of threads listing directories.
+        :param ordered: Whether to yield the entries in the same order as a Walker
+            with the same options would. Listings that complete early are then
+            buffered until it is their turn. If this is False, each directory is
+            yielded (together with its files) as soon as its listing is complete,
+            which gives the maximum throughput. Such a walk cannot save checkpoints
+            (but it can resume from one).
+        :param max_pending: The maximum number of directory listings that are
+            requested or buffered at the same time. This bounds the memory used by
+            the walk. By default, this is four times the number of workers.
+        :param options: The options of the walk (see Walker).
+        """
+        super().__init__(path, **options)
+
+        if workers < 1:
+            raise FluentFsException(f"Invalid number of workers {workers}")
+        if not ordered and self.checkpoint is not None:
+            raise FluentFsException("An unordered walk cannot save checkpoints")
+
+        self.workers = workers
+        self.ordered = ordered
+        self.max_pending = max_pending if max_pending is not None else 4 * workers
+
+    def __iter__(self) -> Iterator[WalkEntry]:
+        pending_dirs = self._start()
+        if len(pending_dirs) == 0:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            if self.ordered:
+                yield from self._iter_ordered(executor, pending_dirs)
+            else:
+                yield from self._iter_unordered(executor, pending_dirs)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _prefetch(
+        self, executor: ThreadPoolExecutor, pending_dirs: Deque[_PendingDir], count: int
+    ) -> int:
+        # The next directory to visit always has its listing requested (even if that
+        # exceeds the bound by one). After it, we request listings in the order in
+        # which the directories will be visited until the bound is reached. Since
+        # every requested listing counts towards the bound, this looks at no more
+        # than 2 * max_pending + 1 pending directories.
+        in_visit_order = (
+            iter(pending_dirs) if self.breadth_first else reversed(pending_dirs)
+        )
+        for i, pending_dir in enumerate(in_visit_order):
+            if i != 0 and count >= self.max_pending:
+                break
+            if pending_dir.future is None:
+                pending_dir.future = executor.submit(self._scan, pending_dir)
+                count += 1
+        return count
+
+    def _iter_ordered(
+        self, executor: ThreadPoolExecutor, pending_dirs: Deque[_PendingDir]
+    ) -> Iterator[WalkEntry]:
+        pop = pending_dirs.popleft if self.breadth_first else pending_dirs.pop
+        checkpoints = _CheckpointWriter(self)
+        state = self._state(pending_dirs)
+        count = 0
+        while len(pending_dirs) != 0:
+            count = self._prefetch(executor, pending_dirs, count)
+
+            pending_dir = pop()
+            assert pending_dir.future is not None
+            listing = pending_dir.future.result()
+            count -= 1
+            if listing is None:
+                continue
+
+            entries, children = self._expand(pending_dir, listing, state)
+            yield from checkpoints.track(entries, pending_dirs, pending_dir)
+            pending_dirs.extend(children)
+        checkpoints.finish()
+
+    def _iter_unordered(
+        self, executor: ThreadPoolExecutor, queue: Deque[_PendingDir]
+    ) -> Iterator[WalkEntry]:
+        state = self._state(queue)
+        futures: Set["Future[Listing]"] = set()
+        submitted: Dict["Future[Listing]", _PendingDir] = {}
+        while len(queue) != 0 or len(futures) != 0:
+            while len(queue) != 0 and len(futures) < self.max_pending:
+                pending_dir = queue.popleft()
+                future = executor.submit(self._scan, pending_dir)
+                submitted[future] = pending_dir
+                futures.add(future)
+
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending_dir = submitted.pop(future)
+                listing = future.result()
+                if listing is None:
+                    continue
+
+                entries, children = self._expand(pending_dir, listing, state)
+                yield from entries
+                queue.extend(children)
@@ -0,0 +1,51 @@
+import os
+from typing import Dict, Iterable, NamedTuple
+
+from fluentfs.walk.walker import WalkEntry
+
+
+class WalkSummary(NamedTuple):
+    """
+    The numbers of directories and files visited by a walk and the total size of
+    the files.
+
+    extension_counts maps the extensions of the files (without the preceding dot,
+    i.e. like File.extension) to the numbers of files having them.
+    """
+
+    dir_count: int
+    file_count: int
+    byte_count: int
+    extension_counts: Dict[str, int]
+
+
+def summarize(entries: Iterable[WalkEntry]) -> WalkSummary:
+    """
+    Summarize the entries of a walk.
+
+    Only the entries themselves are used, i.e. no file-like objects are created. The
+    file sizes are taken from the stat results of the entries (which cost no
+    additional system call on Windows).
+
+    :param entries: The entries.
+    :return: The summary.
+    """
+    dir_count = 0
+    file_count = 0
+    byte_count = 0
+    extension_counts: Dict[str, int] = {}
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            dir_count += 1
+            continue
+
+        file_count += 1
+        _, ext = os.path.splitext(entry.name)
+        extension = ext[1:]
+        extension_counts[extension] = extension_counts.get(extension, 0) + 1
+        try:
+            byte_count += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            # The file vanished after the listing
+            continue
+    return WalkSummary(dir_count, file_count, byte_count, extension_counts)
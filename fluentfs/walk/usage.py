@@ -0,0 +1,155 @@
+import os
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from fluentfs.walk.walker import TargetEntry, WalkEntry
+
+
+class DiskUsage(NamedTuple):
+    """
+    The disk usage of a set of files.
+
+    apparent_size is the sum of the file sizes (i.e. of their byte counts), while
+    allocated_size is the space actually allocated for the files on the disk. The
+    allocated size is smaller for sparse files and usually a bit bigger otherwise,
+    since disk space is allocated in blocks.
+    """
+
+    apparent_size: int
+    allocated_size: int
+
+
+def allocated_size(stat_result: os.stat_result) -> int:
+    """
+    Get the number of bytes allocated for a file.
+
+    :param stat_result: The stat result of the file.
+    :return: The number of allocated bytes. If the platform does not report the
+        number of allocated blocks (e.g. Windows), this is the size of the file.
+    """
+    blocks = getattr(stat_result, "st_blocks", None)
+    # st_blocks is always in units of 512 bytes, regardless of the block size
+    return blocks * 512 if blocks is not None else stat_result.st_size
+
+
+class _HardLinks:
+    """
+    The identities of the files with several hard links that were already counted.
+
+    Files with a single link can only be counted once anyway, so only files with
+    several links are remembered.
+    """
+
+    __slots__ = ("seen",)
+
+    def __init__(self) -> None:
+        self.seen: Set[Tuple[int, int]] = set()
+
+    def is_first(self, stat_result: os.stat_result) -> bool:
+        if stat_result.st_nlink <= 1:
+            return True
+        identity = (stat_result.st_dev, stat_result.st_ino)
+        if identity in self.seen:
+            return False
+        self.seen.add(identity)
+        return True
+
+
+def disk_usage(stat_results: Iterable[os.stat_result]) -> DiskUsage:
+    """
+    Get the disk usage of files.
+
+    Files with several hard links are counted once.
+
+    :param stat_results: The stat results of the files.
+    :return: The disk usage.
+    """
+    hard_links = _HardLinks()
+    apparent = 0
+    allocated = 0
+    for stat_result in stat_results:
+        if hard_links.is_first(stat_result):
+            apparent += stat_result.st_size
+            allocated += allocated_size(stat_result)
+    return DiskUsage(apparent, allocated)
+
+
+def _listed_path(entry: WalkEntry) -> str:
+    # The path an entry has in the walked tree, which is the path of the symbolic
+    # link for a followed link (relative to its directory as walked)
+    if isinstance(entry, TargetEntry) and entry.link_path is not None:
+        return entry.link_path
+    return entry.path
+
+
+def _tree_path(path: str, links: Dict[str, str]) -> str:
+    """
+    Map the path of a directory visited by a walk to its path in the walked tree.
+
+    :param path: The path of the directory as yielded by the walk.
+    :param links: The real paths of the followed directories mapped to the paths of
+        the symbolic links they were reached through.
+    :return: The path below the root directory of the walk.
+    """
+    names: List[str] = []
+    while True:
+        if path in links:
+            path = links[path]
+        parent_path = os.path.dirname(path)
+        if parent_path == path:
+            break
+        names.append(os.path.basename(path))
+        path = parent_path
+    return os.path.join(path, *reversed(names))
+
+
+def dir_usage(entries: Iterable[WalkEntry]) -> Dict[str, DiskUsage]:
+    """
+    Get the disk usage of every directory of a walk.
+
+    The disk usage of a directory is the disk usage of all files below it (like the
+    du command, but without the space allocated for the directories themselves).
+    The file sizes are taken from the stat results of the entries, so there is one
+    stat call per file on POSIX systems and none on Windows. Files with several hard
+    links are counted once. If the walk follows symbolic links, the targets count
+    towards the directories containing the links, and followed directories are
+    keyed by the paths of their links.
+
+    :param entries: The entries of the walk (in any order).
+    :return: A dictionary mapping the paths of the directories to their disk usages
+        (sorted by path).
+    """
+    hard_links = _HardLinks()
+    sizes: Dict[str, List[int]] = {}
+    links: Dict[str, str] = {}
+    for entry in entries:
+        listed_path = _listed_path(entry)
+        if entry.is_dir(follow_symlinks=False):
+            sizes.setdefault(entry.path, [0, 0])
+            if listed_path != entry.path:
+                links[entry.path] = listed_path
+            continue
+        try:
+            stat_result = entry.stat(follow_symlinks=False)
+        except OSError:
+            # The file vanished after the listing
+            continue
+        if hard_links.is_first(stat_result):
+            dir_sizes = sizes.setdefault(os.path.dirname(listed_path), [0, 0])
+            dir_sizes[0] += stat_result.st_size
+            dir_sizes[1] += allocated_size(stat_result)
+
+    # The directories are only mapped to their paths in the tree once all links are
+    # known, since the entries may come in any order
+    if len(links) != 0:
+        sizes = {
+            _tree_path(path, links): dir_sizes for path, dir_sizes in sizes.items()
+        }
+
+    # Children have longer paths than their parents, so they are added to their
+    # parents before the parents are added to theirs
+    for path in sorted(sizes, key=len, reverse=True):
+        parent_sizes = sizes.get(os.path.dirname(path))
+        if parent_sizes is not None and parent_sizes is not sizes[path]:
+            parent_sizes[0] += sizes[path][0]
+            parent_sizes[1] += sizes[path][1]
+    return {path: DiskUsage(*sizes[path]) for path in sorted(sizes)}
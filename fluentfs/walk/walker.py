@@ -0,0 +1,733 @@
+import copy
+import os
+import re
+import stat
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from fluentfs.exceptions.exceptions import FluentFsException
+from fluentfs.paths.matches import matches_compiled_regex, matches_glob
+from fluentfs.walk.checkpoint import WalkCheckpoint
+from fluentfs.walk.ignore import IGNORE_FILE_NAMES, IgnoreChain, load_ignore_chain
+
+T = TypeVar("T")
+
+
+class RootEntry:
+    """
+    A minimal stand-in for os.DirEntry representing the root directory of a walk.
+
+    os.scandir only produces entries for the children of a directory, so the root
+    of a walk needs its own entry object offering the same interface.
+    """
+
+    __slots__ = ("path", "name")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.name = os.path.basename(path)
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return True
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return False
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+    def inode(self) -> int:
+        return self.stat(follow_symlinks=False).st_ino
+
+
+class TargetEntry:
+    """
+    A minimal stand-in for os.DirEntry representing the final target of a symbolic
+    link found by a walk which follows symbolic links.
+
+    The path of the entry is the real path of the target, so the entry behaves like
+    the entry the target has in its own directory. link_path is the path of the
+    symbolic link which was followed (if known).
+    """
+
+    __slots__ = ("path", "name", "_stat", "link_path")
+
+    def __init__(
+        self, path: str, stat_result: os.stat_result, link_path: Optional[str] = None
+    ) -> None:
+        self.path = path
+        self.name = os.path.basename(path)
+        self._stat = stat_result
+        self.link_path = link_path
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return stat.S_ISDIR(self._stat.st_mode)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return stat.S_ISREG(self._stat.st_mode)
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        return self._stat
+
+    def inode(self) -> int:
+        return self._stat.st_ino
+
+
+ListedEntry = Union[os.DirEntry, TargetEntry]
+
+WalkEntry = Union[os.DirEntry, RootEntry, TargetEntry]
+
+# The device and inode of a directory or file
+Identity = Tuple[int, int]
+
+# On Windows the directory listing already contains the stat information of every
+# entry, so DirEntry.stat does not need an additional system call.
+STAT_FROM_LISTING = os.name == "nt"
+
+
+Listing = Optional[Tuple[List[ListedEntry], List[ListedEntry]]]
+
+
+class _PendingDir:
+    """
+    A directory waiting to be visited by a walk.
+
+    ignores are the ignore rules applying to the directory. Before the directory is
+    listed, these are the rules of its parent. A parallel walk may already have
+    requested the listing from its thread pool, in which case future is set.
+
+    position is only set for a directory that was partially yielded before a walk was
+    resumed (see WalkCheckpoint).
+    """
+
+    __slots__ = ("entry", "depth", "ignores", "future", "position")
+
+    def __init__(
+        self, entry: WalkEntry, depth: int, ignores: Optional[IgnoreChain] = None
+    ) -> None:
+        self.entry = entry
+        self.depth = depth
+        self.ignores = ignores
+        self.future: Optional["Future[Listing]"] = None
+        self.position: Optional[str] = None
+
+
+def _final_target(entry: os.DirEntry) -> Optional[TargetEntry]:
+    target_path = os.path.realpath(entry.path)
+    try:
+        return TargetEntry(target_path, os.stat(target_path), entry.path)
+    except OSError:
+        # The link is broken or part of a cycle
+        return None
+
+
+def _is_ignored(entry: ListedEntry, ignores: IgnoreChain, is_dir: bool) -> bool:
+    # A followed link is ignored by the rules matching the link itself as well as by
+    # the rules matching its target
+    if isinstance(entry, TargetEntry) and entry.link_path is not None:
+        if ignores.is_ignored(entry.link_path, is_dir):
+            return True
+    return ignores.is_ignored(entry.path, is_dir)
+
+
+def _listed_entry(entry: os.DirEntry, follow_symlinks: bool) -> Optional[ListedEntry]:
+    if follow_symlinks and entry.is_symlink():
+        return _final_target(entry)
+    return entry
+
+
+def scan_dir(path: str, sort: bool = True, follow_symlinks: bool = False) -> Listing:
+    """
+    List the (real) subdirectories and (regular) files of a directory.
+
+    Entries are classified using the information returned by the directory listing
+    itself (i.e. d_type on POSIX systems), so usually no additional stat calls are
+    necessary. By default, symbolic links are neither classified as directories nor
+    as files, which is consistent with dir_exists and file_exists.
+
+    :param path: The path of the directory.
+    :param sort: Whether to sort the entries by name. If this is False, the entries
+        are returned in the order of the directory listing.
+    :param follow_symlinks: Whether to replace symbolic links by their final targets
+        (see TargetEntry). Broken links and links that are part of a cycle are
+        skipped.
+    :return: A tuple containing the directory entries and the file entries or None
+        if the directory could not be listed.
+    """
+    dirs: List[ListedEntry] = []
+    files: List[ListedEntry] = []
+    try:
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                entry = _listed_entry(dir_entry, follow_symlinks)
+                if entry is None:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry)
+                except OSError:  # pragma: no cover
+                    # The entry vanished while we were classifying it
+                    continue
+    except OSError:
+        return None
+
+    if sort:
+        dirs.sort(key=lambda entry: entry.name)
+        files.sort(key=lambda entry: entry.name)
+    return dirs, files
+
+
+def is_sub_path(path: str, base_path: str) -> bool:
+    """
+    Check whether a path is equal to or located below a base path.
+
+    Both paths must be maximally expanded. Unlike os.path.commonpath, this is a
+    simple string comparison, which matters when it is done for every entry of a walk.
+
+    :param path: The maximally expanded path.
+    :param base_path: The maximally expanded base path.
+    :return: True, if base_path is path or a parent of path, False otherwise.
+    """
+    if not path.startswith(base_path):
+        return False
+    return (
+        len(path) == len(base_path)
+        or base_path.endswith(os.sep)
+        or path[len(base_path)] == os.sep
+    )
+
+
+def _is_below_any(path: str, base_paths: List[str]) -> bool:
+    return any(is_sub_path(path, base_path) for base_path in base_paths)
+
+
+def _leads_to_any(path: str, base_paths: List[str]) -> bool:
+    return any(
+        is_sub_path(path, base_path) or is_sub_path(base_path, path)
+        for base_path in base_paths
+    )
+
+
+class Walker:
+    def __init__(
+        self,
+        path: str,
+        files: bool = True,
+        dirs: bool = True,
+        include_base_paths: Optional[List[str]] = None,
+        exclude_base_paths: Optional[List[str]] = None,
+        exclude_dir_globs: Optional[List[str]] = None,
+        exclude_dir_regexes: Optional[List[re.Pattern]] = None,
+        dir_filter: Optional[Callable[[WalkEntry], bool]] = None,
+        max_depth: Optional[int] = None,
+        breadth_first: bool = False,
+        sort: bool = True,
+        respect_gitignore: bool = False,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 60.0,
+        resume_from: Optional[str] = None,
+        follow_symlinks: bool = False,
+        one_file_system: bool = False,
+        allowed_mounts: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a new Walker over the directory tree rooted at path.
+
+        By default, the walker traverses the tree top-down and depth-first. Every
+        directory is yielded before its files, which are yielded (sorted by name)
+        before the subdirectories are traversed (again sorted by name). Symbolic links
+        are never yielded and (unless follow_symlinks is True) never followed.
+        Directories that cannot be listed are skipped.
+
+        Directories can be pruned, in which case neither the directory itself nor
+        anything below it is listed or yielded. Note that all paths are used as is,
+        i.e. they are not expanded.
+
+        :param path: The path of the root directory.
+        :param files: Whether to yield entries for (regular) files.
+        :param dirs: Whether to yield entries for directories.
+        :param include_base_paths: If given, only file-like objects below one of these
+            base paths are yielded, and only directories leading to them are listed.
+        :param exclude_base_paths: File-like objects below one of these base paths
+            are not yielded, and directories below them are pruned.
+        :param exclude_dir_globs: Directories whose paths match one of these glob
+            patterns are pruned.
+        :param exclude_dir_regexes: Directories whose paths match one of these
+            compiled regular expressions are pruned.
+        :param dir_filter: A predicate on directory entries. Directories for which it
+            returns False are pruned.
+        :param max_depth: If given, entries deeper than this are not yielded. The
+            root directory has depth 0 and the entries directly inside it have
+            depth 1. Directories at the maximum depth are yielded without listing them.
+        :param breadth_first: Whether to traverse the tree breadth-first, i.e. to
+            visit the directories level by level (all directories of a depth before
+            any directory of the next depth). The files of a directory are still
+            yielded right after it, i.e. possibly before directories of a lower depth.
+        :param sort: Whether to sort the entries of each directory by name. If this is
+            False, the entries are yielded in the order of the directory listing,
+            which avoids sorting huge directories.
+        :param respect_gitignore: Whether to skip the entries ignored by the
+            .gitignore and .ignore files found in the tree (rules in .ignore files take
+            precedence). Ignored directories are pruned, and so are .git directories.
+            Only ignore files inside the tree are read, i.e. rules in the parents of
+            the root directory and global git settings are not taken into account.
+        :param checkpoint: If given, the frontier of the walk (i.e. the pending
+            directories and the position within the current directory) is saved to
+            this file every checkpoint_interval seconds and when the walk is complete.
+            The checkpoint always reflects the entries that have been consumed, i.e.
+            it is saved right before an entry is yielded. Delivery is therefore
+            at-least-once: a resumed walk yields the last entry consumed before the
+            checkpoint was saved again (since it may not have been processed). If
+            sort is False, the checkpoint is only saved when the walk moves on to the
+            next directory, so a resumed walk may yield more entries again.
+        :param checkpoint_interval: The minimum number of seconds between two saves of
+            the checkpoint.
+        :param resume_from: If given, the walk continues from the checkpoint saved to
+            this file (by a walk with the same root directory, order and options)
+            without yielding the entries consumed before the checkpoint was saved
+            again. If the file does not exist, the walk starts from the beginning, so
+            it can be the same file as the checkpoint.
+        :param follow_symlinks: Whether to follow symbolic links. Every link is
+            replaced by its final target, i.e. the target is yielded (and traversed)
+            with its real path, which may be outside of the tree. Directories and
+            files are identified by their device and inode, so every directory and
+            file is visited only once (even if it can be reached through several
+            links, hard links or bind mounts) and cycles are not a problem. The
+            identities of all visited directories and files are kept in memory.
+            They are not part of a checkpoint.
+        :param one_file_system: Whether to stay on the filesystem of the root
+            directory. Directories on a different device (i.e. mount points of other
+            filesystems like /proc or network mounts) are pruned.
+        :param allowed_mounts: The paths of mount points which a walk staying on one
+            filesystem may enter nevertheless (together with everything on their
+            filesystems).
+        """
+        self.path = path
+        self.files = files
+        self.dirs = dirs
+        self.include_base_paths = include_base_paths
+        self.exclude_base_paths = exclude_base_paths or []
+        self.exclude_dir_globs = exclude_dir_globs or []
+        self.exclude_dir_regexes = exclude_dir_regexes or []
+        self.dir_filter = dir_filter
+        self.max_depth = max_depth
+        self.breadth_first = breadth_first
+        self.sort = sort
+        self.respect_gitignore = respect_gitignore
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.resume_from = resume_from
+        self.follow_symlinks = follow_symlinks
+        self.one_file_system = one_file_system
+        self.allowed_mounts = allowed_mounts or []
+
+    def replace(self, **options: Any) -> "Walker":
+        """
+        Get a copy of this walker with some options replaced.
+
+        :param options: The options to replace (see the constructor for a list).
+        :return: The new walker.
+        """
+        walker = copy.copy(self)
+        for name, value in options.items():
+            if not hasattr(walker, name):
+                raise FluentFsException(f"Unknown walker option {name}")
+            setattr(walker, name, value)
+        return walker
+
+    def _is_pruned(self, entry: WalkEntry) -> bool:
+        path = entry.path
+        return (
+            _is_below_any(path, self.exclude_base_paths)
+            or (
+                self.include_base_paths is not None
+                and not _leads_to_any(path, self.include_base_paths)
+            )
+            or matches_glob(path, self.exclude_dir_globs)
+            or matches_compiled_regex(path, self.exclude_dir_regexes)
+            or (self.dir_filter is not None and not self.dir_filter(entry))
+        )
+
+    def _is_included(self, path: str) -> bool:
+        if self.include_base_paths is not None and not _is_below_any(
+            path, self.include_base_paths
+        ):
+            return False
+        # Directories below an excluded base path are already pruned, so this can
+        # only be the case for a file whose path is an excluded base path itself
+        return path not in self.exclude_base_paths
+
+    def _included_files(self, file_entries: List[ListedEntry]) -> List[ListedEntry]:
+        if self.include_base_paths is None and len(self.exclude_base_paths) == 0:
+            return file_entries
+        return [entry for entry in file_entries if self._is_included(entry.path)]
+
+    def _ignores_above(
+        self, path: str, cache: Dict[str, Optional[IgnoreChain]]
+    ) -> Optional[IgnoreChain]:
+        # Rebuilds the ignore rules of the parent of a directory by reading the
+        # ignore files of all directories between the root directory and path (which
+        # may be outside the root directory if it is the target of a symbolic link)
+        if path == self.path or not is_sub_path(path, self.path):
+            return None
+        parent_path = os.path.dirname(path)
+        if parent_path not in cache:
+            cache[parent_path] = load_ignore_chain(
+                parent_path,
+                IGNORE_FILE_NAMES,
+                self._ignores_above(parent_path, cache),
+            )
+        return cache[parent_path]
+
+    def _restore(self, checkpoint: WalkCheckpoint) -> Deque[_PendingDir]:
+        if (checkpoint.root, checkpoint.breadth_first, checkpoint.sort) != (
+            self.path,
+            self.breadth_first,
+            self.sort,
+        ):
+            raise FluentFsException(
+                f"Checkpoint {self.resume_from} is not for this walk"
+            )
+
+        cache: Dict[str, Optional[IgnoreChain]] = {}
+
+        def restore(path: str, depth: int) -> _PendingDir:
+            ignores = (
+                self._ignores_above(path, cache) if self.respect_gitignore else None
+            )
+            return _PendingDir(RootEntry(path), depth, ignores)
+
+        pending = deque(restore(path, depth) for path, depth in checkpoint.pending)
+        if checkpoint.current is not None:
+            path, depth, position = checkpoint.current
+            current = restore(path, depth)
+            current.position = position
+            # The current directory is the next one to visit
+            if self.breadth_first:
+                pending.appendleft(current)
+            else:
+                pending.append(current)
+        return pending
+
+    def _start(self) -> Deque[_PendingDir]:
+        """
+        Get the directories to visit at the start of a walk.
+        """
+        if self.resume_from is not None:
+            checkpoint = WalkCheckpoint.load(self.resume_from)
+            if checkpoint is not None:
+                return self._restore(checkpoint)
+        root = RootEntry(self.path)
+        return deque() if self._is_pruned(root) else deque([_PendingDir(root, 0)])
+
+    def _unignored(
+        self,
+        pending_dir: _PendingDir,
+        sub_dir_entries: List[ListedEntry],
+        file_entries: List[ListedEntry],
+    ) -> Tuple[List[ListedEntry], List[ListedEntry]]:
+        names = [e.name for e in file_entries if e.name in IGNORE_FILE_NAMES]
+        ignores = load_ignore_chain(pending_dir.entry.path, names, pending_dir.ignores)
+        pending_dir.ignores = ignores
+
+        sub_dir_entries = [e for e in sub_dir_entries if e.name != ".git"]
+        if ignores is None:
+            return sub_dir_entries, file_entries
+        return (
+            [e for e in sub_dir_entries if not _is_ignored(e, ignores, True)],
+            [e for e in file_entries if not _is_ignored(e, ignores, False)],
+        )
+
+    def _scan(self, pending_dir: _PendingDir) -> Listing:
+        # Directories at the maximum depth are treated as if they were empty
+        if self.max_depth is not None and pending_dir.depth >= self.max_depth:
+            return [], []
+        listing = scan_dir(pending_dir.entry.path, self.sort, self.follow_symlinks)
+        # Ignore files are read here (and not when the directory is visited), so that
+        # a parallel walk reads them on its thread pool
+        if listing is None or not self.respect_gitignore:
+            return listing
+        return self._unignored(pending_dir, *listing)
+
+    def _unpruned(self, sub_dir_entries: List[ListedEntry]) -> List[ListedEntry]:
+        return [e for e in sub_dir_entries if not self._is_pruned(e)]
+
+    def _state(self, pending: Deque[_PendingDir]) -> "_WalkState":
+        """
+        Get the state of a walk starting with the given pending directories.
+        """
+        state = _WalkState()
+        if self.follow_symlinks:
+            state.seen = set()
+            for pending_dir in pending:
+                _is_first_visit(pending_dir.entry, None, state.seen)
+        if self.one_file_system:
+            state.devices = {
+                stat_result.st_dev
+                for stat_result in map(_try_stat, [self.path] + self.allowed_mounts)
+                if stat_result is not None
+            }
+        return state
+
+    def _visit(
+        self, dir_entry: WalkEntry, file_entries: List[ListedEntry]
+    ) -> Iterator[WalkEntry]:
+        if self.dirs and self._is_included(dir_entry.path):
+            yield dir_entry
+        if self.files:
+            yield from self._included_files(file_entries)
+
+    def _expand(
+        self,
+        pending_dir: _PendingDir,
+        listing: Tuple[List[ListedEntry], List[ListedEntry]],
+        state: "_WalkState",
+    ) -> Tuple[Iterator[WalkEntry], List[_PendingDir]]:
+        """
+        Get the entries to yield for a listed directory and its subdirectories which
+        are still to be visited.
+        """
+        sub_dir_entries, file_entries = listing
+        sub_dir_entries = self._unpruned(sub_dir_entries)
+        if state.devices is not None:
+            devices = state.devices
+            sub_dir_entries = [e for e in sub_dir_entries if _device(e) in devices]
+        if state.seen is not None:
+            sub_dir_entries, file_entries = _unseen(
+                pending_dir, sub_dir_entries, file_entries, state.seen
+            )
+        # Pending directories are taken from the end for a depth-first traversal
+        # and from the start for a breadth-first traversal
+        if not self.breadth_first:
+            sub_dir_entries.reverse()
+        children = [
+            _PendingDir(entry, pending_dir.depth + 1, pending_dir.ignores)
+            for entry in sub_dir_entries
+        ]
+        entries = self._visit(pending_dir.entry, file_entries)
+        if pending_dir.position is not None:
+            entries = _after(entries, pending_dir)
+        return entries, children
+
+    def __iter__(self) -> Iterator[WalkEntry]:
+        pending = self._start()
+        pop = pending.popleft if self.breadth_first else pending.pop
+        checkpoints = _CheckpointWriter(self)
+        state = self._state(pending)
+
+        while len(pending) != 0:
+            pending_dir = pop()
+            listing = self._scan(pending_dir)
+            if listing is None:
+                continue
+
+            entries, children = self._expand(pending_dir, listing, state)
+            yield from checkpoints.track(entries, pending, pending_dir)
+            pending.extend(children)
+        checkpoints.finish()
+
+
+class _WalkState:
+    """
+    The state of a walk that is shared by all directories.
+
+    seen are the identities of the visited directories and files, if the walk
+    follows symbolic links. devices are the devices the walk may enter, if it stays
+    on one filesystem.
+    """
+
+    __slots__ = ("seen", "devices")
+
+    def __init__(self) -> None:
+        self.seen: Optional[Set[Identity]] = None
+        self.devices: Optional[Set[int]] = None
+
+
+def _try_stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _device(entry: ListedEntry) -> Optional[int]:
+    # Directory entries cache their stat result, which the other checks reuse
+    try:
+        return entry.stat().st_dev
+    except OSError:
+        # The directory vanished after the listing
+        return None
+
+
+def _identity(entry: WalkEntry, dev: Optional[int]) -> Identity:
+    # Files cannot be mount points, so unless they are link targets, their device
+    # is the device of their directory and the inode is part of the listing
+    if dev is not None and not isinstance(entry, TargetEntry):
+        return dev, entry.inode()
+    stat_result = entry.stat()
+    return stat_result.st_dev, stat_result.st_ino
+
+
+def _is_first_visit(entry: WalkEntry, dev: Optional[int], seen: Set[Identity]) -> bool:
+    try:
+        identity = _identity(entry, dev)
+    except OSError:
+        # The entry vanished after the listing
+        return False
+    if identity in seen:
+        return False
+    seen.add(identity)
+    return True
+
+
+def _unseen(
+    pending_dir: _PendingDir,
+    sub_dir_entries: List[ListedEntry],
+    file_entries: List[ListedEntry],
+    seen: Set[Identity],
+) -> Tuple[List[ListedEntry], List[ListedEntry]]:
+    # Drops the entries whose directories or files were already visited (through
+    # a different path), marking the others as visited
+    try:
+        dev = pending_dir.entry.stat().st_dev
+    except OSError:
+        return [], []
+    return (
+        [e for e in sub_dir_entries if _is_first_visit(e, None, seen)],
+        [e for e in file_entries if _is_first_visit(e, dev, seen)],
+    )
+
+
+def _after(
+    entries: Iterator[WalkEntry], pending_dir: _PendingDir
+) -> Iterator[WalkEntry]:
+    # Skips the entries of a directory that were yielded before the walk was resumed.
+    # Positions within a directory are only saved for sorted walks, so these are the
+    # directory itself and the files up to (and including) the position.
+    position = pending_dir.position
+    assert position is not None
+    for entry in entries:
+        if entry is not pending_dir.entry and entry.name > position:
+            yield entry
+
+
+class _CheckpointWriter:
+    """
+    Saves the frontier of a walk to the checkpoint file of the walker.
+    """
+
+    __slots__ = ("walker", "saved_at")
+
+    def __init__(self, walker: Walker) -> None:
+        self.walker = walker
+        self.saved_at = time.monotonic()
+
+    def save(
+        self,
+        pending: Deque[_PendingDir],
+        current: Optional[_PendingDir],
+        position: Optional[str],
+    ) -> None:
+        walker = self.walker
+        assert walker.checkpoint is not None
+        WalkCheckpoint(
+            walker.path,
+            walker.breadth_first,
+            walker.sort,
+            [(pending_dir.entry.path, pending_dir.depth) for pending_dir in pending],
+            (current.entry.path, current.depth, position) if current else None,
+        ).save(walker.checkpoint)
+        self.saved_at = time.monotonic()
+
+    def track(
+        self,
+        entries: Iterator[WalkEntry],
+        pending: Deque[_PendingDir],
+        pending_dir: _PendingDir,
+    ) -> Iterator[WalkEntry]:
+        """
+        Yield the entries of the directory that is currently visited, saving the
+        checkpoint whenever it is due.
+        """
+        walker = self.walker
+        if walker.checkpoint is None:
+            yield from entries
+            return
+
+        position = pending_dir.position
+        for entry in entries:
+            # Without sorting, positions within a directory are meaningless
+            if (walker.sort or position is None) and (
+                time.monotonic() - self.saved_at >= walker.checkpoint_interval
+            ):
+                self.save(pending, pending_dir, position)
+            yield entry
+            position = "" if entry is pending_dir.entry else entry.name
+
+    def finish(self) -> None:
+        """
+        Save the checkpoint of a complete walk (from which a resumed walk yields
+        nothing).
+        """
+        if self.walker.checkpoint is not None:
+            self.save(deque(), None, None)
+
+
+class WalkIterator(Iterator[T]):
+    def __init__(self, walker: Walker, make: Callable[[WalkEntry], T]) -> None:
+        """
+        Initialize a new iterator creating objects from the entries of a walker.
+
+        As long as no object has been consumed, the walker can still be replaced (e.g.
+        by a walker which prunes additional subtrees), see with_walker.
+
+        :param walker: The walker.
+        :param make: The function creating an object from an entry.
+        """
+        self.walker = walker
+        self.make = make
+        self.entries: Optional[Iterator[WalkEntry]] = None
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether the walk has already started.
+        """
+        return self.entries is not None
+
+    def with_walker(self, walker: Walker) -> "WalkIterator[T]":
+        """
+        Get an iterator creating objects the same way as this one, but from a
+        different walker.
+
+        :param walker: The walker.
+        :return: The new iterator.
+        """
+        return WalkIterator(walker, self.make)
+
+    def __next__(self) -> T:
+        if self.entries is None:
+            self.entries = iter(self.walker)
+        return self.make(next(self.entries))
@@ -0,0 +1,27 @@
+from fluentfs.watch.event import ChangeEvent, ChangeKind
+from fluentfs.watch.inotify import InotifyWatcher, inotify_available, parse_events
+from fluentfs.watch.watcher import (
+    PollingWatcher,
+    Snapshot,
+    SnapshotEntry,
+    Watcher,
+    diff_snapshots,
+    take_snapshot,
+)
+
+__all__ = [
+    # event
+    "ChangeEvent",
+    "ChangeKind",
+    # inotify
+    "InotifyWatcher",
+    "inotify_available",
+    "parse_events",
+    # watcher
+    "PollingWatcher",
+    "Snapshot",
+    "SnapshotEntry",
+    "Watcher",
+    "diff_snapshots",
+    "take_snapshot",
+]
@@ -0,0 +1,48 @@
+from enum import Enum
+from typing import Any, Optional
+
+
+class ChangeKind(Enum):
+    CREATED = 0
+    MODIFIED = 1
+    DELETED = 2
+    MOVED = 3
+
+
+class ChangeEvent:
+    __slots__ = ("kind", "path", "is_dir", "dest_path")
+
+    def __init__(
+        self,
+        kind: ChangeKind,
+        path: str,
+        is_dir: bool,
+        dest_path: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a new ChangeEvent.
+
+        :param kind: The kind of change.
+        :param path: The path of the changed file or directory. For a move, this is
+            the path before the move.
+        :param is_dir: Whether a directory changed.
+        :param dest_path: The path after the move (only for moves).
+        """
+        self.kind = kind
+        self.path = path
+        self.is_dir = is_dir
+        self.dest_path = dest_path
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ChangeEvent):
+            return False
+        return (self.kind, self.path, self.is_dir, self.dest_path) == (
+            other.kind,
+            other.path,
+            other.is_dir,
+            other.dest_path,
+        )
+
+    def __repr__(self) -> str:
+        dest = f', "{self.dest_path}"' if self.dest_path is not None else ""
+        return f'ChangeEvent({self.kind.name}, "{self.path}"{dest})'
@@ -0,0 +1,291 @@
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fluentfs.exceptions.exceptions import FluentFsException
+from fluentfs.walk.walker import is_sub_path, scan_dir
+from fluentfs.watch.event import ChangeEvent, ChangeKind
+from fluentfs.watch.watcher import Watcher
+
+# See inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_ONLYDIR
+    | IN_DONT_FOLLOW
+)
+
+# struct inotify_event without the trailing name
+_EVENT_HEADER = struct.Struct("iIII")
+
+_READ_SIZE = 64 * 1024
+
+# The maximum number of reads per call of read, so that a steady stream of events
+# does not keep the caller from handling the events read so far
+_MAX_READS = 16
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+@functools.lru_cache(maxsize=None)
+def _libc() -> Optional[ctypes.CDLL]:
+    return _load_libc()
+
+
+def inotify_available() -> bool:
+    """
+    Check whether inotify can be used on this system (i.e. on Linux).
+
+    :return: True if inotify is available, False otherwise.
+    """
+    return _libc() is not None
+
+
+def parse_events(data: bytes) -> Iterator[Tuple[int, int, int, str]]:
+    """
+    Parse the raw events read from an inotify file descriptor.
+
+    :param data: The raw events.
+    :return: An iterator of (watch descriptor, mask, cookie, name) tuples.
+    """
+    offset = 0
+    while offset < len(data):
+        wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+        offset += _EVENT_HEADER.size
+        end = offset + length
+        # The name is padded with null bytes
+        name = data[offset:end].rstrip(b"\0")
+        offset = end
+        yield wd, mask, cookie, os.fsdecode(name)
+
+
+def _collapse(events: List[ChangeEvent]) -> List[ChangeEvent]:
+    # Every write to a file is a separate modification
+    collapsed: List[ChangeEvent] = []
+    for event in events:
+        if (
+            event.kind != ChangeKind.MODIFIED
+            or len(collapsed) == 0
+            or collapsed[-1] != event
+        ):
+            collapsed.append(event)
+    return collapsed
+
+
+class InotifyWatcher(Watcher):
+    def __init__(self, path: str) -> None:
+        """
+        Initialize a new InotifyWatcher of the directory tree rooted at path.
+
+        The InotifyWatcher is notified of changes by the Linux kernel, so watching
+        does not touch the disk at all. Every directory of the tree needs its own
+        inotify watch, so the tree must not contain more directories than
+        /proc/sys/fs/inotify/max_user_watches allows. If the kernel drops events
+        because they were not read in time, reading raises a FluentFsException.
+
+        :param path: The maximally expanded path of the root directory.
+        """
+        super().__init__(path)
+
+        libc = _libc()
+        if libc is None:
+            raise FluentFsException("inotify is not available on this system")
+        self.libc = libc
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise FluentFsException(
+                f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}"
+            )
+
+        self.wd_paths: Dict[int, str] = {}
+        self.path_wds: Dict[str, int] = {}
+        # Files and directories moved away in the events being read, by cookie
+        self.moved_from: Dict[int, ChangeEvent] = {}
+
+        try:
+            self._add_tree(path, None)
+        except FluentFsException:
+            self.close()
+            raise
+        if path not in self.path_wds:
+            self.close()
+            raise FluentFsException(f"Cannot watch {path}")
+
+    def _add_watch(self, path: str) -> bool:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            if ctypes.get_errno() == errno.ENOSPC:
+                raise FluentFsException(
+                    "Too many inotify watches (see /proc/sys/fs/inotify/max_user_watches)"
+                )
+            # The directory vanished or cannot be watched
+            return False
+        self.wd_paths[wd] = path
+        self.path_wds[path] = wd
+        return True
+
+    def _add_tree(self, path: str, events: Optional[List[ChangeEvent]]) -> None:
+        # Watches path and all directories below it. If events is given, everything
+        # below path is reported as created, since the tree may have been filled
+        # before its directories were watched.
+        pending = [path]
+        while len(pending) != 0:
+            dir_path = pending.pop()
+            # The watch is added before the listing, so nothing created in between
+            # is lost
+            if not self._add_watch(dir_path):
+                continue
+            listing = scan_dir(dir_path, sort=False)
+            if listing is None:
+                continue
+
+            dir_entries, file_entries = listing
+            if events is not None:
+                events.extend(
+                    ChangeEvent(ChangeKind.CREATED, entry.path, entry.is_dir())
+                    for entry in dir_entries + file_entries
+                )
+            pending.extend(entry.path for entry in dir_entries)
+
+    def _watched_below(self, path: str) -> List[str]:
+        return [p for p in self.path_wds if is_sub_path(p, path)]
+
+    def _remove_tree(self, path: str) -> None:
+        for watched_path in self._watched_below(path):
+            wd = self.path_wds.pop(watched_path)
+            del self.wd_paths[wd]
+            self.libc.inotify_rm_watch(self.fd, wd)
+
+    def _move_tree(self, path: str, dest_path: str) -> None:
+        # The watches stay valid when a directory is moved, only the paths change
+        for watched_path in self._watched_below(path):
+            wd = self.path_wds.pop(watched_path)
+            new_path = watched_path.replace(path, dest_path, 1)
+            self.wd_paths[wd] = new_path
+            self.path_wds[new_path] = wd
+
+    def _forget(self, wd: int) -> None:
+        # The kernel removed the watch (e.g. because the directory was deleted)
+        path = self.wd_paths.pop(wd, None)
+        # The path may be watched again by now (with a new watch descriptor)
+        if path is not None and self.path_wds.get(path) == wd:
+            del self.path_wds[path]
+
+    def _handle_move(
+        self, path: str, is_dir: bool, mask: int, cookie: int, events: List[ChangeEvent]
+    ) -> None:
+        if mask & IN_MOVED_FROM:
+            self.moved_from[cookie] = ChangeEvent(ChangeKind.MOVED, path, is_dir)
+            return
+
+        event = self.moved_from.pop(cookie, None)
+        if event is None:
+            # Moved into the tree from somewhere else
+            events.append(ChangeEvent(ChangeKind.CREATED, path, is_dir))
+            if is_dir:
+                self._add_tree(path, events)
+            return
+
+        event.dest_path = path
+        events.append(event)
+        if is_dir:
+            self._move_tree(event.path, path)
+
+    def _handle(
+        self, wd: int, mask: int, cookie: int, name: str, events: List[ChangeEvent]
+    ) -> None:
+        if mask & IN_Q_OVERFLOW:
+            raise FluentFsException("The inotify event queue overflowed")
+        if mask & IN_IGNORED:
+            self._forget(wd)
+            return
+        dir_path = self.wd_paths.get(wd)
+        if dir_path is None:
+            # The directory has already been removed from the watched tree
+            return
+
+        path = os.path.join(dir_path, name)
+        is_dir = bool(mask & IN_ISDIR)
+        if mask & IN_CREATE:
+            events.append(ChangeEvent(ChangeKind.CREATED, path, is_dir))
+            if is_dir:
+                self._add_tree(path, events)
+        elif mask & IN_DELETE:
+            events.append(ChangeEvent(ChangeKind.DELETED, path, is_dir))
+        elif mask & (IN_MOVED_FROM | IN_MOVED_TO):
+            self._handle_move(path, is_dir, mask, cookie, events)
+        elif not is_dir:
+            events.append(ChangeEvent(ChangeKind.MODIFIED, path, False))
+
+    def _read_available(self) -> List[ChangeEvent]:
+        chunks: List[bytes] = []
+        for _ in range(_MAX_READS):
+            try:
+                chunks.append(os.read(self.fd, _READ_SIZE))
+            except BlockingIOError:
+                break
+
+        events: List[ChangeEvent] = []
+        for wd, mask, cookie, name in parse_events(b"".join(chunks)):
+            self._handle(wd, mask, cookie, name, events)
+
+        # The two events of a move within the tree are usually read together, so an
+        # unmatched move away is treated as a move out of the tree. If the other
+        # event comes later, it is treated as a move into the tree.
+        for event in self.moved_from.values():
+            events.append(ChangeEvent(ChangeKind.DELETED, event.path, event.is_dir))
+            if event.is_dir:
+                self._remove_tree(event.path)
+        self.moved_from.clear()
+        return _collapse(events)
+
+    def read(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            remaining = (
+                max(deadline - time.monotonic(), 0) if deadline is not None else None
+            )
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if len(ready) != 0:
+                events = self._read_available()
+                if len(events) != 0:
+                    return events
+            if remaining == 0:
+                return []
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
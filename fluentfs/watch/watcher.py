@@ -0,0 +1,221 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from fluentfs.walk.walker import Walker, is_sub_path
+from fluentfs.watch.event import ChangeEvent, ChangeKind
+
+
+class Watcher(ABC):
+    def __init__(self, path: str) -> None:
+        """
+        Initialize a new Watcher of the directory tree rooted at path.
+
+        :param path: The maximally expanded path of the root directory.
+        """
+        self.path = path
+
+    @abstractmethod
+    def read(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        """
+        Wait for changes in the directory tree.
+
+        Changes to the root directory itself are not reported. Note that a change may
+        be reported more than once.
+
+        :param timeout: The maximum number of seconds to wait. By default, this waits
+            until something changes.
+        :return: The changes since the last call or an empty list if nothing changed
+            before the timeout.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def close(self) -> None:
+        """
+        Stop watching the directory tree.
+        """
+
+    def __enter__(self) -> "Watcher":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[ChangeEvent]:
+        while True:
+            yield from self.read()
+
+
+class SnapshotEntry(NamedTuple):
+    is_dir: bool
+    inode: int
+    size: int
+    mtime_ns: int
+
+
+Snapshot = Dict[str, SnapshotEntry]
+
+
+def take_snapshot(path: str) -> Snapshot:
+    """
+    Record the state of all (regular) files and directories below a directory.
+
+    :param path: The path of the directory.
+    :return: The snapshot.
+    """
+    snapshot = {}
+    for entry in Walker(path):
+        if entry.path == path:
+            continue
+        try:
+            stat = entry.stat(follow_symlinks=False)
+        except OSError:  # pragma: no cover
+            # The entry vanished during the walk
+            continue
+        snapshot[entry.path] = SnapshotEntry(
+            entry.is_dir(follow_symlinks=False),
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+    return snapshot
+
+
+def _move_key(entry: SnapshotEntry) -> SnapshotEntry:
+    # A rename keeps the inode, size and modification time of a file. The
+    # modification time of a directory is updated whenever its entries change, so
+    # directories are only matched by their inodes.
+    return entry._replace(size=0, mtime_ns=0) if entry.is_dir else entry
+
+
+def _match_moves(
+    old: Snapshot, new: Snapshot, deleted: List[str], created: List[str]
+) -> Dict[str, str]:
+    created_by_key = {_move_key(new[path]): path for path in created}
+    moves = {}
+    for path in deleted:
+        dest_path = created_by_key.get(_move_key(old[path]))
+        if dest_path is not None:
+            moves[path] = dest_path
+    return moves
+
+
+def _implied_moves(moves: Dict[str, str]) -> List[str]:
+    # Moving a directory moves everything below it, which is reported as a single
+    # move of the directory
+    implied: List[str] = []
+    moved_dirs: List[str] = []
+    for path in sorted(moves):
+        if any(
+            is_sub_path(path, dir_path)
+            and moves[path] == path.replace(dir_path, moves[dir_path], 1)
+            for dir_path in moved_dirs
+        ):
+            implied.append(path)
+        else:
+            moved_dirs.append(path)
+    return implied
+
+
+def _missing(snapshot: Snapshot, other: Snapshot) -> List[str]:
+    return [
+        path
+        for path, entry in snapshot.items()
+        if path not in other or other[path].is_dir != entry.is_dir
+    ]
+
+
+def _modified(old: Snapshot, new: Snapshot) -> List[str]:
+    return [
+        path
+        for path, entry in new.items()
+        if path in old
+        and not entry.is_dir
+        and not old[path].is_dir
+        and (entry.size, entry.mtime_ns) != (old[path].size, old[path].mtime_ns)
+    ]
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> List[ChangeEvent]:
+    """
+    Get the changes between two snapshots of a directory tree.
+
+    Files and directories that changed their paths but kept their inodes (and for
+    files also their sizes and modification times) are reported as moved.
+
+    :param old: The old snapshot.
+    :param new: The new snapshot.
+    :return: The changes, i.e. the deletions (deepest paths first), the moves, the
+        creations and the modifications.
+    """
+    # A file replaced by a directory (or vice versa) is deleted and created
+    deleted = _missing(old, new)
+    created = _missing(new, old)
+    moves = _match_moves(old, new, deleted, created)
+    sources, dests = set(moves), set(moves.values())
+    for path in _implied_moves(moves):
+        del moves[path]
+
+    events = [
+        ChangeEvent(ChangeKind.DELETED, path, old[path].is_dir)
+        for path in sorted(deleted, reverse=True)
+        if path not in sources
+    ]
+    events.extend(
+        ChangeEvent(ChangeKind.MOVED, path, old[path].is_dir, moves[path])
+        for path in sorted(moves)
+    )
+    events.extend(
+        ChangeEvent(ChangeKind.CREATED, path, new[path].is_dir)
+        for path in sorted(created)
+        if path not in dests
+    )
+    events.extend(
+        ChangeEvent(ChangeKind.MODIFIED, path, False)
+        for path in sorted(_modified(old, new))
+    )
+    return events
+
+
+class PollingWatcher(Watcher):
+    def __init__(self, path: str, interval: float = 1.0) -> None:
+        """
+        Initialize a new PollingWatcher of the directory tree rooted at path.
+
+        The PollingWatcher walks the whole tree every interval seconds and compares
+        the result to the previous walk. This works everywhere, but the cost of
+        every poll grows with the size of the tree. Polls are never less than
+        interval seconds apart, so reading more often (e.g. with a timeout of 0)
+        only reports the changes found by the last poll.
+
+        :param path: The maximally expanded path of the root directory.
+        :param interval: The number of seconds between two polls.
+        """
+        super().__init__(path)
+        self.interval = interval
+        self.snapshot = take_snapshot(path)
+        self.last_poll = time.monotonic()
+
+    def _poll(self) -> List[ChangeEvent]:
+        snapshot = take_snapshot(self.path)
+        self.last_poll = time.monotonic()
+        events = diff_snapshots(self.snapshot, snapshot)
+        self.snapshot = snapshot
+        return events
+
+    def read(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            now = time.monotonic()
+            delay = self.last_poll + self.interval - now
+            if delay <= 0:
+                events = self._poll()
+                if len(events) != 0:
+                    return events
+                delay = self.interval
+
+            if deadline is not None:
+                delay = min(delay, deadline - now)
+                if delay <= 0:
+                    return []
+            time.sleep(delay)
@@ -42,9 +42,11 @@ table = fs.Table(cols=["Path", "Total lines", "Source lines", "Blank lines"])
 total_lines_all, source_lines_all, blank_lines_all = 0, 0, 0
 
 for file in files:
-    total_lines = file.line_count
-    blank_lines = file.lines.filter(lambda line: line == "" or line.isspace()).len()
-    source_lines = total_lines - blank_lines
+    # Every file is read once for all metrics
+    stats = file.stats(["line_count", "empty_line_count", "non_empty_line_count"])
+    total_lines = stats.line_count
+    blank_lines = stats.empty_line_count
+    source_lines = stats.non_empty_line_count
 
     total_lines_all += total_lines
     blank_lines_all += blank_lines
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from typing import Iterator, List
+from unittest import IsolatedAsyncioTestCase
+
+import fluentfs as fs
+from fluentfs.common import deferred, iterate_async, map_async
+
+
+def _failing() -> Iterator[int]:
+    yield 1
+    raise fs.FluentFsException("failed")
+
+
+class IterateAsyncTest(IsolatedAsyncioTestCase):
+    async def test_iterate_async(self) -> None:
+        items = [i async for i in iterate_async(list(range(10)), batch_size=3)]
+        self.assertEqual(items, list(range(10)))
+
+    async def test_iterate_async_empty(self) -> None:
+        empty: List[int] = []
+        self.assertEqual([item async for item in iterate_async(empty)], [])
+
+    async def test_iterate_async_exception(self) -> None:
+        items: List[int] = []
+        with self.assertRaises(fs.FluentFsException):
+            async for item in iterate_async(_failing()):
+                items.append(item)
+        self.assertEqual(items, [1])
+
+    async def test_iterate_async_immediate_exception(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            async for _ in iterate_async(deferred(_failing), batch_size=1):
+                pass
+
+    async def test_iterate_async_off_loop(self) -> None:
+        loop_thread = threading.get_ident()
+        threads = [
+            thread
+            async for thread in iterate_async(deferred(lambda: [threading.get_ident()]))
+        ]
+        self.assertNotEqual(threads, [loop_thread])
+
+    async def test_iterate_async_backpressure(self) -> None:
+        pulled = []
+
+        def produce() -> Iterator[int]:
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        items = iterate_async(produce(), batch_size=1, max_batches=1)
+        self.assertEqual(await items.__anext__(), 0)
+        await asyncio.sleep(0.05)
+        # One batch is consumed, one is buffered and one is waiting to be buffered
+        self.assertLessEqual(len(pulled), 3)
+        await items.aclose()
+
+
+class MapAsyncTest(IsolatedAsyncioTestCase):
+    async def test_map_async(self) -> None:
+        results = [r async for r in map_async(range(20), lambda x: x * 2, 3)]
+        self.assertEqual(results, [x * 2 for x in range(20)])
+
+    async def test_map_async_concurrency(self) -> None:
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def fun(x: int) -> int:
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            threading.Event().wait(0.001)
+            with lock:
+                running[0] -= 1
+            return x
+
+        results = [r async for r in map_async(range(20), fun, concurrency=2)]
+        self.assertEqual(results, list(range(20)))
+        self.assertLessEqual(running[1], 2)
+
+    async def test_map_async_close(self) -> None:
+        results = map_async(range(20), lambda x: x, concurrency=4)
+        self.assertEqual(await results.__anext__(), 0)
+        await results.aclose()
+
+
+class FunctionalIteratorAsyncTest(IsolatedAsyncioTestCase):
+    async def test_aiter(self) -> None:
+        it = fs.FunctionalIterator([1, 2, 3]).map(lambda x: x + 1)
+        self.assertEqual([x async for x in it.aiter()], [2, 3, 4])
+
+    async def test_amap(self) -> None:
+        it = fs.FunctionalIterator([1, 2, 3])
+        self.assertEqual([x async for x in it.amap(lambda x: x * x)], [1, 4, 9])
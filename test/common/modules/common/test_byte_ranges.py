@@ -0,0 +1,47 @@
+from test.tmp_dir_test_case import TmpDirTestCase
+
+from fluentfs.common import ByteRange, open_text_range, split_lines
+
+
+class ByteRangesTest(TmpDirTestCase):
+    def _split(self, content: bytes, range_size: int) -> list:
+        self._write(content)
+        return split_lines(self.path, len(content), range_size)
+
+    def test_split_lines_small_file(self) -> None:
+        self.assertEqual(self._split(b"a\nb\n", 4), [ByteRange(0, 4)])
+        self.assertEqual(self._split(b"", 1), [ByteRange(0, 0)])
+
+    def test_split_lines_aligned(self) -> None:
+        content = "ab\ncdé\n\nfg\r\nh".encode()
+        for range_size in range(1, len(content)):
+            ranges = self._split(content, range_size)
+            self.assertEqual(ranges[0].start, 0)
+            self.assertEqual(ranges[-1].end, len(content))
+            for previous, current in zip(ranges, ranges[1:]):
+                self.assertEqual(previous.end, current.start)
+                self.assertEqual(content[current.start - 1], ord("\n"))
+
+    def test_split_lines_range_size(self) -> None:
+        self.assertEqual(
+            self._split(b"a\nb\nc\nd\n", 4), [ByteRange(0, 4), ByteRange(4, 8)]
+        )
+        self.assertEqual(
+            self._split(b"abc\nd\ne\n", 2),
+            [ByteRange(0, 4), ByteRange(4, 6), ByteRange(6, 8)],
+        )
+
+    def test_split_lines_no_newline(self) -> None:
+        self.assertEqual(self._split(b"abcdef", 2), [ByteRange(0, 6)])
+        self.assertEqual(
+            self._split(b"ab\ncdef", 2), [ByteRange(0, 3), ByteRange(3, 7)]
+        )
+
+    def test_open_text_range(self) -> None:
+        self._write("ab\ncdé\nfg".encode())
+        with open_text_range(self.path, "utf-8", ByteRange(3, 8)) as file:
+            self.assertEqual(file.name, self.path)
+            self.assertEqual(file.read(), "cdé\n")
+        self.assertTrue(file.closed)
+        with open_text_range(self.path, "utf-8", ByteRange(8, 8)) as file:
+            self.assertEqual(file.read(), "")
@@ -87,3 +87,7 @@ class TestFunctional(TestCase):
                 cols={"val": [1, 2, 3, 4], "sq": [1, 4, 9, 16], "cube": [1, 8, 27, 64]}
             ),
         )
+
+    def test_par_map(self) -> None:
+        result = fs.FunctionalIterator([1, 2, 3]).par_map(lambda x: x * 2, 2).list()
+        self.assertEqual(result, [2, 4, 6])
@@ -0,0 +1,120 @@
+from io import BytesIO
+from test.tmp_dir_test_case import TmpDirTestCase
+from typing import List, Optional
+from unittest import TestCase
+
+import fluentfs as fs
+from fluentfs.common import (
+    LineCounter,
+    LineDecodeError,
+    count_lines,
+    count_newlines,
+    decode_lines,
+    is_ascii_compatible,
+)
+
+
+class IsAsciiCompatibleTest(TestCase):
+    def test_is_ascii_compatible(self) -> None:
+        for encoding in ["utf-8", "UTF8", "ascii", "latin-1", "iso-8859-15", "cp1252"]:
+            self.assertTrue(is_ascii_compatible(encoding), encoding)
+
+    def test_is_not_ascii_compatible(self) -> None:
+        for encoding in ["utf-16", "utf-32-le", "utf-8-sig", "cp500"]:
+            self.assertFalse(is_ascii_compatible(encoding), encoding)
+
+
+class LineCounterTest(TestCase):
+    def _count(self, *chunks: bytes) -> int:
+        counter = LineCounter()
+        for chunk in chunks:
+            counter.feed(chunk)
+        return counter.line_count
+
+    def test_empty(self) -> None:
+        self.assertEqual(self._count(), 0)
+        self.assertEqual(self._count(b"", b""), 0)
+
+    def test_trailing_newline(self) -> None:
+        self.assertEqual(self._count(b"a\nb\n"), 2)
+        self.assertEqual(self._count(b"a\nb"), 2)
+
+    def test_newline_kinds(self) -> None:
+        self.assertEqual(self._count(b"a\r\nb\rc\n"), 3)
+        self.assertEqual(self._count(b"\r\r\n\n\r"), 4)
+
+    def test_crlf_across_chunks(self) -> None:
+        self.assertEqual(self._count(b"a\r", b"\nb"), 2)
+        self.assertEqual(self._count(b"a\r", b"", b"\nb\r", b"\r"), 3)
+
+
+class CountLinesTest(TmpDirTestCase):
+    def test_count_lines(self) -> None:
+        self._write(b"a\r\nb\r\nc")
+        for chunk_size in [1, 2, 3, 1 << 20]:
+            self.assertEqual(count_lines(self.path, "utf-8", chunk_size), 3)
+
+    def test_count_lines_multibyte_across_chunks(self) -> None:
+        self._write("ä\nö\n€".encode())
+        for chunk_size in [1, 2, 3]:
+            self.assertEqual(count_lines(self.path, "utf-8", chunk_size), 3)
+
+    def test_count_lines_invalid(self) -> None:
+        for content in [b"a\n\xe4\n", b"a\n\xc3"]:
+            self._write(content)
+            with self.assertRaises(UnicodeDecodeError):
+                count_lines(self.path, "utf-8", 2)
+            with self.assertRaises(UnicodeDecodeError):
+                count_lines(self.path, "ascii")
+            self.assertEqual(count_lines(self.path, "latin-1"), 2)
+
+    def test_count_newlines_range(self) -> None:
+        self._write(b"a\nb\r\nc\nd")
+        self.assertEqual(count_newlines(self.path, "utf-8", 2, 7).line_count, 2)
+        self.assertEqual(count_newlines(self.path, "utf-8", 7).line_count, 1)
+        self.assertEqual(count_newlines(self.path, "utf-8", 3, 3).line_count, 0)
+
+
+class DecodeLinesTest(TestCase):
+    def _lines(
+        self, content: bytes, chunk_size: int, line_len_limit: Optional[int] = None
+    ) -> List[str]:
+        file = BytesIO(content)
+        return list(decode_lines(file, "utf-8", line_len_limit, chunk_size=chunk_size))
+
+    def test_decode_lines(self) -> None:
+        for chunk_size in [1, 2, 3, 1 << 16]:
+            self.assertEqual(
+                self._lines("a\r\nbä\rc\n\nd".encode(), chunk_size),
+                ["a\n", "bä\n", "c\n", "\n", "d"],
+            )
+            self.assertEqual(self._lines(b"a\n", chunk_size), ["a\n"])
+            self.assertEqual(self._lines(b"", chunk_size), [])
+
+    def test_decode_lines_error(self) -> None:
+        for chunk_size in [1, 2, 3, 1 << 16]:
+            lines = []
+            file = BytesIO(b"ab\r\ncd\re\xe4f\ng\n")
+            with self.assertRaises(LineDecodeError) as context:
+                for line in decode_lines(
+                    file, "utf-8", offset=10, chunk_size=chunk_size
+                ):
+                    lines.append(line)
+            self.assertEqual(lines, ["ab\n", "cd\n"])
+            self.assertEqual(context.exception.offset, 18)
+            self.assertEqual(
+                str(context.exception), "invalid continuation byte at byte 18"
+            )
+
+    def test_decode_lines_line_len_limit(self) -> None:
+        for chunk_size in [1, 3, 1 << 16]:
+            self.assertEqual(
+                self._lines(b"123\n12\n123", chunk_size, 3), ["123\n", "12\n", "123"]
+            )
+            for content in [b"12\n1234\n", b"12\n1234"]:
+                lines = decode_lines(
+                    BytesIO(content), "utf-8", 3, chunk_size=chunk_size
+                )
+                self.assertEqual(next(lines), "12\n")
+                with self.assertRaises(fs.FluentFsException):
+                    next(lines)
@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+from unittest import TestCase
+
+import fluentfs as fs
+from fluentfs.common import parallel_map
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def fail_on_three(x: int) -> int:
+    if x == 3:
+        raise ValueError("three")
+    return x
+
+
+def sleep_inverse(x: int) -> int:
+    # Later items complete earlier
+    time.sleep(0.01 * (5 - x))
+    return x
+
+
+class ParallelMapTest(TestCase):
+    def test_thread(self) -> None:
+        self.assertEqual(
+            list(parallel_map(range(10), square, 3)), [x * x for x in range(10)]
+        )
+
+    def test_process(self) -> None:
+        self.assertEqual(
+            list(parallel_map(range(10), square, 2, "process", chunksize=3)),
+            [x * x for x in range(10)],
+        )
+
+    def test_lambda(self) -> None:
+        self.assertEqual(list(parallel_map([1, 2], lambda x: x + 1)), [2, 3])
+
+    def test_empty(self) -> None:
+        self.assertEqual(list(parallel_map([], square)), [])
+
+    def test_unordered(self) -> None:
+        results = list(parallel_map(range(5), sleep_inverse, 5, ordered=False))
+        self.assertEqual(sorted(results), list(range(5)))
+        self.assertNotEqual(results, list(range(5)))
+
+    def test_exception(self) -> None:
+        for executor in fs.common.EXECUTOR_KINDS:
+            results: List[int] = []
+            with self.assertRaises(ValueError):
+                for result in parallel_map(range(10), fail_on_three, 2, executor):
+                    results.append(result)
+            self.assertEqual(results, [0, 1, 2])
+
+    def test_exception_unordered(self) -> None:
+        with self.assertRaises(ValueError):
+            list(parallel_map(range(10), fail_on_three, 2, ordered=False))
+
+    def test_existing_executor(self) -> None:
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(list(parallel_map([1, 2], square, 2, executor)), [1, 4])
+            # The executor is not shut down
+            self.assertEqual(executor.submit(square, 3).result(), 9)
+
+    def test_backpressure(self) -> None:
+        pulled = []
+        release = threading.Event()
+
+        def items() -> Iterator[int]:
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        def wait(x: int) -> int:
+            release.wait()
+            return x
+
+        results = parallel_map(items(), wait, 2, max_pending=3)
+        release.set()
+        self.assertEqual(next(results), 0)
+        # The first result is due once three items are in flight
+        self.assertEqual(len(pulled), 3)
+        self.assertEqual(len(list(results)), 99)
+
+    def test_close_early(self) -> None:
+        results = parallel_map(range(100), square, 2)
+        self.assertEqual(next(results), 0)
+        results.close()  # type: ignore
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            parallel_map([1], square, 0)
+        with self.assertRaises(fs.FluentFsException):
+            parallel_map([1], square, chunksize=0)
+        with self.assertRaises(fs.FluentFsException):
+            parallel_map([1], square, executor="fiber")
@@ -0,0 +1,48 @@
+from test.tmp_dir_test_case import TmpDirTestCase
+
+from fluentfs.common import count_chars, count_words
+
+
+class TextCountsTest(TmpDirTestCase):
+    def _content(self, encoding: str) -> str:
+        with open(self.path, "r", encoding=encoding) as f:
+            return f.read()
+
+    def test_count_chars_same_as_content(self) -> None:
+        contents = [
+            ("", "utf-8"),
+            ("abc", "ascii"),
+            ("a\r\nb\rc\n\r\r\n", "utf-8"),
+            ("äö\r\n€ x\r\n", "utf-8"),
+            ("äö\r\n", "latin-1"),
+            ("ä\r\nö\r\n", "utf-16"),
+        ]
+        for text, encoding in contents:
+            self._write(text.encode(encoding))
+            expected = len(self._content(encoding))
+            for chunk_size in [1, 2, 3, 1 << 20]:
+                self.assertEqual(
+                    count_chars(self.path, encoding, chunk_size), expected, text
+                )
+
+    def test_count_chars_invalid(self) -> None:
+        for content in [b"a\xe4b", b"ab\xc3"]:
+            self._write(content)
+            for chunk_size in [1, 1 << 20]:
+                with self.assertRaises(UnicodeDecodeError):
+                    count_chars(self.path, "utf-8", chunk_size)
+
+    def test_count_words_same_as_split(self) -> None:
+        contents = ["", "  ", "one", "one two\n three ", "a　b\x1cc\xa0d", "ab cd"]
+        for text in contents:
+            self._write(text.encode())
+            expected = len(text.split())
+            for chunk_size in [1, 2, 3, 1 << 20]:
+                self.assertEqual(
+                    count_words(self.path, "utf-8", chunk_size), expected, text
+                )
+
+    def test_count_words_invalid(self) -> None:
+        self._write(b"a\xe4b")
+        with self.assertRaises(UnicodeDecodeError):
+            count_words(self.path, "utf-8")
@@ -0,0 +1,72 @@
+import threading
+from unittest import TestCase
+
+import fluentfs as fs
+
+
+class ContentCacheTest(TestCase):
+    def test_get_put(self) -> None:
+        cache = fs.ContentCache(100)
+        key = ("/a", 1, 10, "utf-8")
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "a", 10)
+        self.assertEqual(cache.get(key), "a")
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 0))
+        self.assertEqual((len(cache), cache.size), (1, 10))
+
+    def test_put_again(self) -> None:
+        cache = fs.ContentCache(100)
+        key = ("/a", 1, 10, "utf-8")
+        cache.put(key, "a", 10)
+        cache.put(key, "b", 10)
+        self.assertEqual(cache.get(key), "b")
+        self.assertEqual((len(cache), cache.size, cache.evictions), (1, 10, 0))
+
+    def test_lru_eviction(self) -> None:
+        cache = fs.ContentCache(25)
+        keys = [(f"/{name}", 1, 10, "utf-8") for name in "abc"]
+        cache.put(keys[0], "a", 10)
+        cache.put(keys[1], "b", 10)
+        # a is now used more recently than b
+        cache.get(keys[0])
+        cache.put(keys[2], "c", 10)
+        self.assertEqual(cache.get(keys[0]), "a")
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.get(keys[2]), "c")
+        self.assertEqual((cache.evictions, cache.size), (1, 20))
+
+    def test_too_big(self) -> None:
+        cache = fs.ContentCache(10)
+        cache.put(("/a", 1, 11, "utf-8"), "a", 11)
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_clear(self) -> None:
+        cache = fs.ContentCache(100)
+        cache.put(("/a", 1, 10, "utf-8"), "a", 10)
+        cache.get(("/a", 1, 10, "utf-8"))
+        cache.clear()
+        self.assertEqual((len(cache), cache.size, cache.hits), (0, 0, 1))
+
+    def test_threads(self) -> None:
+        cache = fs.ContentCache(50)
+
+        def work(thread_index: int) -> None:
+            for i in range(200):
+                key = (f"/{thread_index}/{i % 8}", 1, 10, "utf-8")
+                if cache.get(key) is None:
+                    cache.put(key, "x", 10)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cache.hits + cache.misses, 800)
+        self.assertLessEqual(cache.size, 50)
+        self.assertEqual(cache.size, 10 * len(cache))
+
+    def test_repr(self) -> None:
+        self.assertEqual(
+            repr(fs.ContentCache(10)),
+            "ContentCache(size=0, max_bytes=10, hits=0, misses=0, evictions=0)",
+        )
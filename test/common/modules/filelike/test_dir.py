@@ -1,4 +1,6 @@
 import os
+import tempfile
+from test.common.modules.walk.test_walker import make_ignore_tree, make_link_tree
 from test.test_fs_values import (
     A_SYMLINK_PATH,
     A_TXT_PATH,
@@ -16,7 +18,7 @@ from test.test_fs_values import (
     RNDBIN2_PATH,
     SUB_DIR_PATH,
 )
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase, TestCase
 
 import fluentfs as fs
 
@@ -116,6 +118,157 @@ class DirDirsTest(TestCase):
         os.remove(BASE_DIR_SYMLINK_PATH)
 
 
+class DirWalkTest(TestCase):
+    def test_walk(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk()
+        self.assertEqual(
+            walk.file_likes.map(lambda f: f.path).list(),
+            fs.Dir(BASE_DIR_PATH).file_likes.map(lambda f: f.path).list(),
+        )
+
+    def test_walk_include_base_path(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(include_base_path=SUB_DIR_PATH)
+        self.assertEqual(walk.dirs.map(lambda d: d.path).list(), [SUB_DIR_PATH])
+        self.assertEqual(
+            walk.files.map_path().list(),
+            [D_TXT_PATH, E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH],
+        )
+
+    def test_walk_exclude_base_path(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(exclude_base_path=SUB_DIR_PATH)
+        self.assertEqual(walk.dirs.map(lambda d: d.path).list(), [BASE_DIR_PATH])
+
+    def test_walk_exclude_dir_glob(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(exclude_dir_glob="*/sub_dir")
+        self.assertEqual(walk.files.len(), 6)
+
+    def test_walk_exclude_dir_regex(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(exclude_dir_regex=[".*/sub_dir"])
+        self.assertEqual(walk.files.len(), 6)
+
+    def test_walk_dir_filter(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(dir_filter=lambda d: d.name != "sub_dir")
+        self.assertEqual(walk.files.len(), 6)
+
+    def test_walk_max_depth(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(max_depth=1)
+        self.assertEqual(walk.files.len(), 6)
+        self.assertEqual(walk.dirs.len(), 2)
+
+    def test_walk_breadth_first_unsorted(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(breadth_first=True, sort=False)
+        self.assertEqual(walk.file_likes.len(), 12)
+
+    def test_walk_lists(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(
+            include_base_path=[SUB_DIR_PATH], exclude_base_path=[D_TXT_PATH]
+        )
+        self.assertEqual(
+            walk.files.map_path().list(), [E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH]
+        )
+
+    def test_walk_respect_gitignore(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            make_ignore_tree(tmp_dir)
+            walk = fs.Dir(tmp_dir).walk(respect_gitignore=True)
+            self.assertEqual(
+                walk.files.map_name().list(),
+                [
+                    ".gitignore",
+                    "a.py",
+                    "keep.log",
+                    ".gitignore",
+                    ".ignore",
+                    "b.py",
+                    "gen",
+                ],
+            )
+
+    def test_walk_follow_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            make_link_tree(tmp_dir)
+            tree = fs.Dir(os.path.join(tmp_dir, "tree"))
+            files = tree.walk(follow_symlinks=True).files
+            self.assertEqual(files.map_name().list(), ["f1", "f2", "g"])
+            self.assertEqual(tree.files.map_name().list(), ["hard", "f1", "f2"])
+            self.assertEqual(tree.walk(follow_symlinks=True).dirs.len(), 4)
+
+    def test_walk_one_file_system(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(
+            one_file_system=True, allowed_mounts=SUB_DIR_PATH
+        )
+        self.assertEqual(walk.walker.allowed_mounts, [SUB_DIR_PATH])
+        self.assertEqual(walk.files.len(), 10)
+        walk = fs.Dir(BASE_DIR_PATH).walk(one_file_system=True, allowed_mounts=[])
+        self.assertEqual(walk.walker.allowed_mounts, [])
+
+    def test_walk_count(self) -> None:
+        walk = fs.Dir(BASE_DIR_PATH).walk(exclude_base_path=SUB_DIR_PATH)
+        self.assertEqual(walk.count(), 7)
+        self.assertEqual(walk.count(fs.FileLikeKind.FILE), 6)
+        self.assertEqual(walk.count(fs.FileLikeKind.DIR), 1)
+        with self.assertRaises(fs.FluentFsException):
+            walk.count(fs.FileLikeKind.SYMLINK)
+
+    def test_walk_summary(self) -> None:
+        summary = fs.Dir(BASE_DIR_PATH).walk(exclude_base_path=SUB_DIR_PATH).summary()
+        self.assertEqual(summary.dir_count, 1)
+        self.assertEqual(summary.file_count, 6)
+
+    def test_count(self) -> None:
+        for workers in [1, 4]:
+            self.assertEqual(fs.Dir(BASE_DIR_PATH).count(workers=workers), 12)
+            self.assertEqual(
+                fs.Dir(BASE_DIR_PATH).count(fs.FileLikeKind.FILE, workers=workers),
+                fs.Dir(BASE_DIR_PATH).files.len(),
+            )
+
+    def test_summary(self) -> None:
+        for workers in [1, 4]:
+            summary = fs.Dir(BASE_DIR_PATH).summary(workers=workers)
+            self.assertEqual(summary.file_count, 10)
+            self.assertEqual(
+                summary.byte_count, fs.Dir(BASE_DIR_PATH).files.map_byte_count().sum()
+            )
+
+    def test_walk_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint_path = os.path.join(tmp_dir, "checkpoint")
+            files = (
+                fs.Dir(BASE_DIR_PATH)
+                .walk(
+                    checkpoint=checkpoint_path,
+                    checkpoint_interval=0,
+                    resume_from=checkpoint_path,
+                )
+                .files
+            )
+            paths = [next(files).path for _ in range(3)]
+            resumed_paths = (
+                fs.Dir(BASE_DIR_PATH)
+                .walk(resume_from=checkpoint_path)
+                .files.map_path()
+                .list()
+            )
+            # The last consumed file is yielded again (at-least-once delivery)
+            self.assertEqual(resumed_paths[0], paths[-1])
+            self.assertEqual(
+                paths + resumed_paths[1:],
+                fs.Dir(BASE_DIR_PATH).files.map_path().list(),
+            )
+
+
+class DirAsyncTest(IsolatedAsyncioTestCase):
+    async def test_afiles(self) -> None:
+        file_paths = [file.path async for file in fs.Dir(BASE_DIR_PATH).afiles()]
+        self.assertEqual(file_paths, fs.Dir(BASE_DIR_PATH).files.map_path().list())
+
+    async def test_afiles_filtered(self) -> None:
+        files = fs.Dir(BASE_DIR_PATH).walk(exclude_base_path=SUB_DIR_PATH).files
+        file_paths = [file.path async for file in files.filter_ext("txt").aiter()]
+        self.assertEqual(file_paths, [A_TXT_PATH, B_TXT_PATH, EMPTYLINES_TXT_PATH])
+
+
 class DirStrTest(TestCase):
     def test_str(self) -> None:
         self.assertEqual(str(fs.Dir(BASE_DIR_PATH)), f'Dir("{BASE_DIR_PATH}")')
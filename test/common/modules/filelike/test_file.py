@@ -1,5 +1,7 @@
 import datetime
 import os
+import pickle
+import tracemalloc
 from test.test_fs_values import (
     A_TXT_PATH,
     B_TXT_PATH,
@@ -9,6 +11,7 @@ from test.test_fs_values import (
     RNDBIN1_PATH,
 )
 from unittest import TestCase
+from unittest.mock import patch
 
 import fluentfs as fs
 
@@ -28,6 +31,14 @@ class FilePathTest(TestCase):
     def test_path(self) -> None:
         self.assertEqual(fs.File(A_TXT_PATH).path, A_TXT_PATH)
 
+    def test_path_expanded_once(self) -> None:
+        file = fs.File(A_TXT_PATH)
+        with patch("fluentfs.filelike.file_like.expand_path") as expand_path:
+            self.assertEqual(file.path, A_TXT_PATH)
+            self.assertEqual(file.name, "a.txt")
+            self.assertEqual(file.extension, "txt")
+        expand_path.assert_not_called()
+
 
 class FileBytesTest(TestCase):
     def test_bytes_empty(self) -> None:
@@ -102,6 +113,65 @@ class FileModTimeTest(TestCase):
         )
 
 
+class FileStatTest(TestCase):
+    def test_stat(self) -> None:
+        self.assertEqual(fs.File(A_TXT_PATH).stat().st_size, 6)
+
+    def test_stat_cached(self) -> None:
+        file = fs.File(A_TXT_PATH)
+        timestamp = datetime.datetime(2022, 1, 1, 10, 2, 50).timestamp()
+        os.utime(A_TXT_PATH, (timestamp, timestamp))
+        self.assertEqual(file.mod_time, datetime.datetime(2022, 1, 1, 10, 2, 50))
+
+        os.utime(A_TXT_PATH, (timestamp + 10, timestamp + 10))
+        self.assertEqual(file.mod_time, datetime.datetime(2022, 1, 1, 10, 2, 50))
+        self.assertEqual(file.stat(cached=False).st_mtime, timestamp + 10)
+        self.assertEqual(file.mod_time, datetime.datetime(2022, 1, 1, 10, 3, 0))
+
+    def test_refresh(self) -> None:
+        file = fs.File(A_TXT_PATH)
+        timestamp = datetime.datetime(2022, 1, 1, 10, 2, 50).timestamp()
+        os.utime(A_TXT_PATH, (timestamp, timestamp))
+        self.assertEqual(file.access_time, datetime.datetime(2022, 1, 1, 10, 2, 50))
+
+        os.utime(A_TXT_PATH, (timestamp + 10, timestamp + 10))
+        self.assertIs(file.refresh(), file)
+        self.assertEqual(file.access_time, datetime.datetime(2022, 1, 1, 10, 3, 0))
+
+    def test_stat_seeded(self) -> None:
+        stat_result = os.stat(RNDBIN1_PATH)
+        file = fs.File._from_trusted_path(RNDBIN1_PATH, stat_result)
+        self.assertIs(file.stat(), stat_result)
+
+    def test_stat_single_syscall(self) -> None:
+        file = fs.File(A_TXT_PATH)
+        with patch("os.stat", wraps=os.stat) as stat:
+            file.byte_count
+            file.size
+            file.access_time
+            file.mod_time
+        self.assertEqual(stat.call_count, 1)
+
+
+class FilePickleTest(TestCase):
+    def test_pickle(self) -> None:
+        file = fs.File(A_TXT_PATH)
+        file.stat()
+        unpickled = pickle.loads(pickle.dumps(file))
+        self.assertIs(type(unpickled), fs.File)
+        self.assertEqual(unpickled, file)
+        self.assertEqual(unpickled.stat(), file.stat())
+        # Unpickled file-likes share their contexts
+        other = pickle.loads(pickle.dumps(fs.File(B_TXT_PATH)))
+        self.assertIs(unpickled._context, other._context)
+
+    def test_pickle_does_not_check(self) -> None:
+        data = pickle.dumps(fs.Dir(BASE_DIR_PATH))
+        with patch("os.stat", wraps=os.stat) as stat:
+            self.assertEqual(pickle.loads(data).path, BASE_DIR_PATH)
+        self.assertEqual(stat.call_count, 0)
+
+
 class FileTextFileTest(TestCase):
     def test_text_file(self) -> None:
         self.assertEqual(fs.File(A_TXT_PATH).text_file().content, "line 1")
@@ -127,3 +197,25 @@ class FileStrTest(TestCase):
 
     def test_repr(self) -> None:
         self.assertEqual(repr(fs.File(A_TXT_PATH)), f'File("{A_TXT_PATH}")')
+
+
+class FileMemoryTest(TestCase):
+    def test_no_dict(self) -> None:
+        self.assertFalse(hasattr(fs.File(A_TXT_PATH), "__dict__"))
+        self.assertFalse(hasattr(fs.TextFile(A_TXT_PATH), "__dict__"))
+        self.assertFalse(hasattr(fs.Dir(BASE_DIR_PATH), "__dict__"))
+
+    def test_shared_context(self) -> None:
+        self.assertIs(fs.File(A_TXT_PATH)._context, fs.File(B_TXT_PATH)._context)
+
+    def test_memory_budget(self) -> None:
+        n = 10000
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        files = [fs.File._from_trusted_path(A_TXT_PATH) for _ in range(n)]
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(len(files), n)
+        # The budget includes the list slot referencing each file, but not the path
+        self.assertLess((after - before) / n, 80)
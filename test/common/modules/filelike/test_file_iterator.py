@@ -1,3 +1,5 @@
+import os
+import tempfile
 from test.test_fs_values import (
     A_TXT_PATH,
     B_TXT_PATH,
@@ -13,8 +15,10 @@ from test.test_fs_values import (
     SUB_DIR_PATH,
 )
 from unittest import TestCase
+from unittest.mock import patch
 
 import fluentfs as fs
+from fluentfs.walk import scan_dir
 
 
 class TestFileIterator(TestCase):
@@ -57,6 +61,31 @@ class TestFileIterator(TestCase):
             [D_TXT_PATH, E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH],
         )
 
+    def test_filter_base_path_str(self) -> None:
+        self.assertEqual(
+            fs.Dir(BASE_DIR_PATH)
+            .files.filter_base_path(SUB_DIR_PATH)
+            .map_path()
+            .list(),
+            [D_TXT_PATH, E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH],
+        )
+
+    def test_filter_not_base_path_str(self) -> None:
+        self.assertEqual(
+            fs.Dir(BASE_DIR_PATH)
+            .files.filter_not_base_path(SUB_DIR_PATH)
+            .map_path()
+            .list(),
+            [
+                A_TXT_PATH,
+                B_TXT_PATH,
+                C_TXT2_PATH,
+                EMPTYBIN_PATH,
+                EMPTYLINES_TXT_PATH,
+                RNDBIN1_PATH,
+            ],
+        )
+
     def test_filter_not_base_path(self) -> None:
         self.assertEqual(
             fs.Dir(BASE_DIR_PATH)
@@ -301,3 +330,126 @@ class TestFileIterator(TestCase):
             .list(),
             [1, 2, 3, 3, 4, 0],
         )
+
+    def test_map_counts_workers(self) -> None:
+        text_files = fs.Dir(BASE_DIR_PATH).files.filter_extension("txt").t().list()
+        for executor in ["process", "thread"]:
+            iterator = fs.TextFileIterator(text_files)
+            self.assertEqual(
+                iterator.map_line_count(workers=2, executor=executor).list(),
+                [1, 2, 5, 3, 4, 0],
+            )
+        iterator = fs.TextFileIterator(text_files)
+        self.assertEqual(iterator.map_word_count(workers=2).list(), [2, 4, 6, 6, 8, 0])
+        counts = [
+            fs.TextFileIterator(text_files).map_char_count(workers=2).list(),
+            fs.TextFileIterator(text_files).map_empty_line_count(workers=2).list(),
+            fs.TextFileIterator(text_files).map_non_empty_line_count(workers=2).list(),
+        ]
+        self.assertEqual(counts[0], [f.char_count for f in text_files])
+        self.assertEqual(counts[1], [0, 0, 2, 0, 0, 0])
+        self.assertEqual(counts[2], [1, 2, 3, 3, 4, 0])
+
+    def test_map_stats_workers(self) -> None:
+        text_files = fs.Dir(BASE_DIR_PATH).files.filter_extension("txt").t()
+        stats = text_files.map_stats(["line_count"], workers=2).list()
+        self.assertEqual([s.line_count for s in stats], [1, 2, 5, 3, 4, 0])
+
+    def test_map_stats(self) -> None:
+        text_files = fs.Dir(BASE_DIR_PATH).files.filter_extension("txt").t()
+        stats = text_files.map_stats(["line_count", "empty_line_count"]).list()
+        self.assertEqual(
+            [(s.line_count, s.empty_line_count) for s in stats],
+            [(1, 0), (2, 0), (5, 2), (3, 0), (4, 0), (0, 0)],
+        )
+        self.assertIsNone(stats[0].word_count)
+
+    def test_map_stats_same_as_properties(self) -> None:
+        text_files = fs.Dir(BASE_DIR_PATH).files.filter_extension("txt").t().list()
+        stats = fs.TextFileIterator(text_files).map_stats().list()
+        self.assertEqual(
+            [s.word_count for s in stats], [f.word_count for f in text_files]
+        )
+        self.assertEqual(
+            [s.char_count for s in stats], [f.char_count for f in text_files]
+        )
+
+    def test_map_split_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name, content in [
+                ("a.txt", b"foo\nbar\n\nfoo bar\n" * 30),
+                ("b.txt", b""),
+                ("c.txt", b"foo"),
+                ("d.txt", "föo\r\n\n".encode() * 40),
+            ]:
+                with open(os.path.join(tmp_dir, name), "wb") as f:
+                    f.write(content)
+            text_files = fs.Dir(tmp_dir).files.t().list()
+
+            def iterator() -> fs.TextFileIterator:
+                return fs.TextFileIterator(text_files)
+
+            for executor in ["thread", "process"]:
+                self.assertEqual(
+                    iterator()
+                    .map_line_count(workers=2, executor=executor, split_size=16)
+                    .list(),
+                    iterator().map_line_count().list(),
+                )
+                self.assertEqual(
+                    iterator()
+                    .map_stats(workers=2, executor=executor, split_size=16)
+                    .list(),
+                    iterator().map_stats().list(),
+                )
+                self.assertEqual(
+                    iterator()
+                    .map_grep_count("^f", workers=3, executor=executor, split_size=16)
+                    .list(),
+                    iterator().map_grep_count("^f").list(),
+                )
+            self.assertEqual(
+                iterator().map_grep_count("o b", literal=True).list(), [30, 0, 0, 0]
+            )
+
+    def test_map_stats_unknown_metric(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.Dir(BASE_DIR_PATH).files.t().map_stats(["lines"])
+
+
+class TestFileIteratorPushdown(TestCase):
+    def test_filter_not_base_path_pruned(self) -> None:
+        files = fs.Dir(BASE_DIR_PATH).files.filter_not_base_path(SUB_DIR_PATH)
+        with patch("fluentfs.walk.walker.scan_dir", wraps=scan_dir) as scan:
+            self.assertEqual(files.len(), 6)
+        scan.assert_called_once_with(BASE_DIR_PATH, True, False)
+
+    def test_filter_not_base_path_chained(self) -> None:
+        files = (
+            fs.Dir(BASE_DIR_PATH)
+            .files.filter_not_base_path(SUB_DIR_PATH)
+            .filter_not_base_path(A_TXT_PATH)
+        )
+        self.assertEqual(files.len(), 5)
+
+    def test_filter_base_path_chained(self) -> None:
+        files = (
+            fs.Dir(BASE_DIR_PATH)
+            .files.filter_base_path([SUB_DIR_PATH, A_TXT_PATH])
+            .filter_base_path(BASE_DIR_PATH)
+            .filter_base_path(SUB_DIR_PATH)
+        )
+        self.assertEqual(
+            files.map_path().list(),
+            [D_TXT_PATH, E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH],
+        )
+
+    def test_filter_base_path_started(self) -> None:
+        files = fs.Dir(BASE_DIR_PATH).files
+        next(files)
+        self.assertEqual(files.filter_base_path(SUB_DIR_PATH).len(), 4)
+
+    def test_filter_not_base_path_started(self) -> None:
+        files = fs.Dir(BASE_DIR_PATH).files
+        next(files)
+        self.assertEqual(files.filter_not_base_path(SUB_DIR_PATH).len(), 5)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from test.test_fs_values import (
     A2_SYMLINK_PATH,
     A_SYMLINK_PATH,
@@ -83,3 +84,34 @@ class BrokenSymLinkTest(TestCase):
 
         if os.path.islink(BROKEN_SYMLINK_PATH):
             os.remove(BROKEN_SYMLINK_PATH)
+
+
+class CycleSymLinkTest(TestCase):
+    def test_final_target_cycle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            a_path = os.path.join(tmp_dir, "a")
+            b_path = os.path.join(tmp_dir, "b")
+            os.symlink(b_path, a_path)
+            os.symlink(a_path, b_path)
+            with self.assertRaises(fs.FluentFsException):
+                fs.SymLink(a_path).final_target
+
+    def test_final_target_relative_cycle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            a_path = os.path.join(tmp_dir, "a")
+            os.symlink(os.path.join(".", "b"), a_path)
+            os.symlink(os.path.join(".", "a"), os.path.join(tmp_dir, "b"))
+            with self.assertRaises(fs.FluentFsException) as context:
+                fs.SymLink(a_path).final_target
+            self.assertIn("cycle", str(context.exception))
+
+    def test_final_target_relative(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.mkdir(os.path.join(tmp_dir, "d"))
+            with open(os.path.join(tmp_dir, "f"), "w"):
+                pass
+            os.symlink(os.path.join("..", "f"), os.path.join(tmp_dir, "d", "l"))
+            self.assertEqual(
+                fs.SymLink(os.path.join(tmp_dir, "d", "l")).final_target.path,
+                os.path.join(tmp_dir, "f"),
+            )
@@ -1,4 +1,6 @@
+import gc
 import os.path
+import pickle
 from test.test_fs_values import (
     A_TXT_PATH,
     B_TXT_PATH,
@@ -6,9 +8,12 @@ from test.test_fs_values import (
     EMPTY_TXT_PATH,
     EMPTYLINES_TXT_PATH,
 )
-from unittest import TestCase
+from test.tmp_dir_test_case import TmpDirTestCase
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
 
 import fluentfs as fs
+from fluentfs.common import ByteRange
 
 
 class TextFileContentTest(TestCase):
@@ -40,6 +45,31 @@ class TextFileContentTest(TestCase):
         os.remove(BAD_ENCODING_PATH)
 
 
+class TextFileSettingsTest(TestCase):
+    def test_settings(self) -> None:
+        text_file = fs.TextFile(A_TXT_PATH, "latin-1", raise_on_decode_error=False)
+        self.assertEqual(text_file.encoding, "latin-1")
+        self.assertFalse(text_file.raise_on_decode_error)
+        self.assertTrue(text_file.expand_user)
+        self.assertTrue(text_file.expand_vars)
+
+    def test_settings_pickled(self) -> None:
+        cache = fs.ContentCache(100)
+        text_file = fs.TextFile(A_TXT_PATH, "latin-1", False, 10, cache)
+        unpickled = pickle.loads(pickle.dumps(text_file))
+        self.assertIs(type(unpickled), fs.TextFile)
+        self.assertEqual(unpickled.encoding, "latin-1")
+        self.assertFalse(unpickled.raise_on_decode_error)
+        self.assertEqual(unpickled.line_len_limit, 10)
+        # The cache is not sent along
+        self.assertIsNone(unpickled.content_cache)
+
+    def test_settings_from_file(self) -> None:
+        text_file = fs.File(A_TXT_PATH).text_file("latin-1", False)
+        self.assertEqual(text_file.encoding, "latin-1")
+        self.assertFalse(text_file.raise_on_decode_error)
+
+
 class TextFileLinesTest(TestCase):
     def test_lines_empty(self) -> None:
         self.assertEqual(fs.TextFile(EMPTY_TXT_PATH).lines.list(), [])
@@ -76,8 +106,10 @@ class TextFileLinesTest(TestCase):
             with open(BAD_ENCODING_PATH, "w", encoding="cp1252") as f:
                 f.write("äöu")
 
+        # The lines are only read (and decoded) while iterating
+        lines = fs.TextFile(BAD_ENCODING_PATH).lines
         with self.assertRaises(fs.FluentFsException):
-            fs.TextFile(BAD_ENCODING_PATH).lines
+            lines.list()
 
         os.remove(BAD_ENCODING_PATH)
 
@@ -93,6 +125,76 @@ class TextFileLinesTest(TestCase):
         os.remove(BAD_ENCODING_PATH)
 
 
+class TextFileStreamingLinesTest(TmpDirTestCase):
+    def test_lines_lazy(self) -> None:
+        self._write(b"a\r\nb\nc")
+        lines = fs.TextFile(self.path).lines
+        os.remove(self.path)
+        with self.assertRaises(FileNotFoundError):
+            next(lines)
+
+        self._write(b"a\r\nb\nc")
+        self.assertEqual(fs.TextFile(self.path).lines.list(), ["a", "b", "c"])
+
+    def test_lines_bad_encoding_position(self) -> None:
+        # The offending byte is far beyond the first chunk, in the middle of a line
+        self._write(b"line\r\n" * 100000 + b"ab\xffc\nd\n")
+        lines = fs.TextFile(self.path).lines
+        read_lines = []
+        with self.assertRaises(fs.FluentFsException) as context:
+            for line in lines:
+                read_lines.append(line)
+        # All lines before the line containing the offending byte are returned
+        self.assertEqual(read_lines, ["line"] * 100000)
+        self.assertIn(
+            "in line 100001 (invalid start byte at byte 600002)", str(context.exception)
+        )
+
+        lines = fs.TextFile(self.path, raise_on_decode_error=False).lines
+        self.assertEqual(lines.len(), 100000)
+
+    def test_lines_bad_encoding_across_chunks(self) -> None:
+        # The offending sequence starts right at the end of the first chunk
+        self._write(b"x" * 65535 + b"\r" + b"\xc3(\n")
+        lines = fs.TextFile(self.path).lines
+        with self.assertRaises(fs.FluentFsException) as context:
+            lines.list()
+        self.assertIn(
+            "in line 2 (invalid continuation byte at byte 65536)",
+            str(context.exception),
+        )
+        lines = fs.TextFile(self.path, raise_on_decode_error=False).lines
+        self.assertEqual(lines.list(), ["x" * 65535])
+
+        # The offending sequence starts in the first chunk and ends in the second one
+        self._write(b"x" * 65535 + b"\xc3(\n")
+        with self.assertRaises(fs.FluentFsException) as context:
+            fs.TextFile(self.path).lines.list()
+        self.assertIn(
+            "in line 1 (invalid continuation byte at byte 65535)",
+            str(context.exception),
+        )
+
+    def test_line_len_limit(self) -> None:
+        self._write(b"12345\n1234\n123456")
+        text_file = fs.TextFile(self.path, line_len_limit=5)
+        self.assertEqual(text_file.line_len_limit, 5)
+        lines = text_file.lines
+        self.assertEqual([next(lines), next(lines)], ["12345", "1234"])
+        with self.assertRaises(fs.FluentFsException):
+            next(lines)
+
+        text_file = fs.File(self.path).text_file(line_len_limit=6)
+        self.assertEqual(text_file.lines.len(), 3)
+        self.assertIsNone(fs.TextFile(self.path).line_len_limit)
+
+    def test_line_len_limit_iterator(self) -> None:
+        self._write(b"x" * 100)
+        text_files = fs.Dir(self.tmp_dir.name).files.t(line_len_limit=10)
+        with self.assertRaises(fs.FluentFsException):
+            text_files.map(lambda text_file: text_file.lines.len()).list()
+
+
 class TextFileWordsTest(TestCase):
     def test_words_empty(self) -> None:
         self.assertEqual(fs.TextFile(EMPTY_TXT_PATH).words.list(), [])
@@ -125,6 +227,23 @@ class TextFileWordCountTest(TestCase):
         self.assertEqual(fs.TextFile(B_TXT_PATH).wc, 4)
 
 
+class TextFileStreamingCountsTest(TmpDirTestCase):
+    def test_counts_same_as_content(self) -> None:
+        self._write("äö ü\r\n€  x\r".encode())
+        text_file = fs.TextFile(self.path)
+        self.assertEqual(text_file.char_count, len(text_file.content))
+        self.assertEqual(text_file.word_count, len(text_file.content.split()))
+
+    def test_counts_bad_encoding(self) -> None:
+        self._write(b"a \xe4")
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(self.path).char_count
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(self.path).word_count
+        text_file = fs.TextFile(self.path, raise_on_decode_error=False)
+        self.assertEqual((text_file.char_count, text_file.word_count), (0, 0))
+
+
 class TextFileLineCountTest(TestCase):
     def test_line_count_empty(self) -> None:
         self.assertEqual(fs.TextFile(EMPTY_TXT_PATH).line_count, 0)
@@ -136,9 +255,291 @@ class TextFileLineCountTest(TestCase):
         self.assertEqual(fs.TextFile(B_TXT_PATH).lc, 2)
 
 
+class TextFileFastLineCountTest(TmpDirTestCase):
+    def test_line_count_same_as_lines(self) -> None:
+        contents = [b"", b"a", b"a\n", b"a\r\nb\rc\n\n", b"\r\r\n\n\r", "ä\nö".encode()]
+        for content in contents:
+            self._write(content)
+            text_file = fs.TextFile(self.path)
+            self.assertEqual(text_file.line_count, text_file.lines.len(), content)
+
+    def test_line_count_ignores_line_len_limit(self) -> None:
+        self._write(b"x" * 100)
+        self.assertEqual(fs.TextFile(self.path, line_len_limit=10).line_count, 1)
+
+    def test_line_count_bad_encoding(self) -> None:
+        self._write(b"line\n" * 10 + b"\xe4\n")
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(self.path).line_count
+        text_file = fs.TextFile(self.path, raise_on_decode_error=False)
+        self.assertEqual(text_file.line_count, 10)
+        self.assertEqual(fs.TextFile(self.path, "latin-1").line_count, 11)
+
+    def test_line_count_not_ascii_compatible(self) -> None:
+        self._write("a\nb\n".encode("utf-16"))
+        self.assertEqual(fs.TextFile(self.path, "utf-16").line_count, 2)
+
+    def test_map_line_count(self) -> None:
+        self._write(b"a\r\nb\nc")
+        text_files = fs.Dir(self.tmp_dir.name).files.t()
+        self.assertEqual(text_files.map_line_count().list(), [3])
+
+
+class TextFileStatsTest(TmpDirTestCase):
+    def test_stats(self) -> None:
+        self._write("one two\r\n  \n\nthree  föur".encode())
+        self.assertEqual(
+            fs.TextFile(self.path).stats(),
+            fs.TextStats(
+                line_count=4,
+                empty_line_count=2,
+                non_empty_line_count=2,
+                word_count=4,
+                char_count=23,
+                byte_count=25,
+                max_line_len=11,
+            ),
+        )
+
+    def test_stats_same_as_properties(self) -> None:
+        text_file = fs.TextFile(B_TXT_PATH)
+        stats = text_file.stats()
+        self.assertEqual(stats.line_count, text_file.line_count)
+        self.assertEqual(stats.empty_line_count, text_file.empty_line_count)
+        self.assertEqual(stats.non_empty_line_count, text_file.non_empty_line_count)
+        self.assertEqual(stats.word_count, text_file.word_count)
+        self.assertEqual(stats.char_count, text_file.char_count)
+        self.assertEqual(stats.byte_count, text_file.byte_count)
+        self.assertEqual(stats.max_line_len, text_file.max_line_len)
+
+    def test_stats_empty(self) -> None:
+        self.assertEqual(
+            fs.TextFile(EMPTY_TXT_PATH).stats(), fs.TextStats(0, 0, 0, 0, 0, 0, 0)
+        )
+
+    def test_stats_metrics(self) -> None:
+        self._write(b"a b\nc")
+        stats = fs.TextFile(self.path).stats(["word_count", "max_line_len"])
+        self.assertEqual(stats, fs.TextStats(word_count=3, max_line_len=3))
+        stats = fs.TextFile(self.path).stats(["line_count"])
+        self.assertEqual(stats, fs.TextStats(line_count=2))
+
+    def test_stats_byte_count_only(self) -> None:
+        self._write(b"\xe4")
+        stats = fs.TextFile(self.path).stats(["byte_count"])
+        self.assertEqual(stats, fs.TextStats(byte_count=1))
+
+    def test_stats_unknown_metric(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(B_TXT_PATH).stats(["lines"])
+
+    def test_stats_bad_encoding(self) -> None:
+        self._write(b"line\n" * 10000 + b"\xe4\n")
+        with self.assertRaises(fs.FluentFsException) as context:
+            fs.TextFile(self.path).stats()
+        self.assertIn("in line 10001 ", str(context.exception))
+
+        stats = fs.TextFile(self.path, raise_on_decode_error=False).stats()
+        self.assertEqual(stats, fs.TextStats(10000, 0, 10000, 10000, 50000, 50002, 4))
+
+
+class TextFileRangesTest(TmpDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # Split even small files into several ranges
+        self.patcher = patch("fluentfs.filelike.text_file.MIN_RANGE_SIZE", 1)
+        self.patcher.start()
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+        super().tearDown()
+
+    def test_byte_ranges(self) -> None:
+        self._write(b"ab\ncd\nef\n")
+        self.assertEqual(
+            fs.TextFile(self.path).byte_ranges(3),
+            [ByteRange(0, 3), ByteRange(3, 6), ByteRange(6, 9)],
+        )
+        self.assertEqual(
+            fs.TextFile(self.path, encoding="utf-16").byte_ranges(3),
+            [ByteRange(0, 9)],
+        )
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(self.path).byte_ranges(0)
+
+    def test_stats_workers(self) -> None:
+        self._write("one two\r\n  \n\nthree  föur\nfive\n\rsix".encode() * 50)
+        text_file = fs.TextFile(self.path)
+        for executor in ["thread", "process"]:
+            for workers in [2, 7]:
+                self.assertEqual(
+                    text_file.stats(workers=workers, executor=executor),
+                    text_file.stats(),
+                )
+        for metrics in [["line_count"], ["line_count", "byte_count"], ["byte_count"]]:
+            self.assertEqual(
+                text_file.stats(metrics, workers=3), text_file.stats(metrics)
+            )
+
+    def test_stats_workers_small_file(self) -> None:
+        self._write(b"a\nb")
+        self.assertEqual(
+            fs.TextFile(self.path).stats(["line_count"], workers=4),
+            fs.TextStats(line_count=2),
+        )
+
+    def test_stats_workers_bad_encoding(self) -> None:
+        self._write(b"line\n" * 10 + b"\xe4\n" + b"line\n" * 10)
+        for metrics in [None, ["line_count"]]:
+            with self.assertRaises(fs.FluentFsException):
+                fs.TextFile(self.path).stats(metrics, workers=2)
+            stats = fs.TextFile(self.path, raise_on_decode_error=False).stats(
+                metrics, workers=2
+            )
+            self.assertEqual(stats.line_count, 10)
+
+    def test_line_counts_bad_encoding_agree(self) -> None:
+        # Bigger than the chunks decoded at once, to catch chunk-dependent results
+        self._write(b"line\n" * 20000 + b"\n\xff\n" + b"x\n" * 10)
+        text_file = fs.TextFile(self.path, raise_on_decode_error=False)
+        line_count = text_file.lines.len()
+        self.assertEqual(line_count, 20001)
+        self.assertEqual(text_file.line_count, line_count)
+        self.assertEqual(
+            text_file.empty_line_count + text_file.non_empty_line_count, line_count
+        )
+        self.assertEqual(text_file.empty_line_count, 1)
+        for workers in [1, 3]:
+            for metrics in [None, ["line_count"]]:
+                stats = text_file.stats(metrics, workers=workers)
+                self.assertEqual(stats.line_count, line_count)
+            self.assertEqual(text_file.grep_count("line", workers=workers), 20000)
+        for executor in ["thread", "process"]:
+            text_files = fs.Dir(self.tmp_dir.name).files.t(raise_on_decode_error=False)
+            line_counts = text_files.map_line_count(2, executor, split_size=1 << 15)
+            self.assertEqual(line_counts.list(), [line_count])
+
+        text_file = fs.TextFile(self.path)
+        with self.assertRaises(fs.FluentFsException) as context:
+            text_file.line_count
+        self.assertIn("in line 20002 ", str(context.exception))
+        with self.assertRaises(fs.FluentFsException):
+            text_file.stats(workers=2)
+
+    def test_stats_invalid_workers(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(B_TXT_PATH).stats(workers=0)
+
+    def test_grep_count(self) -> None:
+        self._write(b"foo\nbar\nfoobar\r\nbaz\n" * 20)
+        text_file = fs.TextFile(self.path)
+        self.assertEqual(text_file.grep_count("foo"), 40)
+        self.assertEqual(text_file.grep_count("bar$"), 40)
+        self.assertEqual(text_file.grep_count("a.", literal=True), 0)
+        for executor in ["thread", "process"]:
+            self.assertEqual(
+                text_file.grep_count("bar$", workers=3, executor=executor), 40
+            )
+
+    def test_grep_count_bad_encoding(self) -> None:
+        self._write(b"foo\n" * 10 + b"\xe4\n" + b"foo\n" * 10)
+        with self.assertRaises(fs.FluentFsException):
+            fs.TextFile(self.path).grep_count("foo", workers=2)
+        text_file = fs.TextFile(self.path, raise_on_decode_error=False)
+        self.assertEqual(text_file.grep_count("foo", workers=2), 10)
+
+
+class TextFileContentCacheTest(TmpDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = fs.ContentCache(1000)
+
+    def _write(
+        self, content: bytes, name: str = "f.txt", mtime_ns: int = 10**18
+    ) -> str:
+        path = super()._write(content, name)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_properties_read_once(self) -> None:
+        self._write(b"a b\r\n\nc")
+        text_file = fs.TextFile(self.path, content_cache=self.cache)
+        self.assertIs(text_file.content_cache, self.cache)
+        self.assertEqual(text_file.content, "a b\n\nc")
+        self.assertEqual(text_file.lines.list(), ["a b", "", "c"])
+        self.assertEqual(text_file.words.list(), ["a", "b", "c"])
+        self.assertEqual(text_file.line_count, 3)
+        self.assertEqual(text_file.stats().empty_line_count, 1)
+        self.assertEqual((text_file.char_count, text_file.word_count), (6, 3))
+        self.assertEqual((self.cache.misses, self.cache.hits), (1, 6))
+
+    def test_cache_not_kept_alive(self) -> None:
+        self._write(b"a\n")
+        cache = fs.ContentCache(1000)
+        fs.TextFile(self.path, content_cache=cache).content
+        fs.File(self.path).t(content_cache=cache).content
+        cache_id = id(cache)
+        del cache
+        gc.collect()
+        caches = [o for o in gc.get_objects() if isinstance(o, fs.ContentCache)]
+        self.assertNotIn(cache_id, [id(c) for c in caches])
+
+    def test_shared(self) -> None:
+        self._write(b"a\nb\n")
+        fs.TextFile(self.path, content_cache=self.cache).content
+        text_files = fs.Dir(self.tmp_dir.name).files.t(content_cache=self.cache)
+        self.assertEqual(text_files.map_line_count().list(), [2])
+        self.assertEqual((self.cache.misses, self.cache.hits), (1, 1))
+        # Other encodings are cached separately
+        fs.TextFile(self.path, "latin-1", content_cache=self.cache).content
+        self.assertEqual((self.cache.misses, len(self.cache)), (2, 2))
+
+    def test_changed_file(self) -> None:
+        self._write(b"a")
+        text_file = fs.TextFile(self.path, content_cache=self.cache)
+        self.assertEqual(text_file.content, "a")
+        self._write(b"b", mtime_ns=2 * 10**18)
+        self.assertEqual(text_file.content, "b")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_bad_encoding(self) -> None:
+        self._write(b"line\n\xe4\n")
+        text_file = fs.TextFile(self.path, content_cache=self.cache)
+        with self.assertRaises(fs.FluentFsException) as context:
+            text_file.lines.list()
+        # The error is reported by reading the file again
+        self.assertIn("in line 2 (invalid", str(context.exception))
+
+        text_file = fs.TextFile(
+            self.path, raise_on_decode_error=False, content_cache=self.cache
+        )
+        self.assertEqual(text_file.content, "")
+        self.assertEqual(text_file.lines.list(), ["line"])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_line_len_limit(self) -> None:
+        self._write(b"x" * 100)
+        text_file = fs.File(self.path).text_file(
+            line_len_limit=10, content_cache=self.cache
+        )
+        with self.assertRaises(fs.FluentFsException):
+            text_file.lines.list()
+        self.assertEqual(text_file.line_count, 1)
+        self.assertEqual(len(self.cache), 0)
+
+
 class TextFileStrTest(TestCase):
     def test_str(self) -> None:
         self.assertEqual(str(fs.TextFile(A_TXT_PATH)), f"TextFile({A_TXT_PATH})")
 
     def test_repr(self) -> None:
         self.assertEqual(repr(fs.TextFile(A_TXT_PATH)), f"TextFile({A_TXT_PATH})")
+
+
+class TextFileAsyncTest(IsolatedAsyncioTestCase):
+    async def test_aread(self) -> None:
+        self.assertEqual(await fs.TextFile(B_TXT_PATH).aread(), "line 2\nline 3")
+
+    async def test_alines(self) -> None:
+        lines = [line async for line in fs.TextFile(B_TXT_PATH).alines()]
+        self.assertEqual(lines, ["line 2", "line 3"])
@@ -0,0 +1,260 @@
+import asyncio
+import os
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from test.test_fs_values import BASE_DIR_PATH
+from typing import Any, List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import fluentfs as fs
+from fluentfs.index.dir_index import _from_int64, _sub_path_range, _to_int64
+from fluentfs.walk import scan_dir
+from fluentfs.watch import ChangeEvent, ChangeKind
+
+
+def _write(path: str, content: str = "") -> None:
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class _CountingCursor:
+    """
+    A cursor counting the rows fetched from it.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self.cursor = cursor
+        self.fetched = 0
+
+    def fetchmany(self, size: int) -> List[Any]:
+        rows = self.cursor.fetchmany(size)
+        self.fetched += len(rows)
+        return rows
+
+    def close(self) -> None:
+        self.cursor.close()
+
+
+class DirIndexTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tree_path = os.path.join(self.tmp_dir.name, "tree")
+        self.index_path = os.path.join(self.tmp_dir.name, "index.db")
+        os.makedirs(os.path.join(self.tree_path, "a", "b"))
+        os.makedirs(os.path.join(self.tree_path, "c"))
+        _write(os.path.join(self.tree_path, "x.txt"), "x")
+        _write(os.path.join(self.tree_path, "a", "y.txt"), "yy")
+        _write(os.path.join(self.tree_path, "a", "b", "z.txt"), "zzz")
+        self.index = fs.DirIndex(self.tree_path, self.index_path).refresh()
+
+    def tearDown(self) -> None:
+        self.index.close()
+        self.tmp_dir.cleanup()
+
+    def _path(self, *names: str) -> str:
+        return os.path.join(self.tree_path, *names)
+
+    def _touch_dir(self, *names: str) -> None:
+        # Make sure the modification time differs even on coarse filesystems
+        stat = os.stat(self._path(*names))
+        os.utime(self._path(*names), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_query(self) -> None:
+        tree = fs.Dir(self.tree_path)
+        self.assertEqual(
+            self.index.files.map_path().list(), sorted(tree.files.map_path())
+        )
+        self.assertEqual(
+            self.index.dirs.map(lambda d: d.path).list(),
+            sorted(tree.dirs.map(lambda d: d.path)),
+        )
+        self.assertEqual(self.index.file_likes.len(), 7)
+
+    def test_query_stat(self) -> None:
+        with patch("fluentfs.filelike.file_like.os.stat") as stat:
+            self.assertEqual(self.index.files.map_byte_count().sum(), 6)
+        stat.assert_not_called()
+
+        file = self.index.files.filter(lambda f: f.name == "x.txt").list()[0]
+        self.assertEqual(file.stat(), file.refresh().stat())
+        self.assertEqual(file.mod_time, fs.File(file.path).mod_time)
+
+    def test_query_other_thread(self) -> None:
+        async def file_paths() -> List[str]:
+            return [file.path async for file in self.index.files.aiter()]
+
+        expected = self.index.files.map_path().list()
+        self.assertEqual(asyncio.run(file_paths()), expected)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            files = self.index.files
+            self.assertEqual(executor.submit(files.map_path().list).result(), expected)
+
+    def test_query_streamed_other_threads(self) -> None:
+        expected = self.index.files.map_path().list()
+        # Every file is fetched by a different thread than the one building the index
+        with patch("fluentfs.index.dir_index._FETCH_SIZE", 1):
+            files = iter(self.index.files)
+            paths = []
+            for _ in expected:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    paths.append(executor.submit(next, files).result().path)
+            with self.assertRaises(StopIteration):
+                next(files)
+        self.assertEqual(paths, expected)
+
+    def test_query_lazy(self) -> None:
+        cursors: List[_CountingCursor] = []
+        connection = self.index.connection
+
+        def execute(*args: Any) -> _CountingCursor:
+            cursors.append(_CountingCursor(connection.execute(*args)))
+            return cursors[-1]
+
+        with patch("fluentfs.index.dir_index._FETCH_SIZE", 1):
+            with patch.object(self.index, "connection", MagicMock(execute=execute)):
+                files = iter(self.index.files)
+                self.assertEqual(cursors, [])
+                next(files)
+                self.assertEqual(cursors[0].fetched, 1)
+                self.assertEqual(len(list(files)), 2)
+                self.assertEqual(cursors[0].fetched, 3)
+
+    def test_disk_usage(self) -> None:
+        # A sparse file with a size of 10 MiB
+        with open(self._path("s"), "wb") as f:
+            f.truncate(10 * 1024 * 1024)
+        self.index.refresh()
+        self.assertEqual(
+            self.index.files.disk_usage(), fs.Dir(self.tree_path).files.disk_usage()
+        )
+        self.assertLess(self.index.files.disk_usage().allocated_size, 1024 * 1024)
+
+    def test_migrate(self) -> None:
+        self.index.close()
+        connection = sqlite3.connect(self.index_path)
+        with connection:
+            connection.execute("ALTER TABLE entries DROP COLUMN blocks")
+        connection.close()
+
+        self.index = fs.DirIndex(self.tree_path, self.index_path)
+        self.assertEqual(self.index.files.len(), 0)
+        self.assertEqual(self.index.refresh().files.len(), 3)
+
+    def test_refresh_incremental(self) -> None:
+        _write(self._path("a", "new.txt"))
+        self._touch_dir("a")
+
+        with patch("fluentfs.index.dir_index.scan_dir", wraps=scan_dir) as scan:
+            self.index.refresh()
+        scan.assert_called_once_with(self._path("a"), sort=False)
+        self.assertIn(self._path("a", "new.txt"), self.index.files.map_path().list())
+
+        with patch("fluentfs.index.dir_index.scan_dir", wraps=scan_dir) as scan:
+            self.index.refresh(full=True)
+        self.assertEqual(scan.call_count, 4)
+
+    def test_refresh_removed(self) -> None:
+        shutil.rmtree(self._path("a"))
+        os.remove(self._path("x.txt"))
+        os.mkdir(self._path("x.txt"))
+        self.index.refresh()
+        self.assertEqual(
+            self.index.file_likes.map(lambda f: f.path).list(),
+            [self.tree_path, self._path("c"), self._path("x.txt")],
+        )
+
+        shutil.rmtree(self.tree_path)
+        self.assertEqual(self.index.refresh().file_likes.len(), 0)
+
+    def test_refresh_unlistable(self) -> None:
+        def scan(path: str, sort: bool) -> Any:
+            return None if path == self._path("a") else scan_dir(path, sort)
+
+        self._touch_dir("a")
+        with patch("fluentfs.index.dir_index.scan_dir", scan):
+            self.index.refresh()
+        self.assertEqual(self.index.files.map_name().list(), ["x.txt"])
+
+    def test_refresh_vanished_file(self) -> None:
+        def scan(path: str, sort: bool) -> Any:
+            listing = scan_dir(path, sort)
+            os.remove(self._path("x.txt"))
+            return listing
+
+        shutil.rmtree(self._path("a"))
+        os.rmdir(self._path("c"))
+        with fs.DirIndex(self.tree_path, self.index_path + "2") as index:
+            with patch("fluentfs.index.dir_index.scan_dir", scan):
+                index.refresh(full=True)
+            self.assertEqual(
+                index.file_likes.map(lambda f: f.path).list(), [self.tree_path]
+            )
+
+    def test_apply(self) -> None:
+        os.makedirs(self._path("n", "m"))
+        _write(self._path("n", "m", "f"), "ffff")
+        _write(self._path("x.txt"), "xx")
+        os.rename(self._path("a", "b"), self._path("c", "b"))
+        shutil.rmtree(self._path("a"))
+        os.symlink(self._path("x.txt"), self._path("l"))
+        self.index.apply(
+            [
+                ChangeEvent(ChangeKind.CREATED, self._path("n"), True),
+                ChangeEvent(ChangeKind.MODIFIED, self._path("x.txt"), False),
+                ChangeEvent(
+                    ChangeKind.MOVED, self._path("a", "b"), True, self._path("c", "b")
+                ),
+                ChangeEvent(ChangeKind.DELETED, self._path("a"), True),
+                ChangeEvent(ChangeKind.CREATED, self._path("l"), False),
+                ChangeEvent(ChangeKind.CREATED, self._path("gone"), False),
+                ChangeEvent(ChangeKind.CREATED, self.tmp_dir.name, True),
+            ]
+        )
+        self.assertEqual(
+            self.index.file_likes.map(lambda f: f.path).list(),
+            sorted(fs.Dir(self.tree_path).file_likes.map(lambda f: f.path)),
+        )
+        self.assertEqual(self.index.files.map_byte_count().sum(), 9)
+
+    def test_apply_root(self) -> None:
+        _write(self._path("new.txt"))
+        self.index.apply([ChangeEvent(ChangeKind.MODIFIED, self.tree_path, True)])
+        self.assertIn(self._path("new.txt"), self.index.files.map_path().list())
+
+    def test_apply_dir_replaced(self) -> None:
+        shutil.rmtree(self._path("a"))
+        _write(self._path("a"))
+        self.index.apply([ChangeEvent(ChangeKind.CREATED, self._path("a"), False)])
+        self.assertEqual(
+            self.index.files.map_path().list(), [self._path("a"), self._path("x.txt")]
+        )
+
+    def test_persistent(self) -> None:
+        self.index.close()
+        self.index = fs.DirIndex(self.tree_path, self.index_path)
+        self.assertEqual(self.index.files.len(), 3)
+
+    def test_other_root(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.DirIndex(BASE_DIR_PATH, self.index_path)
+
+    def test_repr(self) -> None:
+        self.assertEqual(
+            repr(self.index), f'DirIndex("{self.tree_path}", "{self.index_path}")'
+        )
+
+
+class DirIndexHelpersTest(TestCase):
+    def test_int64(self) -> None:
+        for value in [0, 1, 2**63 - 1, 2**63, 2**64 - 1]:
+            self.assertEqual(_from_int64(_to_int64(value)), value)
+        self.assertEqual(_to_int64(2**64 - 1), -1)
+
+    def test_sub_path_range(self) -> None:
+        low, high = _sub_path_range(os.path.join(os.sep, "a"))
+        self.assertTrue(low <= os.path.join(os.sep, "a", "b") < high)
+        self.assertFalse(low <= os.path.join(os.sep, "ab") < high)
+        self.assertEqual(_sub_path_range(os.sep)[0], os.sep)
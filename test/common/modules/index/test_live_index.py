@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+from typing import Any, List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+import fluentfs as fs
+from fluentfs.walk import scan_dir
+from fluentfs.watch import ChangeEvent, ChangeKind, Watcher
+
+
+class _QueueWatcher(Watcher):
+    """
+    A watcher reporting the events it is given by the test.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.events: List[ChangeEvent] = []
+        self.closed = False
+
+    def read(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        events, self.events = self.events, []
+        return events
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _write(path: str, content: str = "") -> None:
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class LiveIndexTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.tmp_dir.name
+        os.makedirs(self._p("a", "b"))
+        _write(self._p("x"), "x")
+        _write(self._p("a", "b", "y"), "yy")
+        self.watcher = _QueueWatcher(self.path)
+        self.index = fs.LiveIndex(self.watcher)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _p(self, *names: str) -> str:
+        return os.path.join(self.path, *names)
+
+    def _report(self, kind: ChangeKind, path: str, dest_path: Any = None) -> None:
+        self.watcher.events.append(
+            ChangeEvent(kind, path, os.path.isdir(path), dest_path)
+        )
+
+    def _paths(self) -> List[str]:
+        return self.index.file_likes.map(lambda f: f.path).list()
+
+    def test_query(self) -> None:
+        self.assertEqual(
+            self._paths(),
+            [
+                self.path,
+                self._p("a"),
+                self._p("a", "b"),
+                self._p("a", "b", "y"),
+                self._p("x"),
+            ],
+        )
+        self.assertEqual(
+            self.index.dirs.map(lambda d: d.path).list(),
+            [self.path, self._p("a"), self._p("a", "b")],
+        )
+        with patch("fluentfs.filelike.file_like.os.stat") as stat:
+            self.assertEqual(self.index.files.map_byte_count().sum(), 3)
+        stat.assert_not_called()
+
+    def test_created_modified(self) -> None:
+        _write(self._p("a", "z"))
+        self._report(ChangeKind.CREATED, self._p("a", "z"))
+        _write(self._p("x"), "xxx")
+        self._report(ChangeKind.MODIFIED, self._p("x"))
+        self.assertEqual(self.index.files.map_byte_count().sum(), 5)
+        self.assertIn(self._p("a", "z"), self._paths())
+
+    def test_created_unknown_parent(self) -> None:
+        os.makedirs(self._p("c", "d"))
+        _write(self._p("c", "d", "f"))
+        # Only the deepest change is reported
+        self._report(ChangeKind.CREATED, self._p("c", "d", "f"))
+        self.assertIn(self._p("c", "d"), self._paths())
+        self.assertIn(self._p("c", "d", "f"), self._paths())
+
+    def test_deleted(self) -> None:
+        shutil.rmtree(self._p("a"))
+        self._report(ChangeKind.DELETED, self._p("a"))
+        # Changes of files that are gone are ignored
+        self._report(ChangeKind.DELETED, self._p("a", "b", "y"))
+        self._report(ChangeKind.MODIFIED, self._p("gone"))
+        self.assertEqual(self._paths(), [self.path, self._p("x")])
+
+    def test_moved(self) -> None:
+        os.rename(self._p("a"), self._p("c"))
+        self._report(ChangeKind.MOVED, self._p("a"), self._p("c"))
+        self.assertEqual(
+            self._paths(),
+            [
+                self.path,
+                self._p("c"),
+                self._p("c", "b"),
+                self._p("c", "b", "y"),
+                self._p("x"),
+            ],
+        )
+
+    def test_outside(self) -> None:
+        self.index.apply(
+            [ChangeEvent(ChangeKind.CREATED, os.path.dirname(self.path), True)]
+        )
+        self.assertEqual(len(self._paths()), 5)
+
+    def test_symlink(self) -> None:
+        os.symlink(self._p("x"), self._p("l"))
+        self._report(ChangeKind.CREATED, self._p("l"))
+        self.assertNotIn(self._p("l"), self._paths())
+
+    def test_root_deleted(self) -> None:
+        self.index.apply([ChangeEvent(ChangeKind.DELETED, self.path, True)])
+        self.assertEqual(self._paths(), [])
+
+    def test_unlistable(self) -> None:
+        def scan(path: str, sort: bool) -> Any:
+            return None if path == self._p("a") else scan_dir(path, sort)
+
+        with patch("fluentfs.index.live_index.scan_dir", scan):
+            index = fs.LiveIndex(_QueueWatcher(self.path))
+        self.assertEqual(index.files.map_name().list(), ["x"])
+
+    def test_vanished_file(self) -> None:
+        def scan(path: str, sort: bool) -> Any:
+            listing = scan_dir(path, sort)
+            if os.path.exists(self._p("x")):
+                os.remove(self._p("x"))
+            return listing
+
+        with patch("fluentfs.index.live_index.scan_dir", scan):
+            index = fs.LiveIndex(_QueueWatcher(self.path))
+        self.assertEqual(index.files.map_name().list(), ["y"])
+
+    def test_update(self) -> None:
+        _write(self._p("z"))
+        self._report(ChangeKind.CREATED, self._p("z"))
+        self.assertIs(self.index.update(timeout=1), self.index)
+        self.assertIn(self._p("z"), self.index.stats)
+
+    def test_close(self) -> None:
+        with self.index:
+            pass
+        self.assertTrue(self.watcher.closed)
+
+    def test_repr(self) -> None:
+        self.assertEqual(repr(self.index), f'LiveIndex("{self.path}")')
+
+    def test_with_watcher(self) -> None:
+        with fs.LiveIndex(
+            fs.Dir(self.path).watch(polling=True, interval=0.01)
+        ) as index:
+            _write(self._p("z"))
+            index.update(timeout=1)
+            self.assertIn(self._p("z"), index.stats)
+
+    def test_polling_once_per_interval(self) -> None:
+        with fs.LiveIndex(fs.Dir(self.path).watch(polling=True, interval=60)) as index:
+            with patch("fluentfs.watch.watcher.take_snapshot") as take_snapshot:
+                self.assertEqual(index.files.map_name().list(), ["y", "x"])
+                self.assertEqual(len(index.dirs.list()), 3)
+            take_snapshot.assert_not_called()
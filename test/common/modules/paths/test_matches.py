@@ -16,6 +16,20 @@ class TestMatches(TestCase):
             fluentfs.paths.matches.matches_base_path(SUB_DIR_PATH, [BASE_DIR_PATH])
         )
 
+    def test_path_matches_expanded_base(self) -> None:
+        self.assertTrue(
+            fluentfs.paths.matches.matches_expanded_base_path(
+                SUB_DIR_PATH, [A_TXT_PATH, BASE_DIR_PATH]
+            )
+        )
+
+    def test_path_not_matches_expanded_base(self) -> None:
+        self.assertFalse(
+            fluentfs.paths.matches.matches_expanded_base_path(
+                BASE_DIR_PATH, [SUB_DIR_PATH]
+            )
+        )
+
     def test_path_matches_regex_str(self) -> None:
         self.assertTrue(fluentfs.paths.matches.matches_regex(A_TXT_PATH, r".*a\.txt"))
 
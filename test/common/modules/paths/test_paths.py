@@ -72,6 +72,12 @@ class TestPath(TestCase):
         expected_path = os.path.join(TEST_DIR_PATH, normal_path)
         self.assertEqual(normal_path, expected_path)
 
+    def test_expand_path_no_expansion(self) -> None:
+        self.assertEqual(
+            fs.expand_path("~/$HOME", expand_user=False, expand_vars=False),
+            os.path.join(os.getcwd(), "~", "$HOME"),
+        )
+
     def test_file_kind_file(self) -> None:
         kind = fs.file_like_kind(A_TXT_PATH)
         self.assertEqual(kind, fs.FileLikeKind.FILE)
@@ -0,0 +1,114 @@
+import re
+from test.tmp_dir_test_case import TmpDirTestCase
+from typing import List, Tuple
+from unittest import TestCase
+
+import fluentfs as fs
+from fluentfs.search import compile_pattern, grep, required_literal
+
+
+class RequiredLiteralTest(TestCase):
+    def _literal(self, pattern: str, flags: int = 0) -> object:
+        return required_literal(re.compile(pattern, flags))
+
+    def test_literal(self) -> None:
+        self.assertEqual(self._literal("abc"), "abc")
+        self.assertEqual(self._literal(r"def \w+\("), "def ")
+
+    def test_longest(self) -> None:
+        self.assertEqual(self._literal("x[0-9]+longer_one?"), "longer_on")
+        self.assertEqual(self._literal("a(bcd)+e"), "bcd")
+        self.assertEqual(self._literal("ab(?:cd)*e"), "ab")
+
+    def test_none(self) -> None:
+        self.assertIsNone(self._literal("foo|bar"))
+        self.assertIsNone(self._literal(r"\d+"))
+        self.assertIsNone(self._literal("(?:ab)?"))
+
+    def test_ignore_case(self) -> None:
+        self.assertIsNone(self._literal("abc", re.IGNORECASE))
+        self.assertIsNone(self._literal("(?i)abc"))
+        self.assertEqual(self._literal("(?i:abc)de"), "de")
+
+
+class CompilePatternTest(TestCase):
+    def test_compile_pattern(self) -> None:
+        self.assertEqual(compile_pattern("a.b", False).pattern, "a.b")
+        self.assertEqual(compile_pattern("a.b", True).pattern, r"a\.b")
+        regex = re.compile("a")
+        self.assertIs(compile_pattern(regex, False), regex)
+        with self.assertRaises(fs.FluentFsException):
+            compile_pattern(regex, True)
+
+
+class GrepTest(TmpDirTestCase):
+    def _grep(self, *args: object, **kwargs: object) -> List[Tuple[str, int, str]]:
+        files = fs.Dir(self.tmp_dir.name).files.t()
+        return [
+            (match.file.name, match.line_no, match.line)
+            for match in files.grep(*args, **kwargs)  # type: ignore
+        ]
+
+    def test_grep(self) -> None:
+        self._write(b"def f():\r\n    pass\r\ndef g(x):\n", "a.txt")
+        self._write(b"nothing here\n", "b.txt")
+        self.assertEqual(
+            self._grep(r"def \w+\("),
+            [("a.txt", 1, "def f():"), ("a.txt", 3, "def g(x):")],
+        )
+
+    def test_grep_literal(self) -> None:
+        self._write(b"a.b\naxb\n", "a.txt")
+        self.assertEqual(self._grep("a.b", literal=True), [("a.txt", 1, "a.b")])
+        self.assertEqual(len(self._grep("a.b")), 2)
+
+    def test_grep_max_count(self) -> None:
+        self._write(b"x\nx\nx\n", "a.txt")
+        self._write(b"x\n", "b.txt")
+        self.assertEqual(
+            self._grep("x", max_count=1), [("a.txt", 1, "x"), ("b.txt", 1, "x")]
+        )
+        self.assertEqual(len(self._grep("x", max_count=2)), 3)
+        self.assertEqual(self._grep("x", max_count=0), [])
+
+    def test_grep_skip_binary(self) -> None:
+        self._write(b"x\0\nx\n", "a.bin")
+        self.assertEqual(self._grep("x"), [])
+        self.assertEqual(self._grep(r"\w"), [])
+        self.assertEqual(len(self._grep("x", skip_binary=False)), 2)
+        self.assertEqual(len(self._grep(r"\w", skip_binary=False)), 2)
+
+    def test_grep_prefilter_skips_undecodable(self) -> None:
+        # The file is never decoded, since it does not contain the literal
+        self._write(b"\xe4\n", "a.txt")
+        self.assertEqual(self._grep("needle"), [])
+        with self.assertRaises(fs.FluentFsException):
+            self._grep("[a-z]")
+
+    def test_grep_literal_across_chunks(self) -> None:
+        path = self._write(b"xxneedlexx\n", "a.txt")
+        for chunk_size in [1, 3, 4, 7, 100]:
+            matches = list(grep([fs.TextFile(path)], "needle", chunk_size=chunk_size))
+            self.assertEqual(len(matches), 1, chunk_size)
+        matches = list(grep([fs.TextFile(path)], "needles", chunk_size=3))
+        self.assertEqual(matches, [])
+
+    def test_grep_encodings(self) -> None:
+        path = self._write("äbc\nb\n".encode("utf-16"), "a.txt")
+        self.assertEqual(
+            [m.line for m in grep([fs.TextFile(path, "utf-16")], "äb")], ["äbc"]
+        )
+        path = self._write("äbc\n".encode("latin-1"), "b.txt")
+        self.assertEqual(len(list(grep([fs.TextFile(path, "latin-1")], "äb"))), 1)
+        # The literal cannot be encoded, so the file is searched without prefilter
+        self.assertEqual(list(grep([fs.TextFile(path, "ascii", False)], "€")), [])
+
+    def test_grep_multiline_literal(self) -> None:
+        self._write(b"a\r\nb\n", "a.txt")
+        self.assertEqual(self._grep("a\nb"), [])
+
+    def test_grep_match_tuple(self) -> None:
+        path = self._write(b"x\n", "a.txt")
+        match = next(grep([fs.TextFile(path)], "x"))
+        self.assertEqual(match, fs.GrepMatch(match.file, 1, "x"))
+        self.assertEqual(match.file.path, path)
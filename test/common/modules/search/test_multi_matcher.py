@@ -0,0 +1,89 @@
+import random
+from test.tmp_dir_test_case import TmpDirTestCase
+from typing import List, Tuple
+from unittest import TestCase
+
+import fluentfs as fs
+from fluentfs.search import MultiMatcher, find_any
+
+
+def naive_find_all(patterns: List[str], text: str) -> List[Tuple[int, str]]:
+    return sorted(
+        (start, pattern)
+        for pattern in set(patterns)
+        for start in range(len(text))
+        if text.startswith(pattern, start)
+    )
+
+
+class MultiMatcherTest(TestCase):
+    def test_find_all(self) -> None:
+        matcher = MultiMatcher(["he", "she", "his", "hers"])
+        self.assertEqual(
+            list(matcher.find_all("ushers")),
+            [(1, "she"), (2, "he"), (2, "hers")],
+        )
+
+    def test_no_patterns(self) -> None:
+        self.assertEqual(list(MultiMatcher([]).find_all("abc")), [])
+
+    def test_empty_pattern(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            MultiMatcher(["a", ""])
+
+    def test_patterns(self) -> None:
+        self.assertEqual(MultiMatcher(["b", "a", "b"]).patterns, ["b", "a"])
+
+    def test_same_as_naive(self) -> None:
+        rng = random.Random(0)
+        for _ in range(50):
+            patterns = [
+                "".join(rng.choice("ab") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+            self.assertEqual(
+                sorted(MultiMatcher(patterns).find_all(text)),
+                naive_find_all(patterns, text),
+                (patterns, text),
+            )
+
+
+class FindAnyTest(TmpDirTestCase):
+    def test_find_any(self) -> None:
+        self._write(b"key=AKIA123\r\ntoken ghp_x ghp_x\n", "a.txt")
+        self._write(b"nothing\n", "b.txt")
+        matches = fs.Dir(self.tmp_dir.name).files.t().find_any(["AKIA", "ghp_"])
+        self.assertEqual(
+            [(m.file.name, m.pattern, m.line_no, m.column) for m in matches],
+            [
+                ("a.txt", "AKIA", 1, 4),
+                ("a.txt", "ghp_", 2, 6),
+                ("a.txt", "ghp_", 2, 12),
+            ],
+        )
+
+    def test_find_any_first_only(self) -> None:
+        path = self._write(b"ab ab\nab b\n", "a.txt")
+        matches = find_any([fs.TextFile(path)], MultiMatcher(["ab", "b"]), True)
+        self.assertEqual(
+            [(m.pattern, m.line_no, m.column) for m in matches],
+            [("ab", 1, 0), ("b", 1, 1)],
+        )
+
+    def test_find_any_skip_binary(self) -> None:
+        path = self._write(b"AKIA\0\nAKIA\n", "a.bin")
+        self.assertEqual(list(find_any([fs.TextFile(path)], ["AKIA"])), [])
+        matches = find_any([fs.TextFile(path)], ["AKIA"], skip_binary=False)
+        self.assertEqual([m.line_no for m in matches], [1, 2])
+        text_files = fs.Dir(self.tmp_dir.name).files.t()
+        self.assertEqual(text_files.find_any(["AKIA"]).list(), [])
+        # The bytes of other encodings cannot be checked
+        path = self._write("AKIA".encode("utf-16"), "b.txt")
+        text_file = fs.TextFile(path, "utf-16")
+        self.assertEqual(len(list(find_any([text_file], ["AKIA"]))), 1)
+
+    def test_find_any_match_tuple(self) -> None:
+        path = self._write(b"x\n", "a.txt")
+        match = next(find_any([fs.TextFile(path)], ["x"]))
+        self.assertEqual(match, fs.PatternMatch(match.file, "x", 1, 0))
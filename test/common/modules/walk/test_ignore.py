@@ -0,0 +1,152 @@
+import os
+import re
+import tempfile
+from unittest import TestCase
+
+from fluentfs.walk import (
+    IgnoreChain,
+    IgnoreRules,
+    load_ignore_chain,
+    translate_ignore_pattern,
+)
+
+
+def _matches(pattern: str, path: str) -> bool:
+    return re.fullmatch(translate_ignore_pattern(pattern), path) is not None
+
+
+class TranslateIgnorePatternTest(TestCase):
+    def test_translate_wildcards(self) -> None:
+        self.assertTrue(_matches("*.txt", "a.txt"))
+        self.assertFalse(_matches("*.txt", "a/b.txt"))
+        self.assertTrue(_matches("a?c", "abc"))
+        self.assertFalse(_matches("a?c", "a/c"))
+        self.assertTrue(_matches("a**c", "abbc"))
+
+    def test_translate_double_star(self) -> None:
+        self.assertTrue(_matches("**/a", "a"))
+        self.assertTrue(_matches("**/a", "x/y/a"))
+        self.assertTrue(_matches("a/**/b", "a/b"))
+        self.assertTrue(_matches("a/**/b", "a/x/y/b"))
+        self.assertTrue(_matches("a/**", "a/x/y"))
+        self.assertFalse(_matches("a/**", "a"))
+
+    def test_translate_class(self) -> None:
+        self.assertTrue(_matches("[ab].txt", "a.txt"))
+        self.assertFalse(_matches("[ab].txt", "c.txt"))
+        self.assertTrue(_matches("[!ab].txt", "c.txt"))
+        self.assertFalse(_matches("[!ab].txt", "a.txt"))
+        self.assertTrue(_matches("[a-c]", "b"))
+        self.assertTrue(_matches("[]]", "]"))
+        self.assertTrue(_matches("[a", "[a"))
+
+    def test_translate_escape(self) -> None:
+        self.assertTrue(_matches("\\*", "*"))
+        self.assertFalse(_matches("\\*", "a"))
+        self.assertTrue(_matches("a.b", "a.b"))
+        self.assertFalse(_matches("a.b", "axb"))
+        self.assertTrue(_matches("a\\", "a\\"))
+
+
+class IgnoreRulesTest(TestCase):
+    def test_match_unanchored(self) -> None:
+        rules = IgnoreRules(["*.pyc\n", "build"])
+        self.assertTrue(rules.match("a.pyc", False))
+        self.assertTrue(rules.match("x/y/a.pyc", False))
+        self.assertTrue(rules.match("x/build", True))
+        self.assertIsNone(rules.match("a.py", False))
+
+    def test_match_anchored(self) -> None:
+        rules = IgnoreRules(["/build", "doc/out"])
+        self.assertTrue(rules.match("build", True))
+        self.assertIsNone(rules.match("x/build", True))
+        self.assertTrue(rules.match("doc/out", False))
+        self.assertIsNone(rules.match("x/doc/out", False))
+
+    def test_match_dir_only(self) -> None:
+        rules = IgnoreRules(["out/"])
+        self.assertTrue(rules.match("out", True))
+        self.assertTrue(rules.match("x/out", True))
+        self.assertIsNone(rules.match("out", False))
+
+    def test_match_negated(self) -> None:
+        rules = IgnoreRules(["*.log", "!keep.log", "keep.log/"])
+        self.assertTrue(rules.match("a.log", False))
+        self.assertFalse(rules.match("keep.log", False))
+        self.assertTrue(rules.match("keep.log", True))
+
+    def test_match_last_rule_wins(self) -> None:
+        rules = IgnoreRules(["!a.txt", "*.txt"])
+        self.assertTrue(rules.match("a.txt", False))
+
+    def test_comments_and_blank_lines(self) -> None:
+        rules = IgnoreRules(["# a.txt", "", "  ", "!", "/", "\\#b.txt"])
+        self.assertIsNone(rules.match("# a.txt", False))
+        self.assertIsNone(rules.match("a.txt", False))
+        self.assertTrue(rules.match("#b.txt", False))
+
+    def test_trailing_spaces(self) -> None:
+        rules = IgnoreRules(["a.txt  \r\n", "b\\ "])
+        self.assertTrue(rules.match("a.txt", False))
+        self.assertTrue(rules.match("b ", False))
+
+    def test_no_rules(self) -> None:
+        rules = IgnoreRules([])
+        self.assertIsNone(rules.match("a.txt", False))
+        self.assertIsNone(rules.match("a", True))
+
+    def test_from_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, ".gitignore")
+            with open(path, "wb") as file:
+                file.write(b"*.txt\n\xff.bin\n")
+            rules = IgnoreRules.from_file(path)
+            assert rules is not None
+            self.assertTrue(rules.match("a.txt", False))
+            self.assertTrue(rules.match("�.bin", False))
+
+            self.assertIsNone(IgnoreRules.from_file(os.path.join(tmp_dir, "missing")))
+
+
+class IgnoreChainTest(TestCase):
+    def test_is_ignored(self) -> None:
+        base_path = os.path.join(os.sep, "tmp", "repo")
+        sub_path = os.path.join(base_path, "sub")
+        parent = IgnoreChain(base_path, IgnoreRules(["*.txt", "/b"]), None)
+        chain = IgnoreChain(sub_path, IgnoreRules(["!a.txt"]), parent)
+
+        self.assertFalse(chain.is_ignored(os.path.join(sub_path, "a.txt"), False))
+        self.assertTrue(chain.is_ignored(os.path.join(sub_path, "b.txt"), False))
+        self.assertFalse(chain.is_ignored(os.path.join(sub_path, "b"), True))
+        self.assertTrue(parent.is_ignored(os.path.join(base_path, "b"), True))
+        self.assertFalse(chain.is_ignored(os.path.join(sub_path, "c.py"), False))
+
+    def test_is_ignored_root_base_path(self) -> None:
+        chain = IgnoreChain(os.sep, IgnoreRules(["a/*.txt"]), None)
+        self.assertTrue(chain.is_ignored(os.path.join(os.sep, "a", "b.txt"), False))
+
+    def test_is_ignored_outside_base_path(self) -> None:
+        base_path = os.path.join(os.sep, "tmp", "repo")
+        chain = IgnoreChain(base_path, IgnoreRules(["/dist", "*.txt"]), None)
+        self.assertFalse(chain.is_ignored(os.path.join(os.sep, "tmp", "dist"), True))
+        self.assertFalse(chain.is_ignored(os.path.join(os.sep, "a.txt"), False))
+
+    def test_load_ignore_chain(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, ".gitignore"), "w") as file:
+                file.write("*.txt\n")
+            with open(os.path.join(tmp_dir, ".ignore"), "w") as file:
+                file.write("!a.txt\n")
+
+            self.assertIsNone(load_ignore_chain(tmp_dir, [], None))
+
+            chain = load_ignore_chain(tmp_dir, [".gitignore", ".ignore"], None)
+            assert chain is not None
+            self.assertFalse(chain.is_ignored(os.path.join(tmp_dir, "a.txt"), False))
+            self.assertTrue(chain.is_ignored(os.path.join(tmp_dir, "b.txt"), False))
+
+            # Unreadable ignore files are skipped
+            parent = IgnoreChain(tmp_dir, IgnoreRules([]), None)
+            self.assertIs(load_ignore_chain(tmp_dir, ["missing"], parent), parent)
+            os.remove(os.path.join(tmp_dir, ".ignore"))
+            self.assertIs(load_ignore_chain(tmp_dir, [".ignore"], parent), parent)
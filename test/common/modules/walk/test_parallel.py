@@ -0,0 +1,169 @@
+import os
+import tempfile
+from test.common.modules.walk.test_walker import (
+    IGNORE_TREE_WALK,
+    LINK_TREE_WALK,
+    make_ignore_tree,
+    make_link_tree,
+)
+from test.test_fs_values import BASE_DIR_PATH, SUB_DIR_PATH
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import patch
+
+import fluentfs as fs
+from fluentfs.walk import scan_dir
+
+
+def _make_tree(path: str, depth: int, width: int) -> None:
+    for i in range(width):
+        with open(os.path.join(path, f"file{i}.txt"), "w") as f:
+            f.write(f"{depth} {i}")
+        if depth > 0:
+            sub_dir_path = os.path.join(path, f"dir{i}")
+            os.mkdir(sub_dir_path)
+            _make_tree(sub_dir_path, depth - 1, width)
+
+
+class ParallelWalkerTest(TestCase):
+    tmp_dir: "tempfile.TemporaryDirectory[str]"
+    tree_path: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.tree_path = cls.tmp_dir.name
+        _make_tree(cls.tree_path, 3, 3)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmp_dir.cleanup()
+
+    def _paths(self, walker: fs.Walker) -> List[str]:
+        return [entry.path for entry in walker]
+
+    def test_ordered(self) -> None:
+        expected = self._paths(fs.Walker(self.tree_path))
+        for max_pending in [1, 2, 100]:
+            walker = fs.ParallelWalker(self.tree_path, max_pending=max_pending)
+            self.assertEqual(self._paths(walker), expected)
+
+    def test_ordered_options(self) -> None:
+        options_list: List[Dict[str, Any]] = [
+            {"breadth_first": True},
+            {"max_depth": 2},
+            {"breadth_first": True, "max_depth": 1},
+        ]
+        for options in options_list:
+            expected = self._paths(fs.Walker(self.tree_path, **options))
+            for max_pending in [1, 100]:
+                walker = fs.ParallelWalker(
+                    self.tree_path, max_pending=max_pending, **options
+                )
+                self.assertEqual(self._paths(walker), expected)
+
+    def test_unordered_max_depth(self) -> None:
+        expected = self._paths(fs.Walker(self.tree_path, max_depth=2))
+        walker = fs.ParallelWalker(self.tree_path, ordered=False, max_depth=2)
+        self.assertEqual(sorted(self._paths(walker)), sorted(expected))
+
+    def test_unordered(self) -> None:
+        expected = self._paths(fs.Walker(self.tree_path))
+        for max_pending in [1, 100]:
+            walker = fs.ParallelWalker(
+                self.tree_path, ordered=False, max_pending=max_pending
+            )
+            paths = self._paths(walker)
+            self.assertEqual(sorted(paths), sorted(expected))
+
+    def test_unordered_dir_before_files(self) -> None:
+        walker = fs.ParallelWalker(self.tree_path, workers=8, ordered=False)
+        seen = set()
+        for entry in walker:
+            if entry.is_dir():
+                seen.add(entry.path)
+            else:
+                self.assertIn(os.path.dirname(entry.path), seen)
+
+    def test_options(self) -> None:
+        walker = fs.ParallelWalker(
+            BASE_DIR_PATH, workers=2, files=False, exclude_dir_globs=["*/sub_dir"]
+        )
+        self.assertEqual(self._paths(walker), [BASE_DIR_PATH])
+
+    def test_pruned_root(self) -> None:
+        walker = fs.ParallelWalker(BASE_DIR_PATH, exclude_base_paths=[BASE_DIR_PATH])
+        self.assertEqual(self._paths(walker), [])
+
+    def test_unlistable(self) -> None:
+        def scan(path: str, sort: bool, follow_symlinks: bool) -> object:
+            return None if path == SUB_DIR_PATH else scan_dir(path, sort)
+
+        with patch("fluentfs.walk.walker.scan_dir", scan):
+            for ordered in [True, False]:
+                walker = fs.ParallelWalker(BASE_DIR_PATH, files=False, ordered=ordered)
+                self.assertEqual(self._paths(walker), [BASE_DIR_PATH])
+
+    def test_abandon(self) -> None:
+        entries = iter(fs.ParallelWalker(self.tree_path, workers=2))
+        self.assertEqual(next(entries).path, self.tree_path)
+        entries.close()  # type: ignore
+
+    def test_invalid_workers(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.ParallelWalker(BASE_DIR_PATH, workers=0)
+
+    def test_dir_walk(self) -> None:
+        self.assertEqual(
+            fs.Dir(self.tree_path).walk(workers=4).files.map_path().list(),
+            fs.Dir(self.tree_path).files.map_path().list(),
+        )
+        self.assertEqual(
+            fs.Dir(self.tree_path).walk(workers=4, ordered=False).dirs.len(),
+            fs.Dir(self.tree_path).dirs.len(),
+        )
+
+    def test_respect_gitignore(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            make_ignore_tree(tmp_dir)
+            for ordered in [True, False]:
+                walker = fs.ParallelWalker(
+                    tmp_dir, ordered=ordered, respect_gitignore=True
+                )
+                paths = [os.path.relpath(path, tmp_dir) for path in self._paths(walker)]
+                self.assertEqual(sorted(paths), sorted(IGNORE_TREE_WALK))
+
+    def test_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint_path = os.path.join(tmp_dir, "checkpoint")
+            expected = self._paths(fs.Walker(self.tree_path))
+            walker = fs.ParallelWalker(
+                self.tree_path,
+                max_pending=2,
+                checkpoint=checkpoint_path,
+                checkpoint_interval=0,
+            )
+            entries = iter(walker)
+            for _ in range(10):
+                next(entries)
+            entries.close()  # type: ignore
+
+            resumed = walker.replace(checkpoint=None, resume_from=checkpoint_path)
+            self.assertEqual(self._paths(resumed), expected[9:])
+            resumed = resumed.replace(ordered=False)
+            self.assertEqual(sorted(self._paths(resumed)), sorted(expected[9:]))
+
+    def test_checkpoint_unordered(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.ParallelWalker(BASE_DIR_PATH, ordered=False, checkpoint="checkpoint")
+
+    def test_follow_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir = os.path.realpath(tmp_dir)
+            make_link_tree(tmp_dir)
+            for ordered in [True, False]:
+                walker = fs.ParallelWalker(
+                    os.path.join(tmp_dir, "tree"), ordered=ordered, follow_symlinks=True
+                )
+                paths = [os.path.relpath(path, tmp_dir) for path in self._paths(walker)]
+                self.assertEqual(sorted(paths), sorted(LINK_TREE_WALK))
@@ -0,0 +1,25 @@
+from test.test_fs_values import BASE_DIR_PATH
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import fluentfs as fs
+from fluentfs.walk import WalkSummary, summarize
+
+
+class SummarizeTest(TestCase):
+    def test_summarize(self) -> None:
+        self.assertEqual(
+            summarize(fs.Walker(BASE_DIR_PATH)),
+            WalkSummary(
+                2,
+                10,
+                fs.Dir(BASE_DIR_PATH).files.map_byte_count().sum(),
+                {"txt": 6, "txt2": 1, "": 3},
+            ),
+        )
+
+    def test_summarize_vanished(self) -> None:
+        entry = MagicMock(is_dir=lambda follow_symlinks: False)
+        entry.name = "a.txt"
+        entry.stat.side_effect = OSError
+        self.assertEqual(summarize([entry]), WalkSummary(0, 1, 0, {"txt": 1}))
@@ -0,0 +1,115 @@
+import os
+import tempfile
+from test.test_fs_values import BASE_DIR_PATH, SUB_DIR_PATH
+from typing import Any
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import fluentfs as fs
+from fluentfs.walk import DiskUsage, allocated_size, dir_usage, disk_usage
+
+
+def _dir_entry(path: str) -> Any:
+    return MagicMock(path=path, is_dir=lambda follow_symlinks: True)
+
+
+class DiskUsageTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.tmp_dir.name
+        os.mkdir(os.path.join(self.path, "d"))
+        with open(os.path.join(self.path, "d", "f"), "w") as f:
+            f.write("x" * 10000)
+        os.link(os.path.join(self.path, "d", "f"), os.path.join(self.path, "h"))
+        # A sparse file with a size of 100 MiB
+        with open(os.path.join(self.path, "s"), "wb") as f:
+            f.truncate(100 * 1024 * 1024)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_disk_usage(self) -> None:
+        usage = fs.Dir(self.path).files.disk_usage()
+        # The hard link is only counted once
+        self.assertEqual(usage.apparent_size, 10000 + 100 * 1024 * 1024)
+        self.assertLess(usage.allocated_size, 1024 * 1024)
+        self.assertGreaterEqual(usage.allocated_size, 10000)
+
+    def test_dir_usage(self) -> None:
+        usage = dir_usage(fs.Walker(self.path))
+        self.assertEqual(list(usage), [self.path, os.path.join(self.path, "d")])
+        self.assertEqual(usage[self.path], fs.Dir(self.path).files.disk_usage())
+        # The hard link in the root directory is visited first
+        self.assertEqual(usage[os.path.join(self.path, "d")], DiskUsage(0, 0))
+
+    def test_du(self) -> None:
+        for workers in [1, 4]:
+            self.assertEqual(
+                fs.Dir(self.path).du(workers=workers),
+                dir_usage(fs.Walker(self.path)),
+            )
+        usage = (
+            fs.Dir(self.path).walk(exclude_base_path=os.path.join(self.path, "d")).du()
+        )
+        self.assertEqual(usage[self.path].apparent_size, 10000 + 100 * 1024 * 1024)
+
+    def test_du_follow_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as outside_path:
+            os.makedirs(os.path.join(outside_path, "t", "u"))
+            for name, size in [("g", 500), ("t/x", 1000), ("t/u/y", 2000)]:
+                with open(os.path.join(outside_path, name), "w") as f:
+                    f.write("x" * size)
+            os.mkdir(os.path.join(outside_path, "v"))
+            with open(os.path.join(outside_path, "v", "z"), "w") as f:
+                f.write("x" * 4000)
+            os.symlink(os.path.join(outside_path, "t"), os.path.join(self.path, "l"))
+            os.symlink(
+                os.path.join(outside_path, "g"), os.path.join(self.path, "d", "m")
+            )
+            # A link inside a followed directory
+            os.symlink(
+                os.path.join(outside_path, "v"), os.path.join(outside_path, "t", "w")
+            )
+
+            walk = fs.Dir(self.path).walk(follow_symlinks=True)
+            usage = walk.du()
+            self.assertEqual(usage[self.path], walk.files.disk_usage())
+            link_path = os.path.join(self.path, "l")
+            self.assertEqual(
+                list(usage),
+                [
+                    self.path,
+                    os.path.join(self.path, "d"),
+                    link_path,
+                    os.path.join(link_path, "u"),
+                    os.path.join(link_path, "w"),
+                ],
+            )
+            self.assertEqual(usage[link_path].apparent_size, 7000)
+            self.assertEqual(usage[os.path.join(link_path, "w")].apparent_size, 4000)
+            self.assertEqual(usage[os.path.join(self.path, "d")].apparent_size, 500)
+
+    def test_dir_usage_vanished(self) -> None:
+        entry = MagicMock(path="f", is_dir=lambda follow_symlinks: False)
+        entry.stat.side_effect = OSError
+        self.assertEqual(dir_usage([entry]), {})
+
+    def test_dir_usage_root(self) -> None:
+        root_path = os.path.abspath(os.sep)
+        self.assertEqual(
+            dir_usage([_dir_entry(root_path)]), {root_path: DiskUsage(0, 0)}
+        )
+
+    def test_allocated_size(self) -> None:
+        stat_result = MagicMock(spec=["st_size"], st_size=3)
+        self.assertEqual(allocated_size(stat_result), 3)
+
+    def test_testfs(self) -> None:
+        usage = fs.Dir(BASE_DIR_PATH).du()
+        self.assertEqual(
+            usage[SUB_DIR_PATH],
+            disk_usage(
+                f.stat()
+                for f in fs.Dir(BASE_DIR_PATH).files.filter_base_path(SUB_DIR_PATH)
+            ),
+        )
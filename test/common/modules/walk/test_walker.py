@@ -0,0 +1,605 @@
+import os
+import re
+import tempfile
+from test.test_fs_values import (
+    A_SYMLINK_PATH,
+    A_TXT_PATH,
+    B_TXT_PATH,
+    BASE_DIR_PATH,
+    C_TXT2_PATH,
+    D_TXT_PATH,
+    E_TXT_PATH,
+    EMPTY_TXT_PATH,
+    EMPTYBIN_PATH,
+    EMPTYLINES_TXT_PATH,
+    RNDBIN1_PATH,
+    RNDBIN2_PATH,
+    SUB_DIR_PATH,
+)
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import fluentfs as fs
+from fluentfs.walk import (
+    RootEntry,
+    TargetEntry,
+    WalkEntry,
+    WalkIterator,
+    is_sub_path,
+    scan_dir,
+)
+from fluentfs.walk.walker import _device
+
+IGNORE_TREE = {
+    ".gitignore": "*.log\nbuild/\n!keep.log\n",
+    "a.py": "",
+    "a.log": "",
+    "keep.log": "",
+    "build/b.py": "",
+    ".git/HEAD": "",
+    "src/.gitignore": "/gen\n*.py\n",
+    "src/.ignore": "!b.py\n",
+    "src/a.py": "",
+    "src/b.py": "",
+    "src/gen/c.txt": "",
+    "src/x/gen": "",
+}
+
+IGNORE_TREE_WALK = [
+    ".",
+    ".gitignore",
+    "a.py",
+    "keep.log",
+    "src",
+    os.path.join("src", ".gitignore"),
+    os.path.join("src", ".ignore"),
+    os.path.join("src", "b.py"),
+    os.path.join("src", "x"),
+    os.path.join("src", "x", "gen"),
+]
+
+
+def make_ignore_tree(path: str) -> None:
+    for file_path, content in IGNORE_TREE.items():
+        file_path = os.path.join(path, *file_path.split("/"))
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+
+
+class RootEntryTest(TestCase):
+    def test_root_entry(self) -> None:
+        entry = RootEntry(SUB_DIR_PATH)
+        self.assertEqual(entry.path, SUB_DIR_PATH)
+        self.assertEqual(entry.name, "sub_dir")
+        self.assertTrue(entry.is_dir())
+        self.assertFalse(entry.is_file())
+        self.assertFalse(entry.is_symlink())
+        self.assertEqual(entry.inode(), os.stat(SUB_DIR_PATH).st_ino)
+
+
+class TargetEntryTest(TestCase):
+    def test_target_entry(self) -> None:
+        entry = TargetEntry(A_TXT_PATH, os.stat(A_TXT_PATH))
+        self.assertEqual(entry.name, "a.txt")
+        self.assertFalse(entry.is_dir())
+        self.assertTrue(entry.is_file())
+        self.assertFalse(entry.is_symlink())
+        self.assertEqual(entry.inode(), os.stat(A_TXT_PATH).st_ino)
+        self.assertIs(entry.stat(), entry.stat())
+
+
+class ScanDirTest(TestCase):
+    def test_scan_dir(self) -> None:
+        listing = scan_dir(BASE_DIR_PATH)
+        assert listing is not None
+        dirs, files = listing
+        self.assertEqual([entry.path for entry in dirs], [SUB_DIR_PATH])
+        self.assertEqual(
+            [entry.path for entry in files],
+            [
+                A_TXT_PATH,
+                B_TXT_PATH,
+                C_TXT2_PATH,
+                EMPTYBIN_PATH,
+                EMPTYLINES_TXT_PATH,
+                RNDBIN1_PATH,
+            ],
+        )
+
+    def test_scan_dir_symlinks(self) -> None:
+        if not os.path.exists(A_SYMLINK_PATH):
+            os.symlink(A_TXT_PATH, A_SYMLINK_PATH)
+
+        listing = scan_dir(BASE_DIR_PATH)
+        assert listing is not None
+        self.assertNotIn(A_SYMLINK_PATH, [entry.path for entry in listing[1]])
+        os.remove(A_SYMLINK_PATH)
+
+    def test_scan_dir_missing(self) -> None:
+        self.assertIsNone(scan_dir(os.path.join(BASE_DIR_PATH, "no")))
+
+
+class IsSubPathTest(TestCase):
+    def test_is_sub_path(self) -> None:
+        self.assertTrue(is_sub_path(D_TXT_PATH, SUB_DIR_PATH))
+        self.assertTrue(is_sub_path(SUB_DIR_PATH, SUB_DIR_PATH))
+        self.assertTrue(is_sub_path(SUB_DIR_PATH, os.sep))
+        self.assertFalse(is_sub_path(SUB_DIR_PATH, D_TXT_PATH))
+        self.assertFalse(is_sub_path(SUB_DIR_PATH + "2", SUB_DIR_PATH))
+
+
+class WalkerTest(TestCase):
+    def test_walk(self) -> None:
+        self.assertEqual(
+            [entry.path for entry in fs.Walker(BASE_DIR_PATH)],
+            [
+                BASE_DIR_PATH,
+                A_TXT_PATH,
+                B_TXT_PATH,
+                C_TXT2_PATH,
+                EMPTYBIN_PATH,
+                EMPTYLINES_TXT_PATH,
+                RNDBIN1_PATH,
+                SUB_DIR_PATH,
+                D_TXT_PATH,
+                E_TXT_PATH,
+                EMPTY_TXT_PATH,
+                RNDBIN2_PATH,
+            ],
+        )
+
+    def test_walk_files(self) -> None:
+        self.assertEqual(
+            [entry.path for entry in fs.Walker(SUB_DIR_PATH, dirs=False)],
+            [D_TXT_PATH, E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH],
+        )
+
+    def test_walk_dirs(self) -> None:
+        self.assertEqual(
+            [entry.path for entry in fs.Walker(BASE_DIR_PATH, files=False)],
+            [BASE_DIR_PATH, SUB_DIR_PATH],
+        )
+
+    def test_walk_missing(self) -> None:
+        self.assertEqual(list(fs.Walker(os.path.join(BASE_DIR_PATH, "no"))), [])
+
+    def test_walk_no_stat(self) -> None:
+        dir = fs.Dir(BASE_DIR_PATH)
+        with patch("os.stat") as stat, patch("os.lstat") as lstat:
+            files = dir.files.list()
+        self.assertEqual(len(files), 10)
+        stat.assert_not_called()
+        lstat.assert_not_called()
+
+
+class WalkerPruneTest(TestCase):
+    def test_include_base_paths(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, include_base_paths=[SUB_DIR_PATH])
+        self.assertEqual(
+            [entry.path for entry in walker],
+            [SUB_DIR_PATH, D_TXT_PATH, E_TXT_PATH, EMPTY_TXT_PATH, RNDBIN2_PATH],
+        )
+
+    def test_include_base_paths_file(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, include_base_paths=[D_TXT_PATH, A_TXT_PATH])
+        self.assertEqual([entry.path for entry in walker], [A_TXT_PATH, D_TXT_PATH])
+
+    def test_exclude_base_paths(self) -> None:
+        walker = fs.Walker(
+            BASE_DIR_PATH, exclude_base_paths=[SUB_DIR_PATH, C_TXT2_PATH]
+        )
+        self.assertEqual(
+            [entry.path for entry in walker],
+            [
+                BASE_DIR_PATH,
+                A_TXT_PATH,
+                B_TXT_PATH,
+                EMPTYBIN_PATH,
+                EMPTYLINES_TXT_PATH,
+                RNDBIN1_PATH,
+            ],
+        )
+
+    def test_exclude_base_paths_not_listed(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, exclude_base_paths=[SUB_DIR_PATH])
+        with patch("fluentfs.walk.walker.scan_dir", wraps=scan_dir) as scan:
+            list(walker)
+        scan.assert_called_once_with(BASE_DIR_PATH, True, False)
+
+    def test_pruned_root(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, exclude_base_paths=[BASE_DIR_PATH])
+        self.assertEqual(list(walker), [])
+
+    def test_exclude_dir_globs(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, files=False, exclude_dir_globs=["*/sub_*"])
+        self.assertEqual([entry.path for entry in walker], [BASE_DIR_PATH])
+
+    def test_exclude_dir_regexes(self) -> None:
+        walker = fs.Walker(
+            BASE_DIR_PATH, files=False, exclude_dir_regexes=[re.compile(".*_dir")]
+        )
+        self.assertEqual([entry.path for entry in walker], [BASE_DIR_PATH])
+
+    def test_dir_filter(self) -> None:
+        walker = fs.Walker(
+            BASE_DIR_PATH, files=False, dir_filter=lambda entry: entry.name != "sub_dir"
+        )
+        self.assertEqual([entry.path for entry in walker], [BASE_DIR_PATH])
+
+    def test_replace(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH)
+        replaced = walker.replace(files=False)
+        self.assertTrue(walker.files)
+        self.assertFalse(replaced.files)
+        self.assertEqual(replaced.path, BASE_DIR_PATH)
+
+    def test_replace_unknown(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            fs.Walker(BASE_DIR_PATH).replace(follow=True)
+
+
+class WalkIteratorTest(TestCase):
+    def test_walk_iterator(self) -> None:
+        it = WalkIterator(fs.Walker(SUB_DIR_PATH, files=False), lambda e: e.name)
+        self.assertFalse(it.started)
+        self.assertEqual(list(it), ["sub_dir"])
+        self.assertTrue(it.started)
+
+    def test_with_walker(self) -> None:
+        it = WalkIterator(fs.Walker(SUB_DIR_PATH, files=False), lambda e: e.name)
+        self.assertEqual(
+            list(it.with_walker(fs.Walker(SUB_DIR_PATH, dirs=False))),
+            ["d.txt", "e.txt", "empty.txt", "rndbin2"],
+        )
+
+
+class WalkerOrderTest(TestCase):
+    def test_max_depth_0(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, max_depth=0)
+        self.assertEqual([entry.path for entry in walker], [BASE_DIR_PATH])
+
+    def test_max_depth_1(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, max_depth=1)
+        self.assertEqual(
+            [entry.path for entry in walker],
+            [
+                BASE_DIR_PATH,
+                A_TXT_PATH,
+                B_TXT_PATH,
+                C_TXT2_PATH,
+                EMPTYBIN_PATH,
+                EMPTYLINES_TXT_PATH,
+                RNDBIN1_PATH,
+                SUB_DIR_PATH,
+            ],
+        )
+
+    def test_max_depth_not_listed(self) -> None:
+        walker = fs.Walker(BASE_DIR_PATH, max_depth=1)
+        with patch("fluentfs.walk.walker.scan_dir", wraps=scan_dir) as scan:
+            list(walker)
+        scan.assert_called_once_with(BASE_DIR_PATH, True, False)
+
+    def test_breadth_first(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for sub_dir in ["a/b", "c"]:
+                os.makedirs(os.path.join(tmp_dir, sub_dir))
+            walker = fs.Walker(tmp_dir, breadth_first=True)
+            self.assertEqual(
+                [os.path.relpath(entry.path, tmp_dir) for entry in walker],
+                [".", "a", "c", os.path.join("a", "b")],
+            )
+
+    def test_breadth_first_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for sub_dir in ["a/b", "c"]:
+                os.makedirs(os.path.join(tmp_dir, sub_dir))
+            for file_path in ["z", "a/y", "a/b/x", "c/w"]:
+                open(os.path.join(tmp_dir, file_path), "w").close()
+            walker = fs.Walker(tmp_dir, breadth_first=True)
+            # The files of a directory are yielded right after it
+            self.assertEqual(
+                [os.path.relpath(entry.path, tmp_dir) for entry in walker],
+                [
+                    ".",
+                    "z",
+                    "a",
+                    os.path.join("a", "y"),
+                    "c",
+                    os.path.join("c", "w"),
+                    os.path.join("a", "b"),
+                    os.path.join("a", "b", "x"),
+                ],
+            )
+
+    def test_unsorted(self) -> None:
+        self.assertEqual(
+            sorted(entry.path for entry in fs.Walker(BASE_DIR_PATH, sort=False)),
+            sorted(entry.path for entry in fs.Walker(BASE_DIR_PATH)),
+        )
+
+    def test_scan_dir_unsorted(self) -> None:
+        listing = scan_dir(BASE_DIR_PATH, sort=False)
+        assert listing is not None
+        self.assertEqual(len(listing[1]), 6)
+
+
+class WalkerIgnoreTest(TestCase):
+    def test_respect_gitignore(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            make_ignore_tree(tmp_dir)
+            walker = fs.Walker(tmp_dir, respect_gitignore=True)
+            self.assertEqual(
+                [os.path.relpath(entry.path, tmp_dir) for entry in walker],
+                IGNORE_TREE_WALK,
+            )
+            self.assertEqual(len(list(fs.Walker(tmp_dir))), 18)
+
+    def test_respect_gitignore_pruned(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            make_ignore_tree(tmp_dir)
+            walker = fs.Walker(tmp_dir, respect_gitignore=True)
+            with patch("fluentfs.walk.walker.scan_dir", wraps=scan_dir) as scan:
+                list(walker)
+            self.assertEqual(
+                [
+                    os.path.relpath(call.args[0], tmp_dir)
+                    for call in scan.call_args_list
+                ],
+                [".", "src", os.path.join("src", "x")],
+            )
+
+    def test_respect_gitignore_without_ignore_files(self) -> None:
+        self.assertEqual(
+            [entry.path for entry in fs.Walker(BASE_DIR_PATH, respect_gitignore=True)],
+            [entry.path for entry in fs.Walker(BASE_DIR_PATH)],
+        )
+
+    def test_respect_gitignore_follow_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = os.path.join(tmp_dir, "root")
+            outside = os.path.join(tmp_dir, "outside")
+            os.makedirs(os.path.join(outside, "dist"))
+            os.makedirs(os.path.join(root, "dist"))
+            with open(os.path.join(root, ".gitignore"), "w") as file:
+                file.write("/dist\n/ignored_link\n")
+            with open(os.path.join(tmp_dir, "f.txt"), "w"):
+                pass
+            os.symlink(outside, os.path.join(root, "link"))
+            os.symlink(
+                os.path.join(tmp_dir, "f.txt"), os.path.join(root, "ignored_link")
+            )
+
+            walker = fs.Walker(root, respect_gitignore=True, follow_symlinks=True)
+            expected = [root, os.path.join(root, ".gitignore"), outside]
+            expected.append(os.path.join(outside, "dist"))
+            self.assertEqual([entry.path for entry in walker], expected)
+
+            # A resumed walk does not look for ignore files above the link target
+            checkpoint_path = os.path.join(tmp_dir, "checkpoint")
+            entries = iter(
+                walker.replace(checkpoint=checkpoint_path, checkpoint_interval=0)
+            )
+            for _ in range(3):
+                next(entries)
+            resumed = walker.replace(resume_from=checkpoint_path)
+            self.assertEqual([entry.path for entry in resumed], expected[2:])
+
+
+class WalkerCheckpointTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tree_path = os.path.join(self.tmp_dir.name, "tree")
+        self.checkpoint_path = os.path.join(self.tmp_dir.name, "checkpoint")
+        make_ignore_tree(self.tree_path)
+        os.makedirs(os.path.join(self.tree_path, "lib", "sub"))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _paths(self, walker: fs.Walker) -> List[str]:
+        return [entry.path for entry in walker]
+
+    def _interrupted(self, walker: fs.Walker, count: int) -> List[str]:
+        # Consumes count entries of a checkpointing walk, then resumes it
+        entries = iter(walker.replace(checkpoint=self.checkpoint_path))
+        for _ in range(count):
+            next(entries)
+        return self._paths(walker.replace(resume_from=self.checkpoint_path))
+
+    def test_resume(self) -> None:
+        options_list: List[Dict[str, Any]] = [
+            {},
+            {"breadth_first": True},
+            {"respect_gitignore": True},
+            {"files": False, "max_depth": 2},
+        ]
+        for options in options_list:
+            walker = fs.Walker(self.tree_path, checkpoint_interval=0, **options)
+            expected = self._paths(walker)
+            for count in range(1, len(expected) + 1):
+                # The last consumed entry may not have been processed yet
+                start = count - 1
+                self.assertEqual(self._interrupted(walker, count), expected[start:])
+
+    def test_resume_unsorted(self) -> None:
+        walker = fs.Walker(self.tree_path, sort=False, checkpoint_interval=0)
+        expected = self._paths(walker)
+        for count in range(1, len(expected) + 1):
+            paths = self._interrupted(walker, count)
+            start = len(expected) - len(paths)
+            self.assertLessEqual(start, count - 1)
+            self.assertEqual(paths, expected[start:])
+
+    def test_checkpoint_interval(self) -> None:
+        walker = fs.Walker(self.tree_path, checkpoint=self.checkpoint_path)
+        entries = iter(walker)
+        next(entries)
+        next(entries)
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+        list(entries)
+        # A complete walk yields nothing when resumed
+        self.assertEqual(
+            self._paths(walker.replace(resume_from=self.checkpoint_path)), []
+        )
+
+    def test_resume_missing(self) -> None:
+        walker = fs.Walker(self.tree_path)
+        self.assertEqual(
+            self._paths(walker.replace(resume_from=self.checkpoint_path)),
+            self._paths(walker),
+        )
+
+    def test_resume_other_walk(self) -> None:
+        list(fs.Walker(self.tree_path, checkpoint=self.checkpoint_path))
+        walker = fs.Walker(
+            self.tree_path, breadth_first=True, resume_from=self.checkpoint_path
+        )
+        with self.assertRaises(fs.FluentFsException):
+            list(walker)
+
+    def test_invalid_checkpoint(self) -> None:
+        walker = fs.Walker(self.tree_path, resume_from=self.checkpoint_path)
+        for content in ["{", '{"version": 0}', "[]"]:
+            with open(self.checkpoint_path, "w") as f:
+                f.write(content)
+            with self.assertRaises(fs.FluentFsException):
+                list(walker)
+
+
+def make_link_tree(path: str) -> None:
+    """
+    Create a tree in which several directories and files can be reached through
+    symbolic links and hard links (and which contains a cycle).
+    """
+    tree_path = os.path.join(path, "tree")
+    for dir_path in ["tree/a", "tree/b", "outside"]:
+        os.makedirs(os.path.join(path, *dir_path.split("/")))
+    for file_path in ["tree/a/f1", "tree/b/f2", "outside/g"]:
+        with open(os.path.join(path, *file_path.split("/")), "w") as f:
+            f.write(file_path)
+    os.link(os.path.join(tree_path, "a", "f1"), os.path.join(tree_path, "hard"))
+    os.symlink(os.path.join("..", "b"), os.path.join(tree_path, "a", "link_to_b"))
+    os.symlink("..", os.path.join(tree_path, "b", "cycle"))
+    os.symlink(os.path.join(tree_path, "a", "f1"), os.path.join(tree_path, "flink"))
+    os.symlink(os.path.join(path, "missing"), os.path.join(tree_path, "broken"))
+    os.symlink(os.path.join(path, "outside"), os.path.join(tree_path, "outside"))
+
+
+# The walk of the link tree following symbolic links (relative to its parent)
+LINK_TREE_WALK = [
+    "tree",
+    os.path.join("tree", "a", "f1"),
+    os.path.join("tree", "a"),
+    os.path.join("tree", "b"),
+    os.path.join("tree", "b", "f2"),
+    "outside",
+    os.path.join("outside", "g"),
+]
+
+
+class WalkerSymlinkTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.realpath(self.tmp_dir.name)
+        self.tree_path = os.path.join(self.path, "tree")
+        make_link_tree(self.path)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _paths(self, walker: fs.Walker) -> List[str]:
+        return [os.path.relpath(entry.path, self.path) for entry in walker]
+
+    def test_follow_symlinks(self) -> None:
+        self.assertEqual(
+            self._paths(fs.Walker(self.tree_path, follow_symlinks=True)),
+            LINK_TREE_WALK,
+        )
+
+    def test_not_follow_symlinks(self) -> None:
+        self.assertEqual(
+            self._paths(fs.Walker(self.tree_path)),
+            [
+                "tree",
+                os.path.join("tree", "hard"),
+                os.path.join("tree", "a"),
+                os.path.join("tree", "a", "f1"),
+                os.path.join("tree", "b"),
+                os.path.join("tree", "b", "f2"),
+            ],
+        )
+
+    def test_scan_dir_follow_symlinks(self) -> None:
+        listing = scan_dir(self.tree_path, follow_symlinks=True)
+        assert listing is not None
+        dir_entries, file_entries = listing
+        self.assertEqual([entry.name for entry in dir_entries], ["a", "b", "outside"])
+        self.assertIsInstance(dir_entries[2], TargetEntry)
+        self.assertEqual(
+            [entry.path for entry in file_entries],
+            [
+                os.path.join(self.tree_path, "a", "f1"),
+                os.path.join(self.tree_path, "hard"),
+            ],
+        )
+
+    def test_follow_symlinks_missing(self) -> None:
+        walker = fs.Walker(os.path.join(self.path, "missing"), follow_symlinks=True)
+        self.assertEqual(list(walker), [])
+
+    def test_follow_symlinks_vanished(self) -> None:
+        def stat(entry: os.DirEntry, follow_symlinks: bool = True) -> os.stat_result:
+            raise FileNotFoundError(entry.path)
+
+        # Nothing below a directory vanishing after its listing is visited
+        with patch("fluentfs.walk.walker.RootEntry.stat", stat):
+            self.assertEqual(
+                self._paths(fs.Walker(self.tree_path, follow_symlinks=True)), ["tree"]
+            )
+        with patch("fluentfs.walk.walker._identity", side_effect=OSError):
+            self.assertEqual(
+                self._paths(fs.Walker(self.tree_path, follow_symlinks=True)), ["tree"]
+            )
+
+
+class WalkerOneFileSystemTest(TestCase):
+    @staticmethod
+    def _device(entry: WalkEntry) -> int:
+        # Pretends that another filesystem is mounted on the subdirectory
+        return 0 if entry.path == SUB_DIR_PATH else os.stat(entry.path).st_dev
+
+    @staticmethod
+    def _try_stat(path: str) -> Any:
+        return MagicMock(st_dev=0) if path == SUB_DIR_PATH else os.stat(path)
+
+    def _paths(self, **options: Any) -> List[str]:
+        walker = fs.Walker(BASE_DIR_PATH, one_file_system=True, files=False, **options)
+        with patch("fluentfs.walk.walker._device", self._device), patch(
+            "fluentfs.walk.walker._try_stat", self._try_stat
+        ):
+            return [entry.path for entry in walker]
+
+    def test_one_file_system(self) -> None:
+        self.assertEqual(self._paths(), [BASE_DIR_PATH])
+
+    def test_allowed_mounts(self) -> None:
+        self.assertEqual(
+            self._paths(allowed_mounts=[SUB_DIR_PATH]), [BASE_DIR_PATH, SUB_DIR_PATH]
+        )
+
+    def test_one_file_system_real(self) -> None:
+        self.assertEqual(
+            [entry.path for entry in fs.Walker(BASE_DIR_PATH, one_file_system=True)],
+            [entry.path for entry in fs.Walker(BASE_DIR_PATH)],
+        )
+
+    def test_one_file_system_missing(self) -> None:
+        walker = fs.Walker(os.path.join(BASE_DIR_PATH, "missing"), one_file_system=True)
+        self.assertEqual(list(walker), [])
+
+    def test_vanished(self) -> None:
+        entry = MagicMock(stat=MagicMock(side_effect=OSError))
+        self.assertIsNone(_device(entry))
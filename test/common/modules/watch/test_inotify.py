@@ -0,0 +1,275 @@
+import errno
+import os
+import shutil
+import struct
+import tempfile
+from typing import Any, List
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+import fluentfs as fs
+from fluentfs.walk import scan_dir
+from fluentfs.watch import (
+    ChangeEvent,
+    ChangeKind,
+    InotifyWatcher,
+    inotify_available,
+    parse_events,
+)
+from fluentfs.watch.inotify import (
+    _MAX_READS,
+    IN_CREATE,
+    IN_Q_OVERFLOW,
+    _collapse,
+    _load_libc,
+)
+
+
+class InotifyHelpersTest(TestCase):
+    def test_parse_events(self) -> None:
+        data = struct.pack("iIII", 1, 2, 3, 8) + b"name\0\0\0\0"
+        data += struct.pack("iIII", 4, 5, 6, 0)
+        self.assertEqual(list(parse_events(data)), [(1, 2, 3, "name"), (4, 5, 6, "")])
+
+    def test_collapse(self) -> None:
+        modified = ChangeEvent(ChangeKind.MODIFIED, "a", False)
+        created = ChangeEvent(ChangeKind.CREATED, "a", False)
+        self.assertEqual(
+            _collapse([created, created, modified, modified, created, modified]),
+            [created, created, modified, created, modified],
+        )
+
+    def test_load_libc(self) -> None:
+        with patch("fluentfs.watch.inotify.sys.platform", "darwin"):
+            self.assertIsNone(_load_libc())
+        with patch("fluentfs.watch.inotify.ctypes.CDLL", side_effect=OSError):
+            self.assertIsNone(_load_libc())
+        with patch("fluentfs.watch.inotify.ctypes.CDLL", return_value=object()):
+            self.assertIsNone(_load_libc())
+
+    def test_unavailable(self) -> None:
+        with patch("fluentfs.watch.inotify._libc", return_value=None):
+            self.assertFalse(inotify_available())
+            with self.assertRaises(fs.FluentFsException):
+                InotifyWatcher(os.getcwd())
+
+
+@skipUnless(inotify_available(), "inotify is not available")
+class InotifyWatcherTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "tree")
+        self.outside_path = os.path.join(self.tmp_dir.name, "outside")
+        os.makedirs(os.path.join(self.path, "a", "b"))
+        os.mkdir(self.outside_path)
+        self.watcher = InotifyWatcher(self.path)
+
+    def tearDown(self) -> None:
+        self.watcher.close()
+        self.tmp_dir.cleanup()
+
+    def _p(self, *names: str) -> str:
+        return os.path.join(self.path, *names)
+
+    def _write(self, path: str, content: str = "") -> None:
+        with open(path, "w") as f:
+            f.write(content)
+
+    def test_created_modified_deleted(self) -> None:
+        self._write(self._p("a", "f"), "x")
+        with open(self._p("a", "f"), "a") as f:
+            f.write("y")
+            f.flush()
+            f.write("z")
+        os.remove(self._p("a", "f"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [
+                ChangeEvent(ChangeKind.CREATED, self._p("a", "f"), False),
+                ChangeEvent(ChangeKind.MODIFIED, self._p("a", "f"), False),
+                ChangeEvent(ChangeKind.DELETED, self._p("a", "f"), False),
+            ],
+        )
+
+    def test_created_tree(self) -> None:
+        os.makedirs(self._p("c", "d"))
+        self._write(self._p("c", "d", "f"))
+        events = self.watcher.read(timeout=1)
+        self.assertEqual(events[0], ChangeEvent(ChangeKind.CREATED, self._p("c"), True))
+        self.assertIn(
+            ChangeEvent(ChangeKind.CREATED, self._p("c", "d", "f"), False), events
+        )
+
+        # The new directories are watched
+        self._write(self._p("c", "d", "g"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [ChangeEvent(ChangeKind.CREATED, self._p("c", "d", "g"), False)],
+        )
+
+    def test_moved(self) -> None:
+        os.rename(self._p("a"), self._p("c"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [ChangeEvent(ChangeKind.MOVED, self._p("a"), True, self._p("c"))],
+        )
+
+        # The watches of the moved directories know their new paths
+        self._write(self._p("c", "b", "f"))
+        os.rename(self._p("c", "b", "f"), self._p("c", "b", "g"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [
+                ChangeEvent(ChangeKind.CREATED, self._p("c", "b", "f"), False),
+                ChangeEvent(
+                    ChangeKind.MOVED,
+                    self._p("c", "b", "f"),
+                    False,
+                    self._p("c", "b", "g"),
+                ),
+            ],
+        )
+
+    def test_moved_out_and_in(self) -> None:
+        self._write(self._p("f"))
+        self.watcher.read(timeout=1)
+
+        os.rename(self._p("a"), os.path.join(self.outside_path, "a"))
+        os.rename(self._p("f"), os.path.join(self.outside_path, "f"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [
+                ChangeEvent(ChangeKind.DELETED, self._p("a"), True),
+                ChangeEvent(ChangeKind.DELETED, self._p("f"), False),
+            ],
+        )
+        # The directories moved out of the tree are not watched anymore
+        self._write(os.path.join(self.outside_path, "a", "b", "g"))
+        self.assertEqual(self.watcher.read(timeout=0.05), [])
+
+        os.rename(os.path.join(self.outside_path, "a"), self._p("c"))
+        os.rename(os.path.join(self.outside_path, "f"), self._p("f"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [
+                ChangeEvent(ChangeKind.CREATED, self._p("c"), True),
+                ChangeEvent(ChangeKind.CREATED, self._p("c", "b"), True),
+                ChangeEvent(ChangeKind.CREATED, self._p("c", "b", "g"), False),
+                ChangeEvent(ChangeKind.CREATED, self._p("f"), False),
+            ],
+        )
+
+    def test_deleted_tree(self) -> None:
+        shutil.rmtree(self._p("a"))
+        self.assertEqual(
+            self.watcher.read(timeout=1),
+            [
+                ChangeEvent(ChangeKind.DELETED, self._p("a", "b"), True),
+                ChangeEvent(ChangeKind.DELETED, self._p("a"), True),
+            ],
+        )
+        self.assertEqual(list(self.watcher.wd_paths.values()), [self.path])
+
+    def test_dir_attributes_ignored(self) -> None:
+        os.chmod(self._p("a"), 0o700)
+        self.assertEqual(self.watcher.read(timeout=0.05), [])
+
+    def test_read_blocking(self) -> None:
+        self._write(self._p("f"))
+        self.assertEqual(
+            self.watcher.read(), [ChangeEvent(ChangeKind.CREATED, self._p("f"), False)]
+        )
+
+    def test_read_bounded(self) -> None:
+        # Events keep coming, but every read returns after a fixed number of reads
+        with patch("fluentfs.watch.inotify.os.read", return_value=b"") as read:
+            self.assertEqual(self.watcher._read_available(), [])
+        self.assertEqual(read.call_count, _MAX_READS)
+
+        # The events which were not read yet are reported by the next read
+        for name in "abcdef":
+            self._write(self._p(name + ".txt"))
+        paths = []
+        with patch("fluentfs.watch.inotify._MAX_READS", 1), patch(
+            "fluentfs.watch.inotify._READ_SIZE", 64
+        ):
+            while len(paths) < 6:
+                events = self.watcher.read(timeout=1)
+                self.assertLessEqual(len(events), 2)
+                paths.extend(event.path for event in events)
+        self.assertEqual(paths, [self._p(name + ".txt") for name in "abcdef"])
+
+    def test_handle(self) -> None:
+        events: List[ChangeEvent] = []
+        # Events of directories that are no longer watched are dropped
+        self.watcher._handle(-1, IN_CREATE, 0, "f", events)
+        self.assertEqual(events, [])
+        with self.assertRaises(fs.FluentFsException):
+            self.watcher._handle(-1, IN_Q_OVERFLOW, 0, "", events)
+
+    def test_forget(self) -> None:
+        self.watcher._forget(-1)
+        wd = self.watcher.path_wds[self.path]
+        self.watcher.path_wds[self.path] = -1
+        self.watcher._forget(wd)
+        self.assertEqual(self.watcher.path_wds[self.path], -1)
+
+    def test_vanished_dir(self) -> None:
+        entry = MagicMock(path=self._p("vanished"), is_dir=lambda: True)
+
+        def scan(path: str, sort: bool) -> Any:
+            if path == self._p("c"):
+                return [entry], []
+            return None
+
+        with patch("fluentfs.watch.inotify.scan_dir", scan):
+            os.mkdir(self._p("c"))
+            self.assertEqual(
+                self.watcher.read(timeout=1),
+                [
+                    ChangeEvent(ChangeKind.CREATED, self._p("c"), True),
+                    ChangeEvent(ChangeKind.CREATED, self._p("vanished"), True),
+                ],
+            )
+        self.assertNotIn(self._p("vanished"), self.watcher.path_wds)
+
+    def test_close(self) -> None:
+        self.watcher.close()
+        self.watcher.close()
+        self.assertEqual(self.watcher.fd, -1)
+
+    def test_dir_watch(self) -> None:
+        with fs.Dir(self.path).watch() as watcher:
+            self.assertIsInstance(watcher, InotifyWatcher)
+
+
+@skipUnless(inotify_available(), "inotify is not available")
+class InotifyWatcherErrorTest(TestCase):
+    def test_missing(self) -> None:
+        with self.assertRaises(fs.FluentFsException):
+            InotifyWatcher(os.path.join(os.getcwd(), "missing"))
+
+    def test_init_failed(self) -> None:
+        libc = MagicMock()
+        libc.inotify_init1.return_value = -1
+        with patch("fluentfs.watch.inotify._libc", return_value=libc):
+            with self.assertRaises(fs.FluentFsException):
+                InotifyWatcher(os.getcwd())
+
+    def test_too_many_watches(self) -> None:
+        libc = MagicMock()
+        libc.inotify_init1.return_value = os.open(os.devnull, os.O_RDONLY)
+        libc.inotify_add_watch.return_value = -1
+        with patch("fluentfs.watch.inotify._libc", return_value=libc), patch(
+            "fluentfs.watch.inotify.ctypes.get_errno", return_value=errno.ENOSPC
+        ):
+            with self.assertRaises(fs.FluentFsException):
+                InotifyWatcher(os.getcwd())
+
+    def test_unlistable_root(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("fluentfs.watch.inotify.scan_dir", return_value=None):
+                watcher = InotifyWatcher(tmp_dir)
+            self.assertEqual(list(watcher.path_wds), [tmp_dir])
+            watcher.close()
+            self.assertIsNotNone(scan_dir(tmp_dir))
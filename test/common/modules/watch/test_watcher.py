@@ -0,0 +1,187 @@
+import os
+import tempfile
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+import fluentfs as fs
+from fluentfs.watch import (
+    ChangeEvent,
+    ChangeKind,
+    PollingWatcher,
+    SnapshotEntry,
+    Watcher,
+    diff_snapshots,
+    take_snapshot,
+)
+
+
+def _file(inode: int, size: int = 0, mtime_ns: int = 0) -> SnapshotEntry:
+    return SnapshotEntry(False, inode, size, mtime_ns)
+
+
+def _dir(inode: int, mtime_ns: int = 0) -> SnapshotEntry:
+    return SnapshotEntry(True, inode, 0, mtime_ns)
+
+
+def _p(*names: str) -> str:
+    return os.path.join(os.sep, "r", *names)
+
+
+class ChangeEventTest(TestCase):
+    def test_eq(self) -> None:
+        event = ChangeEvent(ChangeKind.MOVED, "a", False, "b")
+        self.assertEqual(event, ChangeEvent(ChangeKind.MOVED, "a", False, "b"))
+        self.assertNotEqual(event, ChangeEvent(ChangeKind.MOVED, "a", False, "c"))
+        self.assertNotEqual(event, "a")
+
+    def test_repr(self) -> None:
+        self.assertEqual(
+            repr(ChangeEvent(ChangeKind.CREATED, "a", False)),
+            'ChangeEvent(CREATED, "a")',
+        )
+        self.assertEqual(
+            repr(ChangeEvent(ChangeKind.MOVED, "a", True, "b")),
+            'ChangeEvent(MOVED, "a", "b")',
+        )
+
+
+class DiffSnapshotsTest(TestCase):
+    def test_created_deleted_modified(self) -> None:
+        old = {_p("a"): _file(1), _p("b"): _file(2, 5), _p("d"): _dir(3)}
+        new = {_p("b"): _file(2, 6), _p("c"): _file(4), _p("d"): _dir(3, 1)}
+        self.assertEqual(
+            diff_snapshots(old, new),
+            [
+                ChangeEvent(ChangeKind.DELETED, _p("a"), False),
+                ChangeEvent(ChangeKind.CREATED, _p("c"), False),
+                ChangeEvent(ChangeKind.MODIFIED, _p("b"), False),
+            ],
+        )
+
+    def test_kind_changed(self) -> None:
+        old = {_p("a"): _file(1)}
+        new = {_p("a"): _dir(2)}
+        self.assertEqual(
+            diff_snapshots(old, new),
+            [
+                ChangeEvent(ChangeKind.DELETED, _p("a"), False),
+                ChangeEvent(ChangeKind.CREATED, _p("a"), True),
+            ],
+        )
+
+    def test_moved(self) -> None:
+        old = {_p("a"): _file(1, 2, 3), _p("b"): _file(4, 5, 6)}
+        # b was modified while being moved, so it cannot be matched
+        new = {_p("c"): _file(1, 2, 3), _p("d"): _file(4, 5, 7)}
+        self.assertEqual(
+            diff_snapshots(old, new),
+            [
+                ChangeEvent(ChangeKind.DELETED, _p("b"), False),
+                ChangeEvent(ChangeKind.MOVED, _p("a"), False, _p("c")),
+                ChangeEvent(ChangeKind.CREATED, _p("d"), False),
+            ],
+        )
+
+    def test_moved_dir(self) -> None:
+        old = {
+            _p("d"): _dir(1),
+            _p("d", "a"): _file(2),
+            _p("d", "b"): _file(3),
+            _p("d", "c"): _file(4),
+        }
+        new = {
+            _p("e"): _dir(1, 1),
+            _p("e", "a"): _file(2),
+            # b was moved out of the directory as well
+            _p("b"): _file(3),
+            _p("e", "c"): _file(4, 1),
+        }
+        self.assertEqual(
+            diff_snapshots(old, new),
+            [
+                ChangeEvent(ChangeKind.DELETED, _p("d", "c"), False),
+                ChangeEvent(ChangeKind.MOVED, _p("d"), True, _p("e")),
+                ChangeEvent(ChangeKind.MOVED, _p("d", "b"), False, _p("b")),
+                ChangeEvent(ChangeKind.CREATED, _p("e", "c"), False),
+            ],
+        )
+
+    def test_take_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.mkdir(os.path.join(tmp_dir, "d"))
+            with open(os.path.join(tmp_dir, "d", "f"), "w") as f:
+                f.write("abc")
+            snapshot = take_snapshot(tmp_dir)
+            self.assertEqual(
+                sorted(snapshot),
+                [os.path.join(tmp_dir, "d"), os.path.join(tmp_dir, "d", "f")],
+            )
+            self.assertTrue(snapshot[os.path.join(tmp_dir, "d")].is_dir)
+            self.assertEqual(snapshot[os.path.join(tmp_dir, "d", "f")].size, 3)
+
+
+class _ListWatcher(Watcher):
+    def __init__(self, batches: List[List[ChangeEvent]]) -> None:
+        super().__init__(_p())
+        self.batches = batches
+
+    def read(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        return self.batches.pop(0)
+
+
+class WatcherTest(TestCase):
+    def test_iter(self) -> None:
+        events = [ChangeEvent(ChangeKind.CREATED, _p(str(i)), False) for i in range(3)]
+        watcher = _ListWatcher([events[:2], [], events[2:]])
+        with watcher:
+            it = iter(watcher)
+            self.assertEqual([next(it) for _ in range(3)], events)
+
+
+class PollingWatcherTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.tmp_dir.name
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_read(self) -> None:
+        with PollingWatcher(self.path, interval=0.01) as watcher:
+            self.assertEqual(watcher.read(timeout=0.05), [])
+            os.mkdir(os.path.join(self.path, "d"))
+            self.assertEqual(
+                watcher.read(timeout=0.05),
+                [ChangeEvent(ChangeKind.CREATED, os.path.join(self.path, "d"), True)],
+            )
+
+    def test_read_rate_limited(self) -> None:
+        watcher = PollingWatcher(self.path, interval=60)
+        os.mkdir(os.path.join(self.path, "d"))
+        with patch("fluentfs.watch.watcher.take_snapshot") as take_snapshot:
+            self.assertEqual(watcher.read(timeout=0), [])
+        take_snapshot.assert_not_called()
+        # The interval has passed
+        watcher.last_poll -= 60
+        self.assertEqual(len(watcher.read(timeout=0)), 1)
+        self.assertEqual(watcher.read(timeout=0), [])
+
+    def test_read_blocking(self) -> None:
+        def sleep(delay: float) -> None:
+            os.makedirs(os.path.join(self.path, "d"), exist_ok=True)
+            watcher.last_poll -= delay
+
+        watcher = PollingWatcher(self.path, interval=10)
+        with patch("fluentfs.watch.watcher.time.sleep", sleep):
+            events = watcher.read()
+        self.assertEqual(
+            events,
+            [ChangeEvent(ChangeKind.CREATED, os.path.join(self.path, "d"), True)],
+        )
+
+    def test_dir_watch_polling(self) -> None:
+        with fs.Dir(self.path).watch(polling=True) as watcher:
+            self.assertIsInstance(watcher, PollingWatcher)
+        with patch("fluentfs.filelike.dir.inotify_available", return_value=False):
+            self.assertIsInstance(fs.Dir(self.path).watch(), PollingWatcher)
@@ -0,0 +1,26 @@
+import os
+import tempfile
+from unittest import TestCase
+
+
+class TmpDirTestCase(TestCase):
+    """
+    A test case writing its files to a temporary directory, which is removed after
+    every test.
+
+    self.path is the path of the default file, which tests reading a single file
+    can write with _write(content).
+    """
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "f.txt")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _write(self, content: bytes, name: str = "f.txt") -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path